@@ -0,0 +1,182 @@
+# benchmarks/e2e_replay.py
+# End-to-end replay of the whole bill lifecycle through the real CombinedBot and cogs,
+# against the fake Discord backend (benchmarks/fake_discord.py) and a virtual clock:
+# propose (button + modal) -> debate post + thread -> vote opens after VOTE_DELAY_HOURS ->
+# vote clicks -> tally + archive after VOTE_DURATION_DAYS. Days of deadlines take seconds.
+#
+#   python -m benchmarks.e2e_replay                        # 50 bills x 100 voters
+#   python -m benchmarks.e2e_replay --bills 1000 --voters 20 --json e2e.json
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import discord
+
+os.environ.setdefault("DISCORD_TOKEN", "fake-token")
+os.environ["DASHBOARD_MODE"] = "off"
+
+import main  # noqa: E402  (reads the environment on import)
+from benchmarks.fake_discord import FakeDiscord  # noqa: E402
+from benchmarks.vote_storm import summarize  # noqa: E402
+from cogs.Governace import constants  # noqa: E402
+from cogs.Governace.clock import VirtualClock  # noqa: E402
+from cogs.Governace.cog import VOTE_DELAY_HOURS, VOTE_DURATION_DAYS  # noqa: E402
+from cogs.Governace.ui_components import ProposeButtonView, VOTE_CHOICES  # noqa: E402
+
+
+async def wait_for(predicate, timeout: float = 60.0, what: str = "condition"):
+    """Poll until predicate() is true (background tasks and gateway events settle asynchronously)."""
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"Timed out waiting for {what}")
+        await asyncio.sleep(0.01)
+
+
+async def run(bills: int, voters: int, concurrency: int, rate_limit_scale: float, seed: int) -> Dict:
+    rng = random.Random(seed)
+    tmpdir = tempfile.TemporaryDirectory()
+    backend = FakeDiscord(rate_limit_scale=rate_limit_scale)
+    # The guild set up in constants.py, so the legacy-guild adoption path configures it
+    backend.create_guild(
+        channels={
+            "bill-proposals": constants.PROPOSALS_CHANNEL_ID,
+            "bill-debate": constants.DEBATE_CHANNEL_ID,
+            "voting-booth": constants.VOTING_CHANNEL_ID,
+            "press-briefing": constants.ANNOUNCEMENTS_CHANNEL_ID,
+            "past-legislation": constants.PAST_LEGISLATION_CHANNEL_ID,
+            "statutes-and-acts": constants.STATUTES_AND_ACTS_CHANNEL_ID,
+        },
+        roles={"citizen": constants.PROPOSER_ROLE_ID, "moderator": constants.MODERATOR_ROLE_ID},
+        member_count=voters,
+    )
+
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.members = True
+    bot = main.CombinedBot(command_prefix="!", intents=intents, shard_count=1)
+    bot.clock = clock = VirtualClock()
+    bot.governance_db_path = os.path.join(tmpdir.name, "governance.db")
+    backend.attach(bot)
+
+    limit = asyncio.Semaphore(concurrency)
+    phases: Dict[str, Dict] = {}
+    try:
+        await bot.login("fake-token")  # runs setup_hook: loads every cog
+        backend.connect(bot)  # GUILD_CREATE + READY: Governance starts its scheduler
+        governance = bot.get_cog("Governance")
+        await wait_for(lambda: governance.scheduler.running, what="the scheduler to start")
+        governance.live_tally.interval = 0.05
+        # Replayed voters click far faster than people; measure the pipeline, not the rate limiter
+        governance.rate_limiter.users = governance.rate_limiter.guilds = None
+
+        proposals_channel = bot.get_channel(constants.PROPOSALS_CHANNEL_ID)
+        button_message = await proposals_channel.send(view=ProposeButtonView(bot, governance.db))
+
+        # --- Propose: click the button, fill the modal ---
+        latencies: List[float] = []
+
+        async def propose(i: int):
+            user_id = 5_000_000 + i
+            async with limit:
+                click = await backend.click(button_message.id, "propose_bill_button", user_id,
+                                            roles=[constants.PROPOSER_ROLE_ID]).wait()
+                submit = await backend.submit_modal(click, [f"Replay bill {i}", f"Text of replay bill {i}. " * 10],
+                                                    user_id, roles=[constants.PROPOSER_ROLE_ID]).wait()
+                latencies.extend([click.latency, submit.latency])
+
+        start = time.perf_counter()
+        await asyncio.gather(*(propose(i) for i in range(bills)))
+        # Each ProposalCreated event reaches the debate poster, which posts the debate and schedules both deadlines
+        await wait_for(lambda: len(governance.scheduler) == 2 * bills, what="debates to be scheduled")
+        phases["propose"] = summarize(latencies, time.perf_counter() - start)
+
+        # --- Fast-forward to the vote start ---
+        start = time.perf_counter()
+        await clock.advance(VOTE_DELAY_HOURS * 3600 + 1)
+        await wait_for(lambda: len(governance.open_votes) == bills, what="votes to open")
+        phases["open_votes"] = {"ops": bills, "wall_seconds": round(time.perf_counter() - start, 3)}
+
+        # --- Vote: every voter clicks on every bill ---
+        vote_messages = {}
+        for bill_id in governance.open_votes:
+            vote_messages[bill_id] = (await governance.db.get_proposal_by_id(bill_id))["vote_message_id"]
+        expected = {bill_id: {c: 0 for c in VOTE_CHOICES} for bill_id in vote_messages}
+        latencies = []
+
+        async def voter(user_id: int):
+            for bill_id in rng.sample(list(vote_messages), len(vote_messages)):
+                choice = rng.choice(VOTE_CHOICES)
+                expected[bill_id][choice] += 1
+                async with limit:
+                    click = await backend.click(vote_messages[bill_id], f"vote:{bill_id}:{choice}", user_id).wait()
+                latencies.append(click.latency)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(voter(6_000_000 + u) for u in range(voters)))
+        phases["vote"] = summarize(latencies, time.perf_counter() - start)
+
+        # --- Fast-forward to the vote end: tally and archive ---
+        start = time.perf_counter()
+        await clock.advance(VOTE_DURATION_DAYS * 86400 + 1)
+        await wait_for(lambda: not governance.open_votes and len(governance.scheduler) == 0, what="votes to close")
+        phases["tally_archive"] = {"ops": bills, "wall_seconds": round(time.perf_counter() - start, 3)}
+
+        mismatches = []
+        for bill_id, counts in expected.items():
+            prop = await governance.db.get_proposal_by_id(bill_id)
+            stored = {"yes": prop["yes_count"], "no": prop["no_count"], "abstain": prop["abstain_count"]}
+            if stored != counts or prop["status"] not in ("passed", "failed"):
+                mismatches.append(bill_id)
+        if mismatches:
+            raise AssertionError(f"Bills with wrong final state: {mismatches}")
+
+        await bot.remove_cog("Governance")  # stops the scheduler and live tally, then closes the DB
+    finally:
+        await bot.close()
+        tmpdir.cleanup()
+
+    return {
+        "config": {"bills": bills, "voters": voters, "concurrency": concurrency,
+                   "rate_limit_scale": rate_limit_scale, "seed": seed},
+        "phases": phases,
+        "virtual_days": round((clock.now() - clock.started_at).total_seconds() / 86400, 2),
+        "http_calls": dict(backend.calls.most_common()),
+        "rate_limited": dict(backend.rate_limited.most_common()),
+    }
+
+
+def main_cli(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end governance replay against a fake Discord backend.")
+    parser.add_argument("--bills", type=int, default=50)
+    parser.add_argument("--voters", type=int, default=100, help="members voting on every bill")
+    parser.add_argument("--concurrency", type=int, default=200, help="interactions in flight at once")
+    parser.add_argument("--rate-limit-scale", type=float, default=0.001,
+                        help="fraction of Discord's real rate-limit windows (1.0 = real time)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args.bills, args.voters, args.concurrency, args.rate_limit_scale, args.seed))
+    print(f"\nReplayed {args.bills} bills x {args.voters} voters ({report['virtual_days']} virtual days)")
+    for phase, r in report["phases"].items():
+        print(f"  {phase:<14}{json.dumps(r)}")
+    print("HTTP calls by route:")
+    for route, count in report["http_calls"].items():
+        limited = report["rate_limited"].get(route, 0)
+        print(f"  {count:>8}  {route}" + (f"  ({limited} rate limited)" if limited else ""))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
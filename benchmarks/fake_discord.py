@@ -0,0 +1,351 @@
+# benchmarks/fake_discord.py
+# In-process stand-in for Discord's REST API and gateway, for end-to-end load tests.
+#
+# attach(bot) swaps the bot's HTTPClient (and the interaction webhook adapter) for ones
+# answered from memory. Channel sends, message edits, thread creation and interaction
+# responses are stored here; messages the bot sends are fed back through the real
+# discord.py ConnectionState as MESSAGE_CREATE events, and simulated members click
+# buttons / submit modals as INTERACTION_CREATE events. Per-route rate limits are
+# enforced with Discord's header semantics, so load tests see realistic 429 waits.
+import asyncio
+import itertools
+import json
+import re
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import discord
+from discord.http import HTTPClient, Route
+from discord.webhook.async_ import AsyncWebhookAdapter, async_context
+
+# (limit, window seconds) per route, roughly Discord's published per-channel limits
+ROUTE_LIMITS = {
+    ("POST", "/channels/{channel_id}/messages"): (5, 5.0),
+    ("PATCH", "/channels/{channel_id}/messages/{message_id}"): (5, 5.0),
+    ("POST", "/channels/{channel_id}/messages/{message_id}/threads"): (10, 10.0),
+}
+DEFAULT_LIMIT = (50, 1.0)
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+def _iso(dt: Optional[datetime] = None) -> str:
+    return (dt or datetime.now(timezone.utc)).isoformat()
+
+
+class FakeInteraction:
+    """One simulated interaction and the responses the bot gave to it."""
+
+    def __init__(self, interaction_id: int, token: str, payload: Dict[str, Any]):
+        self.id = interaction_id
+        self.token = token
+        self.payload = payload
+        self.created = time.perf_counter()
+        self.responses: List[Dict[str, Any]] = []
+        self.modal: Optional[Dict[str, Any]] = None
+        self.answered = asyncio.get_running_loop().create_future()
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Seconds from dispatch to the first real answer (not counting a defer)."""
+        return self.answered.result() - self.created if self.answered.done() else None
+
+    def _respond(self, kind: str, data: Dict[str, Any], final: bool):
+        self.responses.append({"kind": kind, **data})
+        if final and not self.answered.done():
+            self.answered.set_result(time.perf_counter())
+
+    async def wait(self, timeout: float = 30.0) -> "FakeInteraction":
+        await asyncio.wait_for(asyncio.shield(self.answered), timeout)
+        return self
+
+    @property
+    def last_content(self) -> Optional[str]:
+        for response in reversed(self.responses):
+            if response.get("content"):
+                return response["content"]
+        return None
+
+
+class FakeDiscord:
+    """The fake backend: guilds, channels and messages, plus per-route call and rate-limit counters.
+
+    rate_limit_scale shrinks every rate-limit window (1.0 = Discord's real windows).
+    """
+
+    def __init__(self, rate_limit_scale: float = 0.001):
+        self.rate_limit_scale = rate_limit_scale
+        self._ids = itertools.count(1)
+        self.user = self._user(self._snowflake(), "FakeBot", bot=True)
+        self.application_id = int(self.user["id"])
+        self.guilds: Dict[int, Dict[str, Any]] = {}
+        self.channels: Dict[int, Dict[str, Any]] = {}
+        self.messages: Dict[int, Dict[str, Any]] = {}
+        self.interactions: Dict[str, FakeInteraction] = {}
+        self.calls: Counter = Counter()  # "METHOD /path/template" -> requests
+        self.rate_limited: Counter = Counter()  # "METHOD /path/template" -> simulated 429s
+        self.last_headers: Dict[str, Dict[str, str]] = {}
+        self._buckets: Dict[Tuple[str, str], List[float]] = {}  # (route key, major id) -> [remaining, reset_at]
+        self._state = None
+
+    # ---------- Wiring ----------
+    def attach(self, bot: discord.Client):
+        """Point a (not yet logged in) bot at this backend."""
+        http = FakeHTTPClient(self, bot.http.loop)
+        bot.http = http
+        bot._connection.http = http
+        self._state = bot._connection
+        # Interaction responses and followups go through the webhook adapter, not bot.http
+        async_context.set(FakeWebhookAdapter(self))
+
+    def _snowflake(self) -> int:
+        return discord.utils.time_snowflake(datetime.now(timezone.utc)) + next(self._ids)
+
+    # ---------- Payload builders ----------
+    def _user(self, user_id: int, name: str, bot: bool = False) -> Dict[str, Any]:
+        return {"id": str(user_id), "username": name, "global_name": name, "discriminator": "0",
+                "avatar": None, "bot": bot}
+
+    def _member(self, user_id: int, roles: Iterable[int] = ()) -> Dict[str, Any]:
+        return {"user": self._user(user_id, f"member{user_id}"), "roles": [str(r) for r in roles],
+                "joined_at": _iso(), "deaf": False, "mute": False, "flags": 0, "permissions": "2147483647"}
+
+    def _channel(self, channel_id: int, guild_id: int, name: str, position: int) -> Dict[str, Any]:
+        return {"id": str(channel_id), "type": 0, "guild_id": str(guild_id), "name": name, "position": position,
+                "permission_overwrites": [], "nsfw": False, "parent_id": None, "rate_limit_per_user": 0,
+                "topic": None, "last_message_id": None}
+
+    def create_guild(self, guild_id: Optional[int] = None, channels: Optional[Dict[str, int]] = None,
+                     roles: Optional[Dict[str, int]] = None, member_count: int = 1000) -> Dict[str, Any]:
+        """Create a guild with the given text channels (name -> id) and roles (name -> id)."""
+        guild_id = guild_id or self._snowflake()
+        channel_payloads = []
+        for position, (name, channel_id) in enumerate((channels or {"general": self._snowflake()}).items()):
+            payload = self._channel(channel_id, guild_id, name, position)
+            self.channels[channel_id] = payload
+            channel_payloads.append(payload)
+        role_payloads = [{"id": str(guild_id), "name": "@everyone", "permissions": "0", "position": 0}]
+        for position, (name, role_id) in enumerate((roles or {}).items(), start=1):
+            role_payloads.append({"id": str(role_id), "name": name, "permissions": "0", "position": position})
+        for role in role_payloads:
+            role.update(color=0, hoist=False, managed=False, mentionable=False, flags=0)
+        guild = {
+            "id": str(guild_id), "name": f"Fake guild {guild_id}", "icon": None, "owner_id": self.user["id"],
+            "roles": role_payloads, "emojis": [], "stickers": [], "features": [], "channels": channel_payloads,
+            "threads": [], "members": [self._member(self.application_id)], "voice_states": [], "presences": [],
+            "member_count": member_count, "large": member_count > 250, "unavailable": False,
+            "preferred_locale": "en-US", "verification_level": 0, "default_message_notifications": 0,
+            "explicit_content_filter": 0, "mfa_level": 0, "nsfw_level": 0, "premium_tier": 0,
+            "system_channel_flags": 0, "joined_at": _iso(),
+        }
+        self.guilds[guild_id] = guild
+        return guild
+
+    # ---------- Gateway ----------
+    def connect(self, bot: discord.Client):
+        """Deliver GUILD_CREATE for every guild, then READY (what the gateway does on connect)."""
+        for guild in self.guilds.values():
+            self._state._add_guild_from_data(guild)
+        bot._ready.set()
+        bot.dispatch("ready")
+
+    def _emit(self, handler: str, payload: Dict[str, Any]):
+        # Gateway events arrive after the REST response, on a later loop iteration
+        asyncio.get_running_loop().call_soon(getattr(self._state, handler), payload)
+
+    def click(self, message_id: int, custom_id: str, user_id: int, roles: Iterable[int] = ()) -> FakeInteraction:
+        """A member presses a button on a message."""
+        message = self.messages[message_id]
+        return self._interaction(3, message["channel_id"], user_id, roles,
+                                 {"custom_id": custom_id, "component_type": 2}, message=message)
+
+    def submit_modal(self, shown_by: FakeInteraction, values: Iterable[str], user_id: int,
+                     roles: Iterable[int] = ()) -> FakeInteraction:
+        """Submit the modal the bot answered `shown_by` with; values fill its text inputs in order."""
+        values = list(values)
+
+        def fill(components):
+            filled = []
+            for component in components:
+                if component.get("type") == 4:
+                    filled.append({"type": 4, "custom_id": component["custom_id"], "value": values.pop(0)})
+                elif "components" in component:
+                    filled.append({"type": component["type"], "components": fill(component["components"])})
+                elif "component" in component:
+                    filled.append({"type": component["type"], "component": fill([component["component"]])[0]})
+            return filled
+
+        modal = shown_by.modal
+        data = {"custom_id": modal["custom_id"], "components": fill(modal["components"])}
+        return self._interaction(5, shown_by.payload["channel_id"], user_id, roles, data)
+
+    def _interaction(self, kind: int, channel_id: str, user_id: int, roles: Iterable[int], data: Dict[str, Any],
+                     message: Optional[Dict[str, Any]] = None) -> FakeInteraction:
+        channel = self.channels[int(channel_id)]
+        interaction_id = self._snowflake()
+        token = f"itoken-{interaction_id}"
+        payload = {
+            "id": str(interaction_id), "application_id": str(self.application_id), "type": kind, "token": token,
+            "version": 1, "guild_id": channel["guild_id"], "channel_id": channel["id"], "channel": channel,
+            "member": self._member(user_id, roles), "data": data, "locale": "en-US", "guild_locale": "en-US",
+            "app_permissions": "2147483647", "entitlements": [], "authorizing_integration_owners": {}, "context": 0,
+            "attachment_size_limit": 10 * 1024 * 1024,
+        }
+        if message is not None:
+            payload["message"] = message
+        interaction = FakeInteraction(interaction_id, token, payload)
+        self.interactions[token] = interaction
+        self._state.parse_interaction_create(payload)
+        return interaction
+
+    # ---------- REST ----------
+    async def _rate_limit(self, key: str, major: str) -> Dict[str, str]:
+        """Take one request from the route's bucket, waiting out the window (a 429) if it is empty."""
+        method, path = key.split(" ", 1)
+        limit, window = ROUTE_LIMITS.get((method, path), DEFAULT_LIMIT)
+        window *= self.rate_limit_scale
+        loop = asyncio.get_running_loop()
+        bucket = self._buckets.setdefault((key, major), [limit, loop.time() + window])
+        while True:
+            now = loop.time()
+            if now >= bucket[1]:
+                bucket[0], bucket[1] = limit, now + window
+            if bucket[0] > 0:
+                bucket[0] -= 1
+                break
+            self.rate_limited[key] += 1
+            await asyncio.sleep(bucket[1] - now)
+        headers = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(int(bucket[0])),
+            "X-RateLimit-Reset-After": f"{max(bucket[1] - loop.time(), 0):.3f}",
+            "X-RateLimit-Bucket": f"{key}:{major}",
+        }
+        self.last_headers[key] = headers
+        return headers
+
+    async def handle(self, method: str, path: str, url: str, payload: Optional[Dict[str, Any]]) -> Any:
+        key = f"{method} {path}"
+        self.calls[key] += 1
+        pattern = "^" + _PATH_PARAM.sub(r"(?P<\1>[^/]+)", re.escape(path).replace(r"\{", "{").replace(r"\}", "}")) + "$"
+        params = re.match(pattern, url[len(Route.BASE):]).groupdict()
+        major = params.get("channel_id") or params.get("guild_id") or params.get("webhook_id") or ""
+        await self._rate_limit(key, major)
+        handler = getattr(self, f"_{method.lower()}_{_PATH_PARAM.sub(lambda m: m.group(1), path).strip('/').replace('/', '_').replace('@', '')}", None)
+        if handler is None:
+            return {}
+        return handler(payload or {}, **params)
+
+    def _message(self, channel_id: int, payload: Dict[str, Any], author: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        channel = self.channels[int(channel_id)]
+        message = {
+            "id": str(self._snowflake()), "channel_id": str(channel_id), "guild_id": channel.get("guild_id"),
+            "author": author or self.user, "content": payload.get("content") or "", "timestamp": _iso(),
+            "edited_timestamp": None, "tts": False, "mention_everyone": False, "mentions": [], "mention_roles": [],
+            "attachments": [], "embeds": payload.get("embeds") or [], "pinned": False, "type": 0,
+            "components": payload.get("components") or [], "flags": payload.get("flags") or 0,
+        }
+        self.messages[int(message["id"])] = message
+        return message
+
+    # Handler names: _<method>_<path with parameter names>
+    def _get_users_me(self, payload):
+        return self.user
+
+    def _get_oauth2_applications_me(self, payload):
+        return {"id": str(self.application_id), "name": "FakeBot", "icon": None, "description": "",
+                "bot_public": True, "bot_require_code_grant": False, "verify_key": "0" * 64, "flags": 0,
+                "owner": self._user(self._snowflake(), "owner"), "team": None}
+
+    def _put_applications_application_id_commands(self, payload, application_id):
+        return []
+
+    def _post_channels_channel_id_messages(self, payload, channel_id):
+        message = self._message(channel_id, payload)
+        self._emit("parse_message_create", message)
+        return message
+
+    def _get_channels_channel_id_messages_message_id(self, payload, channel_id, message_id):
+        return self.messages.get(int(message_id), {})
+
+    def _patch_channels_channel_id_messages_message_id(self, payload, channel_id, message_id):
+        message = self.messages[int(message_id)]
+        for field in ("content", "embeds", "components", "flags"):
+            if field in payload:
+                message[field] = payload[field]
+        message["edited_timestamp"] = _iso()
+        return message
+
+    def _delete_channels_channel_id_messages_message_id(self, payload, channel_id, message_id):
+        self.messages.pop(int(message_id), None)
+
+    def _post_channels_channel_id_messages_message_id_threads(self, payload, channel_id, message_id):
+        parent = self.channels[int(channel_id)]
+        thread = {
+            "id": message_id, "type": 11, "guild_id": parent["guild_id"], "parent_id": parent["id"],
+            "owner_id": self.user["id"], "name": payload.get("name", "thread"), "rate_limit_per_user": 0,
+            "message_count": 0, "member_count": 1, "last_message_id": None, "flags": 0,
+            "thread_metadata": {"archived": False, "locked": False, "archive_timestamp": _iso(),
+                                "auto_archive_duration": payload.get("auto_archive_duration", 1440)},
+        }
+        self.channels[int(message_id)] = thread
+        self._emit("parse_thread_create", thread)
+        return thread
+
+    # Interaction responses (through the webhook adapter)
+    def _post_interactions_webhook_id_webhook_token_callback(self, payload, webhook_id, webhook_token):
+        interaction = self.interactions[webhook_token]
+        kind = payload.get("type")
+        data = payload.get("data") or {}
+        if kind == 9:  # modal
+            interaction.modal = data
+        # 5/6 are deferrals; everything else answers the user
+        interaction._respond(f"callback:{kind}", data, final=kind not in (5, 6))
+        return {"interaction": {"id": str(interaction.id), "type": interaction.payload["type"]}}
+
+    def _post_webhooks_webhook_id_webhook_token(self, payload, webhook_id, webhook_token):
+        interaction = self.interactions[webhook_token]
+        message = self._message(interaction.payload["channel_id"], payload, author=self.user)
+        interaction._respond("followup", payload, final=True)
+        return message
+
+    def _patch_webhooks_webhook_id_webhook_token_messages_message_id(self, payload, webhook_id, webhook_token, message_id):
+        interaction = self.interactions[webhook_token]
+        interaction._respond("edit_original", payload, final=True)
+        return self._message(interaction.payload["channel_id"], payload)
+
+
+class FakeHTTPClient(HTTPClient):
+    """discord.py's HTTPClient with request() answered by a FakeDiscord."""
+
+    def __init__(self, backend: FakeDiscord, loop):
+        super().__init__(loop)
+        self.backend = backend
+
+    async def request(self, route: Route, *, files=None, form=None, **kwargs) -> Any:
+        payload = kwargs.get("json")
+        if form:
+            payload = next((json.loads(part["value"]) for part in form if part.get("name") == "payload_json"), None)
+        return await self.backend.handle(route.method, route.path, route.url, payload)
+
+    async def static_login(self, token: str):
+        self.token = token
+        return await self.request(Route("GET", "/users/@me"))
+
+    async def close(self):
+        pass
+
+
+class FakeWebhookAdapter(AsyncWebhookAdapter):
+    """Interaction callbacks and followups, answered by a FakeDiscord."""
+
+    def __init__(self, backend: FakeDiscord):
+        super().__init__()
+        self.backend = backend
+
+    async def request(self, route: Route, session=None, *, payload=None, multipart=None, **kwargs) -> Any:
+        if multipart:
+            payload = next((json.loads(part["value"]) for part in multipart if part.get("name") == "payload_json"), None)
+        return await self.backend.handle(route.method, route.path, route.url, payload)
@@ -0,0 +1,109 @@
+# benchmarks/fakes.py
+# Minimal stand-ins for the discord.py objects the governance code touches,
+# so the real handlers can run without a Discord connection.
+import itertools
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+_ids = itertools.count(10_000)
+
+
+class FakeMessage:
+    def __init__(self, channel: "FakeChannel", embed=None, view=None, content: Optional[str] = None):
+        self.id = next(_ids)
+        self.channel = channel
+        self.embed = embed
+        self.view = view
+        self.content = content
+
+    async def edit(self, embed=None, view=None, **kwargs):
+        self.embed = embed or self.embed
+        self.view = view or self.view
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int, member_count: int = 1000):
+        self.id = guild_id
+        self.member_count = member_count
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int, guild: FakeGuild):
+        self.id = channel_id
+        self.guild = guild
+        self.mention = f"<#{channel_id}>"
+        self.sent: List[FakeMessage] = []
+
+    async def send(self, content: Optional[str] = None, embed=None, view=None, **kwargs) -> FakeMessage:
+        message = FakeMessage(self, embed=embed, view=view, content=content)
+        self.sent.append(message)
+        return message
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        return FakeMessage(self)
+
+
+class FakeResponse:
+    def __init__(self):
+        self.deferred = False
+        self.messages: List[Dict[str, Any]] = []
+
+    async def defer(self, ephemeral: bool = False, **kwargs):
+        self.deferred = True
+
+    async def send_message(self, content: Optional[str] = None, **kwargs):
+        self.messages.append({"content": content, **kwargs})
+
+    async def edit_message(self, **kwargs):
+        self.messages.append(kwargs)
+
+    async def send_modal(self, modal):
+        self.messages.append({"modal": modal})
+
+
+class FakeFollowup:
+    def __init__(self):
+        self.messages: List[Dict[str, Any]] = []
+
+    async def send(self, content: Optional[str] = None, **kwargs):
+        self.messages.append({"content": content, **kwargs})
+
+
+class FakeUser:
+    def __init__(self, user_id: int, roles: Optional[list] = None):
+        self.id = user_id
+        self.display_name = f"user{user_id}"
+        self.display_avatar = SimpleNamespace(url=f"https://cdn.example/avatars/{user_id}.png")
+        self.roles = roles or []
+        self.mention = f"<@{user_id}>"
+
+
+class FakeInteraction:
+    def __init__(self, client: "FakeBot", user: FakeUser, guild: FakeGuild, data: Optional[Dict[str, Any]] = None):
+        self.client = client
+        self.user = user
+        self.guild = guild
+        self.guild_id = guild.id
+        self.data = data or {}
+        self.response = FakeResponse()
+        self.followup = FakeFollowup()
+
+
+class FakeBot:
+    """Enough of commands.Bot for the Governance cog: cogs, channels and a user."""
+
+    def __init__(self):
+        self.user = FakeUser(1)
+        self.cogs: Dict[str, Any] = {}
+        self.channels: Dict[int, FakeChannel] = {}
+
+    def add_channel(self, guild: FakeGuild) -> FakeChannel:
+        channel = FakeChannel(next(_ids), guild)
+        self.channels[channel.id] = channel
+        return channel
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.channels.get(channel_id)
+
+    def get_cog(self, name: str):
+        return self.cogs.get(name)
@@ -0,0 +1,221 @@
+# benchmarks/vote_storm.py
+# Offline vote-storm benchmark for the governance pipeline. No Discord connection needed:
+# the real Governance cog, ProposalForm and vote handler run against fakes (benchmarks/fakes.py)
+# and a throwaway SQLite database.
+#
+#   python -m benchmarks.vote_storm                              # 200 voters x 10 bills
+#   python -m benchmarks.vote_storm --voters 1000 --bills 20
+#   python -m benchmarks.vote_storm --save-baseline benchmarks/baseline.json
+#   python -m benchmarks.vote_storm --baseline benchmarks/baseline.json   # exit 1 on regression
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.fakes import FakeBot, FakeGuild, FakeInteraction, FakeUser
+from cogs.Governace.cog import Governance
+from cogs.Governace.db_manager import VOTE_RECORDED
+from cogs.Governace.ui_components import ProposalForm, RETRACT, VOTE_CHOICES, handle_vote
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def summarize(latencies: List[float], wall_seconds: float) -> Dict[str, float]:
+    """Throughput plus latency percentiles (ms) of one phase."""
+    ordered = sorted(latencies)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000 if ordered else 0.0
+
+    return {
+        "ops": len(ordered),
+        "ops_per_sec": round(len(ordered) / wall_seconds, 1) if wall_seconds else 0.0,
+        "p50_ms": round(pct(50), 3),
+        "p95_ms": round(pct(95), 3),
+        "p99_ms": round(pct(99), 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+
+
+async def timed(latencies: List[float], coro):
+    start = time.perf_counter()
+    result = await coro
+    latencies.append(time.perf_counter() - start)
+    return result
+
+
+async def run(voters: int, bills: int, duplicate_rate: float, seed: int) -> Dict:
+    rng = random.Random(seed)
+    tmpdir = tempfile.TemporaryDirectory()
+    bot = FakeBot()
+    guild = FakeGuild(42, member_count=voters)
+    governance = Governance(bot, db_path=os.path.join(tmpdir.name, "governance.db"))
+    bot.cogs["Governance"] = governance
+    results = {}
+    try:
+        await governance.db.initialize()
+        await governance.guild_configs.update(
+            guild.id,
+            proposals_channel_id=bot.add_channel(guild).id,
+            voting_channel_id=bot.add_channel(guild).id,
+            past_legislation_channel_id=bot.add_channel(guild).id,
+        )
+
+        # --- Proposal insert path (ProposalForm.on_submit) ---
+        latencies: List[float] = []
+
+        async def propose(i: int):
+            form = ProposalForm(bot, governance.db)
+            # What discord.py does when the modal is submitted
+            form.title_input._refresh_state(None, {"value": f"Benchmark bill {i}"})
+            form.text_input._refresh_state(None, {"value": f"Text of benchmark bill {i}. " * 20})
+            await timed(latencies, form.on_submit(FakeInteraction(bot, FakeUser(100 + i), guild)))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(propose(i) for i in range(bills)))
+        results["propose"] = summarize(latencies, time.perf_counter() - start)
+
+        # "Bill #<id>: <title>" embeds posted by the form
+        proposals_channel = bot.get_channel(governance.guild_configs.get(guild.id)["proposals_channel_id"])
+        bill_ids = sorted(int(m.embed.title.split(":")[0].split("#")[1]) for m in proposals_channel.sent)
+        for bill_id in bill_ids:
+            await governance._post_vote_message(bill_id)
+
+        # --- Vote storm through the button handler, with live-tally style reads alongside ---
+        expected = {bill_id: {c: 0 for c in VOTE_CHOICES} for bill_id in bill_ids}
+        vote_latencies: List[float] = []
+        read_latencies: List[float] = []
+        storm_done = asyncio.Event()
+
+        async def voter(user_id: int):
+            for bill_id in rng.sample(bill_ids, len(bill_ids)):
+                choice = rng.choice(VOTE_CHOICES)
+                expected[bill_id][choice] += 1
+                await timed(vote_latencies, handle_vote(FakeInteraction(bot, FakeUser(user_id), guild), bill_id, choice))
+                if rng.random() < duplicate_rate:
+                    # Second click: a repeat, a change of vote or a retraction
+                    second = rng.choice(VOTE_CHOICES + (RETRACT,))
+                    expected[bill_id][choice] -= 1
+                    if second != RETRACT:
+                        expected[bill_id][second] += 1
+                    await timed(vote_latencies, handle_vote(FakeInteraction(bot, FakeUser(user_id), guild), bill_id, second))
+
+        async def reader():
+            while not storm_done.is_set():
+                await timed(read_latencies, governance.db.get_vote_counts(rng.choice(bill_ids)))
+                await asyncio.sleep(0.001)
+
+        reader_task = asyncio.create_task(reader())
+        start = time.perf_counter()
+        await asyncio.gather(*(voter(1_000_000 + u) for u in range(voters)))
+        wall = time.perf_counter() - start
+        storm_done.set()
+        await reader_task
+        results["vote_click"] = summarize(vote_latencies, wall)
+        results["get_vote_counts"] = summarize(read_latencies, wall)
+
+        # --- DBManager.record_vote directly (no queue), a second wave of voters ---
+        latencies = []
+
+        async def direct_voter(user_id: int):
+            for bill_id in bill_ids:
+                choice = rng.choice(VOTE_CHOICES)
+                outcome, _ = await timed(latencies, governance.db.record_vote(user_id, bill_id, choice))
+                if outcome == VOTE_RECORDED:
+                    expected[bill_id][choice] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(direct_voter(2_000_000 + u) for u in range(voters)))
+        results["record_vote"] = summarize(latencies, time.perf_counter() - start)
+
+        # --- Closing the votes (_tally_votes_and_archive) ---
+        latencies = []
+        start = time.perf_counter()
+        for bill_id in bill_ids:
+            await timed(latencies, governance._tally_votes_and_archive(bill_id))
+        results["tally_archive"] = summarize(latencies, time.perf_counter() - start)
+
+        # The numbers are only meaningful if nothing was lost or double counted
+        mismatches = []
+        for bill_id in bill_ids:
+            counts = await governance.db.get_vote_counts(bill_id)
+            if {c: counts[c] for c in VOTE_CHOICES} != expected[bill_id]:
+                mismatches.append(bill_id)
+        if mismatches:
+            raise AssertionError(f"Vote counts do not match the votes cast for bills {mismatches}")
+    finally:
+        await governance.db.close()
+        tmpdir.cleanup()
+
+    return {
+        "config": {"voters": voters, "bills": bills, "duplicate_rate": duplicate_rate, "seed": seed},
+        "results": results,
+    }
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regressions against a baseline: lower throughput or higher p95/p99 beyond `tolerance`."""
+    regressions = []
+    for op, current in report["results"].items():
+        base = baseline.get("results", {}).get(op)
+        if base is None:
+            continue
+        if base["ops_per_sec"] and current["ops_per_sec"] < base["ops_per_sec"] * (1 - tolerance):
+            regressions.append(f"{op}: {current['ops_per_sec']} ops/s vs baseline {base['ops_per_sec']}")
+        for key in ("p95_ms", "p99_ms"):
+            if base[key] and current[key] > base[key] * (1 + tolerance):
+                regressions.append(f"{op}: {key} {current[key]} vs baseline {base[key]}")
+    return regressions
+
+
+def print_report(report: Dict):
+    config = report["config"]
+    print(f"Vote storm: {config['voters']} voters x {config['bills']} bills (duplicate rate {config['duplicate_rate']})")
+    print(f"{'operation':<16}{'ops':>8}{'ops/s':>11}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for op, r in report["results"].items():
+        print(f"{op:<16}{r['ops']:>8}{r['ops_per_sec']:>11}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}{r['max_ms']:>10}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline vote-storm benchmark for the governance pipeline.")
+    parser.add_argument("--voters", type=int, default=200, help="concurrent voters (each votes on every bill)")
+    parser.add_argument("--bills", type=int, default=10, help="bills open for voting at the same time")
+    parser.add_argument("--duplicate-rate", type=float, default=0.1, help="share of clicks followed by a second click")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", nargs="?", const=DEFAULT_BASELINE, help="compare against a saved report")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, help="save this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args.voters, args.bills, args.duplicate_rate, args.seed))
+    print_report(report)
+
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"Report written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("config") != report["config"]:
+            print("Warning: baseline was recorded with a different configuration.")
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print("Regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,12 @@
 from discord.ext import commands
 from discord import app_commands, Interaction
+import discord
 import asyncio
+from typing import Literal, Optional
+
+# commands.is_owner() only guards prefix commands; app commands need an app check
+owner_only = app_commands.check(lambda interaction: interaction.client.is_owner(interaction.user))
+
 
 class Developer(commands.Cog):
     def __init__(self, bot):
@@ -24,6 +30,43 @@ class Developer(commands.Cog):
         print("\n\nBot is shutting down by owner command.\n")
         await self.bot.close()
 
+    @dev_group.command(name="dbstats", description="Governance DB profiler: top queries, or turn profiling on/off")
+    @owner_only
+    async def dbstats(self, interaction: Interaction, action: Literal["show", "on", "off", "reset"] = "show",
+                      sort: Literal["total_ms", "max_ms", "calls"] = "total_ms", slow_ms: Optional[float] = None):
+        governance = self.bot.get_cog("Governance")
+        if governance is None:
+            return await interaction.response.send_message("Governance is not loaded.", ephemeral=True)
+        db = governance.db
+
+        if action == "on":
+            profiler = db.enable_profiling(slow_ms if slow_ms is not None else (db.profiler.slow_ms if db.profiler else 50.0))
+            return await interaction.response.send_message(f"DB profiling on (slow query log at {profiler.slow_ms:g} ms).", ephemeral=True)
+        if action == "off":
+            db.disable_profiling()
+            return await interaction.response.send_message("DB profiling off.", ephemeral=True)
+        if db.profiler is None:
+            return await interaction.response.send_message("DB profiling is off. Use `/dev dbstats action:on`.", ephemeral=True)
+        if action == "reset":
+            db.profiler.reset()
+            return await interaction.response.send_message("DB profiler stats cleared.", ephemeral=True)
+
+        top = db.profiler.top(10, key=sort)
+        embed = discord.Embed(title=f"Top queries by {sort}", color=discord.Color.dark_grey())
+        embed.set_footer(text=f"{len(db.profiler.stats)} distinct statements | slow log at {db.profiler.slow_ms:g} ms")
+        for i, stat in enumerate(top, start=1):
+            value = (f"{stat['calls']} calls | total {stat['total_ms']:.1f} ms | avg {stat['avg_ms']:.2f} ms | max {stat['max_ms']:.1f} ms\n"
+                     f"```sql\n{stat['sql'][:400]}```")
+            if stat["plan"]:
+                value += f"```{stat['plan'][:300]}```"
+            embed.add_field(name=f"#{i}", value=value[:1024], inline=False)
+        if not top:
+            embed.description = "No queries recorded yet."
+        caches = " | ".join(f"{name}: {c['hits']} hits, {c['misses']} misses ({c['hit_rate']:.0%}), {c['size']}/{c['maxsize']}"
+                            for name, c in db.cache_stats().items())
+        embed.add_field(name="Caches", value=caches[:1024], inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @apollo_group.command(name="wip", description="Apollo WIP command")
     @commands.is_owner()
     async def apollo_wip(self, interaction: Interaction):
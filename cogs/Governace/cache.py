@@ -0,0 +1,79 @@
+# cogs/Governace/cache.py
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from metrics import REGISTRY
+
+CACHE_REQUESTS = REGISTRY.counter("governance_cache_requests_total", "DBManager cache lookups.", ["cache", "result"])
+
+
+class LRUCache:
+    """Bounded least-recently-used cache whose entries also expire after `ttl` seconds.
+
+    Readers take a token() before going to the database and hand it to put();
+    any invalidation in between makes that put a no-op, so a read that raced a
+    write can never cache the row from before the write.
+    """
+
+    def __init__(self, name: str, maxsize: int = 512, ttl: Optional[float] = 60.0):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and (self.ttl is None or entry[0] > time.monotonic()):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+        return default
+
+    def token(self) -> int:
+        return self._generation
+
+    def put(self, key: Hashable, value: Any, token: Optional[int] = None):
+        if self.maxsize <= 0 or (token is not None and token != self._generation):
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def update(self, key: Hashable, fields: Dict[str, Any]):
+        """Write-through for dict values: patch a cached entry in place (if present) instead of dropping it."""
+        self._generation += 1
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[1].update(fields)
+
+    def invalidate(self, key: Hashable):
+        self._generation += 1
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,85 @@
+# cogs/Governace/clock.py
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+
+class SystemClock:
+    """Wall-clock time (naive UTC, like the timestamps stored in the database)."""
+
+    def now(self) -> datetime:
+        return datetime.utcnow()
+
+    async def wait(self, event: asyncio.Event, timeout: Optional[float] = None) -> bool:
+        """Wait for `event` or until `timeout` seconds pass. True if the event was set."""
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+class VirtualClock(SystemClock):
+    """Clock that only moves when told to, for replays and load tests.
+
+    Waits with a timeout resolve when advance() moves time past their deadline,
+    so days of bill deadlines can be fast-forwarded in seconds.
+    """
+
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = self.started_at = start or datetime.utcnow()
+        self._timers: List[Tuple[datetime, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._idle = asyncio.Event()  # set whenever somebody starts waiting on the clock
+
+    def now(self) -> datetime:
+        return self._now
+
+    async def wait(self, event: asyncio.Event, timeout: Optional[float] = None) -> bool:
+        if event.is_set():
+            return True
+        timer = asyncio.get_running_loop().create_future()
+        if timeout is not None:
+            heapq.heappush(self._timers, (self._now + timedelta(seconds=max(timeout, 0)), next(self._seq), timer))
+        event_wait = asyncio.ensure_future(event.wait())
+        self._idle.set()
+        try:
+            await asyncio.wait([event_wait, timer], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            event_wait.cancel()
+            if not timer.done():
+                timer.cancel()
+        return event.is_set()
+
+    def next_deadline(self) -> Optional[datetime]:
+        while self._timers and self._timers[0][2].done():
+            heapq.heappop(self._timers)
+        return self._timers[0][0] if self._timers else None
+
+    async def advance(self, seconds: float = 0, settle_timeout: float = 30.0):
+        """Move time forward, firing every timer that falls due on the way, in order.
+
+        After each timer fires, waits (in real time, up to `settle_timeout`) until
+        the woken task is back waiting on the clock, so handlers finish before
+        time moves on.
+        """
+        target = self._now + timedelta(seconds=seconds)
+        # Let tasks woken just before the jump re-arm their timers first
+        await asyncio.sleep(0.01)
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > target:
+                break
+            self._now = max(self._now, deadline)
+            self._idle.clear()
+            while self._timers and self._timers[0][0] <= self._now:
+                _, _, timer = heapq.heappop(self._timers)
+                if not timer.done():
+                    timer.set_result(None)
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout=settle_timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._now = target
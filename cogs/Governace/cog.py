@@ -3,12 +3,26 @@ import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 import asyncio
+import tempfile
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Literal, Optional
 import traceback
 
-from .db_manager import DBManager
-from .ui_components import ProposeButtonView, StatutesView, VotingView, ProposalForm
+from metrics import REGISTRY, startup_phase
+from ratelimit import InteractionLimiter
+
+from .clock import SystemClock
+from .db_manager import DBManager, TRANSITIONS
+from .scheduler import DeadlineScheduler, VOTE_START, VOTE_END
+from .tally_engine import MAX_OPTIONS, TALLY_METHODS, tally
+from .ui_components import (ProposeButtonView, StatutesView, VotingView, VoteButton, BallotButton, LegacyVotingView,
+                            ApprovedBillsPages, build_vote_embed, build_ballot_embed, guild_config,
+                            race_options)
+from .events import (EventBus, ProposalCreated, DebateOpened, VotingOpened, VoteCast, BillClosed, BillVetoed)
+from .export import export_filename, export_stream
+from .live_feed import LiveFeed
+from .live_tally import LiveTally
+from .guild_config import GuildConfigStore
 from . import constants
 
 DB_PATH = constants.DB_PATH
@@ -16,90 +30,199 @@ DB_PATH = constants.DB_PATH
 VOTE_DELAY_HOURS = 48
 VOTE_DURATION_DAYS = 4  # voting ends 4 days after start
 
+SCHEDULED_DEADLINES = REGISTRY.gauge("governance_scheduled_deadlines", "Bill deadlines waiting in the scheduler.")
+OPEN_VOTES = REGISTRY.gauge("governance_open_votes", "Bills currently open for voting.")
+VOTES_ARCHIVED = REGISTRY.counter("governance_votes_archived_total", "Vote rows folded into vote archives.")
+
+
+def staff_only():
+    """App check for staff commands: Manage Server, or the server's moderator role (/governance config roles)."""
+    async def predicate(interaction: discord.Interaction) -> bool:
+        if interaction.permissions.manage_guild:
+            return True
+        moderator_role_id = guild_config(interaction).get("moderator_role_id")
+        if moderator_role_id and discord.utils.get(getattr(interaction.user, "roles", []), id=moderator_role_id):
+            return True
+        raise app_commands.MissingPermissions(["manage_guild"])
+    return app_commands.check(predicate)
+
+
 class Governance(commands.Cog):
-    def __init__(self, bot: commands.Bot):
+    def __init__(self, bot: commands.Bot, db_path: str = DB_PATH, clock: Optional[SystemClock] = None):
         self.bot = bot
-        self.db = DBManager(DB_PATH)
-        self.scheduled_tasks = {}  # bill_id -> asyncio.Task
+        # Source of "now" for deadlines; a VirtualClock lets replays fast-forward days
+        self.clock = clock or SystemClock()
+        self.db = DBManager(db_path, clock=self.clock)
+        if getattr(constants, "DB_PROFILING", False):
+            self.db.enable_profiling(constants.DB_SLOW_QUERY_MS)
+        # Channel/role settings per guild, cached in memory
+        self.guild_configs = GuildConfigStore(self.db)
+        # One task + heap for every bill deadline (persisted in scheduled_events)
+        self.scheduler = DeadlineScheduler(self.db, {
+            VOTE_START: self._post_vote_message,
+            VOTE_END: self._tally_votes_and_archive,
+        }, clock=self.clock)
+        # Coalesced edits of the voting messages while votes come in
+        self.live_tally = LiveTally(self.bot, self.db, self.guild_configs, getattr(constants, "LIVE_TALLY_INTERVAL_SECONDS", 15))
+        # Bill lifecycle events (see events.py); subscribers run once the bot is ready
+        self.events = EventBus()
+        self.events.subscribe(ProposalCreated, self._on_proposal_created, name="debate_poster")
+        self.events.subscribe(VoteCast, self._on_vote_cast, name="live_tally", maxsize=10000, lossy=True)
+        # Dashboard feed (GET /governance/feed)
+        self.live_feed = LiveFeed(self.db, self.events)
+        # Budget for every governance button, form and slash command (see ui_components.RateLimitedMixin)
+        self.rate_limiter = InteractionLimiter("governance", getattr(constants, "INTERACTION_RATE_PER_USER", (5, 10)),
+                                               getattr(constants, "INTERACTION_RATE_PER_GUILD", None))
+        # bill_id -> vote_end of bills in 'voting'; vote clicks are checked against this, not the DB
+        self.open_votes = {}
+        # Approved Bills pages shared by every StatutesView, cached until a law is enacted
+        self.law_pages = ApprovedBillsPages(self.db)
         self.base_rules_url = constants.CONSTITUTION_URL if hasattr(constants, "CONSTITUTION_URL") else "https://example.com/constitution"
-
-        # We'll initialize DB on cog load (on_ready)
-        # Register persistent views when ready
-
-    governance_group = app_commands.Group(name="governance", description="Governance commands")
+        SCHEDULED_DEADLINES.set_function(lambda: len(self.scheduler))
+        OPEN_VOTES.set_function(lambda: len(self.open_votes))
+        self.compact_votes_job.change_interval(minutes=getattr(constants, "VOTE_COMPACTION_INTERVAL_MINUTES", 60))
+        # Guild that adopted the constants.py setup, once its channels are visible
+        self.legacy_guild_id = None
+        self._ready_task = None
+
+    # Every subcommand works on the invoking server's bills and settings (none make sense in DMs).
+    # Set on the group: Discord ignores guild_only on subcommands.
+    governance_group = app_commands.Group(name="governance", description="Governance commands", guild_only=True)
     staff_group = app_commands.Group(name="staff", description="Staff commands", parent=governance_group)
     deploy_group = app_commands.Group(name="deploy", description="Deployment commands", parent=governance_group)
     vote_group = app_commands.Group(name="vote", description="Voting commands", parent=governance_group)
+    laws_group = app_commands.Group(name="laws", description="Statutes and acts", parent=governance_group)
+    config_group = app_commands.Group(name="config", description="Per-server governance settings", parent=governance_group)
 
 
-    @commands.Cog.listener()
-    async def on_ready(self):
-        # Ensure DB initialized
-        await self.db.initialize()
-        # Register the statutes view (persistent)
-        try:
-            statutes_view = StatutesView(self.bot, self.base_rules_url, self.db)
-            self.bot.add_view(statutes_view)  # persistent view registration
-        except Exception:
-            # Views may not be persistent across restarts without message references; safe ignore
-            pass
+    async def cog_load(self):
+        """One-time setup, run once when the cog is added (before the gateway connects)."""
+        with startup_phase("governance: database"):
+            await self.db.initialize()
+            await self.guild_configs.load()
 
-        # Recover any pending scheduled tasks from DB
-        pending = await self.db.get_all_pending_votes()
-        for prop in pending:
-            bill_id = prop["bill_id"]
-            # If vote_start exists and is in future, schedule vote start
+        with startup_phase("governance: views"):
+            # Register the statutes view (persistent)
             try:
-                if prop.get("vote_start"):
-                    vote_start = datetime.fromisoformat(prop["vote_start"])
-                    if datetime.utcnow() < vote_start:
-                        # schedule start
-                        self._schedule_vote_start(bill_id, vote_start)
-                    elif prop["status"] == "debating" and prop.get("vote_end"):
-                        # If start passed but vote_end exists or voting in progress, schedule end
-                        vote_end = datetime.fromisoformat(prop["vote_end"]) if prop.get("vote_end") else None
-                        if vote_end and datetime.utcnow() < vote_end:
-                            self._schedule_vote_end(bill_id, vote_end)
-                elif prop["status"] == "voting" and prop.get("vote_end"):
-                    vote_end = datetime.fromisoformat(prop["vote_end"])
-                    if datetime.utcnow() < vote_end:
-                        self._schedule_vote_end(bill_id, vote_end)
+                statutes_view = StatutesView(self.bot, self.base_rules_url, self.db, self.law_pages)
+                self.bot.add_view(statutes_view)  # persistent view registration
             except Exception:
-                traceback.print_exc()
+                # Views may not be persistent across restarts without message references; safe ignore
+                pass
+            # One handler for every vote button ("vote:<bill_id>:<choice>"), plus the old fixed custom_ids
+            self.bot.add_dynamic_items(VoteButton, BallotButton)
+            self.bot.add_view(LegacyVotingView(self.db))
+
+        with startup_phase("governance: recovery"):
+            self.open_votes = {
+                row["bill_id"]: datetime.fromisoformat(row["vote_end"])
+                for row in await self.db.get_open_votes()
+            }
+            await asyncio.gather(*(self.db.open_tally(bill_id, reconcile=True)
+                                   for bill_id in self.open_votes if bill_id not in self.db.tallies))
+            # Pending deadlines from DB; they start firing once the bot is ready
+            await self.scheduler.load()
+
+        # Deadlines and message edits need the guild cache, so they wait for READY
+        self._ready_task = asyncio.create_task(self._start_when_ready())
+        self._ready_task.add_done_callback(self._ready_task_done)
+
+    @staticmethod
+    def _ready_task_done(task: asyncio.Task):
+        # Nothing awaits this task, so its errors would otherwise vanish
+        if not task.cancelled() and task.exception() is not None:
+            print("Governance failed to start its deadline, tally and event tasks:")
+            traceback.print_exception(task.exception())
+
+    async def _start_when_ready(self):
+        await self.bot.wait_until_ready()
+        # The guild set up in constants.py keeps working (and keeps its old bills) without extra config
+        self.legacy_guild_id = await self.guild_configs.adopt_legacy_guild(self.bot)
+        self.events.start()
+        # Bills proposed just before a shutdown never got their debate post
+        for row in await self.db.get_undebated_proposals():
+            await self.events.publish(ProposalCreated(row["bill_id"], guild_id=row["guild_id"],
+                                                      proposer_id=row["proposer_id"], title=row["title"]))
+        # Overdue deadlines fire right away, oldest first
+        self.scheduler.start()
+        self.live_tally.start()
+        self.live_feed.start()
+        if not self.compact_votes_job.is_running():
+            self.compact_votes_job.start()
 
-    # ---------- Helpers to schedule tasks ----------
-    def _schedule_vote_start(self, bill_id: int, vote_start_dt: datetime):
-        delay = max((vote_start_dt - datetime.utcnow()).total_seconds(), 0)
-        task = self.bot.loop.create_task(self._delayed_start(bill_id, delay))
-        self.scheduled_tasks[f"start-{bill_id}"] = task
-
-    def _schedule_vote_end(self, bill_id: int, vote_end_dt: datetime):
-        delay = max((vote_end_dt - datetime.utcnow()).total_seconds(), 0)
-        task = self.bot.loop.create_task(self._delayed_end(bill_id, delay))
-        self.scheduled_tasks[f"end-{bill_id}"] = task
-
-    async def _delayed_start(self, bill_id: int, delay_seconds: float):
-        await asyncio.sleep(delay_seconds)
-        try:
-            await self._post_vote_message(bill_id)
-        except Exception:
-            traceback.print_exc()
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Fired again after every reconnect; everything else was done once in cog_load
+        if self.legacy_guild_id is None and self._ready_task is not None and self._ready_task.done():
+            self.legacy_guild_id = await self.guild_configs.adopt_legacy_guild(self.bot)
+
+    async def cog_unload(self):
+        if self._ready_task is not None:
+            self._ready_task.cancel()
+        self.compact_votes_job.cancel()
+        await self.scheduler.stop()
+        await self.events.stop()
+        await self.live_tally.stop()
+        await self.live_feed.stop()
+        # Last, once nothing above can touch it; flushes queued votes and live counters first
+        await self.db.close()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return await self.rate_limiter.app_check(interaction)
+
+    # ---------- Event subscribers ----------
+    async def _on_proposal_created(self, event: ProposalCreated):
+        # Published again for leftovers on startup, so only act on bills still awaiting debate
+        prop = await self.db.get_proposal_by_id(event.bill_id)
+        if not prop or prop["debate_message_id"] or prop["status"] != "awaiting":
+            return
+        await self.post_to_debate_channel(event.bill_id)
+
+    async def _on_vote_cast(self, event: VoteCast):
+        self.live_tally.mark_dirty(event.bill_id)
 
-    async def _delayed_end(self, bill_id: int, delay_seconds: float):
-        await asyncio.sleep(delay_seconds)
+    # ---------- Vote compaction ----------
+    @tasks.loop(minutes=60)
+    async def compact_votes_job(self):
+        """Fold the vote rows of bills closed VOTE_ARCHIVE_AFTER_DAYS ago into per-bill archives."""
+        cutoff = self.clock.now() - timedelta(days=getattr(constants, "VOTE_ARCHIVE_AFTER_DAYS", 30))
+        bills = folded = 0
         try:
-            await self._tally_votes_and_archive(bill_id)
+            while batch := await self.db.get_compactable_bills(cutoff):
+                for bill_id in batch:
+                    # One short write transaction per bill, so vote clicks keep getting through
+                    rows = await self.db.compact_votes(bill_id)
+                    VOTES_ARCHIVED.inc(rows)
+                    folded += rows
+                    bills += 1
         except Exception:
             traceback.print_exc()
+        if bills:
+            print(f"Archived {folded} votes of {bills} closed bills.")
+
+    def _channel(self, guild_id: Optional[int], field: str):
+        """A configured channel of a guild, e.g. _channel(guild_id, "voting_channel_id")."""
+        return self.guild_configs.channel(self.bot, guild_id, field)
+
+    def _base_rules_url(self, guild_id: Optional[int]) -> str:
+        return self.guild_configs.get(guild_id).get("constitution_url") or self.base_rules_url
+
+    # ---------- Helpers to schedule tasks ----------
+    async def _schedule_vote_start(self, bill_id: int, vote_start_dt: datetime):
+        await self.scheduler.schedule(bill_id, VOTE_START, vote_start_dt)
+
+    async def _schedule_vote_end(self, bill_id: int, vote_end_dt: datetime):
+        await self.scheduler.schedule(bill_id, VOTE_END, vote_end_dt)
 
     # ---------- Utility to send the proposal rules embed + propose button (to PROPOSALS channel) ----------
     @deploy_group.command(name="proposal")
-    @commands.has_permissions(manage_guild=True)
-    async def deploy_proposal_embed(self, ctx: commands.Context):
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def deploy_proposal_embed(self, interaction: discord.Interaction):
         """Deploy the Bill Proposal embed + button into the proposals channel (admin only)."""
-        proposals_ch = self.bot.get_channel(constants.PROPOSALS_CHANNEL_ID)
+        await interaction.response.defer(ephemeral=True)
+        proposals_ch = self._channel(interaction.guild_id, "proposals_channel_id")
         if not proposals_ch:
-            await ctx.reply("Proposals channel not found.", ephemeral=True)
+            await interaction.followup.send("Proposals channel not found.", ephemeral=True)
             return
 
         embed = discord.Embed(
@@ -116,16 +239,17 @@ class Governance(commands.Cog):
         view = ProposeButtonView(self.bot, self.db)
         msg = await proposals_ch.send(embed=embed, view=view)
         # Save proposal embed message id? Not strictly necessary
-        await ctx.reply("Deployed proposal embed with button.", ephemeral=True)
+        await interaction.followup.send("Deployed proposal embed with button.", ephemeral=True)
 
     # ---------- Deploy Statutes embed ----------
     @deploy_group.command(name="statutes")
-    @commands.has_permissions(manage_guild=True)
-    async def deploy_statutes_embed(self, ctx: commands.Context):
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def deploy_statutes_embed(self, interaction: discord.Interaction):
         """Deploy the Statutes & Acts embed with base rules link and Approved Bills button."""
-        statutes_ch = self.bot.get_channel(constants.STATUTES_AND_ACTS_CHANNEL_ID)
+        await interaction.response.defer(ephemeral=True)
+        statutes_ch = self._channel(interaction.guild_id, "statutes_channel_id")
         if not statutes_ch:
-            await ctx.reply("Statutes & Acts channel not found.", ephemeral=True)
+            await interaction.followup.send("Statutes & Acts channel not found.", ephemeral=True)
             return
 
         embed = discord.Embed(
@@ -134,69 +258,220 @@ class Governance(commands.Cog):
             color=discord.Color.purple(),
             timestamp=datetime.utcnow()
         )
-        view = StatutesView(self.bot, self.base_rules_url, self.db)
+        view = StatutesView(self.bot, self._base_rules_url(interaction.guild_id), self.db, self.law_pages)
         await statutes_ch.send(embed=embed, view=view)
-        await ctx.reply("Deployed Statutes & Acts embed.", ephemeral=True)
+        await interaction.followup.send("Deployed Statutes & Acts embed.", ephemeral=True)
 
     # ---------- Public commands ----------
     @vote_group.command(name="start")
-    @commands.has_permissions(manage_guild=True)
-    async def force_vote_start(self, ctx: commands.Context, bill_id: int):
+    @staff_only()
+    async def force_vote_start(self, interaction: discord.Interaction, bill_id: int):
         """Force the voting to start immediately for a bill."""
-        await ctx.defer()
+        await interaction.response.defer(ephemeral=True)
         prop = await self.db.get_proposal_by_id(bill_id)
         if not prop:
-            await ctx.reply("Bill not found.", ephemeral=True)
+            await interaction.followup.send("Bill not found.", ephemeral=True)
             return
-        if prop["status"] in ("voting", "passed", "vetoed", "archived"):
-            await ctx.reply(f"Bill is already {prop['status']}.", ephemeral=True)
+        if prop["status"] not in TRANSITIONS["open_vote"]:
+            await interaction.followup.send(f"Bill is already {prop['status']}.", ephemeral=True)
             return
         # set vote times: start now, end after VOTE_DURATION_DAYS
-        vote_start = datetime.utcnow()
+        vote_start = self.clock.now()
         vote_end = vote_start + timedelta(days=VOTE_DURATION_DAYS)
-        await self.db.set_vote_times(bill_id, vote_start, vote_end)
-        # schedule end
-        self._schedule_vote_end(bill_id, vote_end)
-        await self._post_vote_message(bill_id)
-        await ctx.reply(f"Voting started for bill #{bill_id}. It will end <t:{int(vote_end.timestamp())}:F>.", ephemeral=True)
+        if not await self._post_vote_message(bill_id, vote_start, vote_end):
+            await interaction.followup.send(f"Voting could not be opened for bill #{bill_id}.", ephemeral=True)
+            return
+        # replace the pending start with an end deadline
+        await self.scheduler.cancel(bill_id, VOTE_START)
+        await self._schedule_vote_end(bill_id, vote_end)
+        await interaction.followup.send(f"Voting started for bill #{bill_id}. It will end <t:{int(vote_end.timestamp())}:F>.", ephemeral=True)
 
     @vote_group.command(name="end")
-    @commands.has_permissions(manage_guild=True)
-    async def force_vote_end(self, ctx: commands.Context, bill_id: int):
+    @staff_only()
+    async def force_vote_end(self, interaction: discord.Interaction, bill_id: int):
         """End voting immediately and tally."""
-        await ctx.defer()
+        await interaction.response.defer(ephemeral=True)
         prop = await self.db.get_proposal_by_id(bill_id)
         if not prop:
-            await ctx.reply("Bill not found.", ephemeral=True)
+            await interaction.followup.send("Bill not found.", ephemeral=True)
+            return
+        if prop["status"] not in TRANSITIONS["close"] or not await self._tally_votes_and_archive(bill_id):
+            # Leave its deadlines alone: a bill still in debate must still open and close on schedule
+            await interaction.followup.send(f"Bill #{bill_id} is not open for voting.", ephemeral=True)
+            return
+        # A scheduled end firing meanwhile is a no-op (the close transition already ran)
+        await self.scheduler.cancel(bill_id)
+        await interaction.followup.send(f"Voting forcibly ended and tallied for bill #{bill_id}.", ephemeral=True)
+
+    @vote_group.command(name="race", description="Open a ranked-choice or weighted vote between several options")
+    @app_commands.describe(title="What is being decided", options="Options separated by commas (2 to 25)",
+                           method="irv: voters rank the options; weighted: one pick, weighted by role",
+                           hours="How long voting stays open")
+    @staff_only()
+    async def start_race(self, interaction: discord.Interaction, title: str, options: str,
+                         method: Literal["irv", "weighted"] = "irv", hours: app_commands.Range[int, 1, 720] = 72):
+        labels = [label.strip() for label in options.split(",") if label.strip()]
+        if not 2 <= len(labels) <= MAX_OPTIONS or len(set(labels)) != len(labels):
+            await interaction.response.send_message(f"Give between 2 and {MAX_OPTIONS} distinct options.", ephemeral=True)
+            return
+        if not self._channel(interaction.guild_id, "voting_channel_id"):
+            await interaction.response.send_message("Voting channel not found.", ephemeral=True)
             return
-        await self._tally_votes_and_archive(bill_id)
-        await ctx.reply(f"Voting forcibly ended and tallied for bill #{bill_id}.", ephemeral=True)
+        await interaction.response.defer(ephemeral=True)
+        text = "\n".join(f"{i}. {label}" for i, label in enumerate(labels, start=1))
+        bill_id = await self.db.insert_proposal(title, text, interaction.user.id, interaction.guild_id,
+                                                tally_method=method, options=labels)
+        vote_start = self.clock.now()
+        vote_end = vote_start + timedelta(hours=hours)
+        if not await self._post_vote_message(bill_id, vote_start, vote_end):
+            # The race was created just for this vote, so don't leave it behind unopened
+            await self.db.remove_bill(bill_id)
+            await interaction.followup.send(f"Voting could not be opened for bill #{bill_id}.", ephemeral=True)
+            return
+        await self._schedule_vote_end(bill_id, vote_end)
+        await interaction.followup.send(f"Voting opened for bill #{bill_id}. It will end <t:{int(vote_end.timestamp())}:F>.", ephemeral=True)
 
     @staff_group.command(name="veto")
-    @commands.has_permissions(manage_guild=True)
-    async def veto(self, ctx: commands.Context, bill_id: int, *, reason: Optional[str] = None):
+    @staff_only()
+    async def veto(self, interaction: discord.Interaction, bill_id: int, reason: Optional[str] = None):
         """Veto a bill (staff only). Can be used even after passage."""
-        await ctx.defer()
-        ok = await self.db.veto_bill(bill_id, reason)
-        if not ok:
-            await ctx.reply("Bill not found.", ephemeral=True)
+        await interaction.response.defer(ephemeral=True)
+        prop = await self.db.veto_bill(bill_id, reason)
+        if not prop:
+            await interaction.followup.send("Bill not found or already vetoed.", ephemeral=True)
             return
-        prop = await self.db.get_proposal_by_id(bill_id)
+        await self.scheduler.cancel(bill_id)
+        self.open_votes.pop(bill_id, None)
+        await self.events.publish(BillVetoed(bill_id, guild_id=prop["guild_id"], reason=reason))
         # post to past legislation channel with veto note
-        past_ch = self.bot.get_channel(constants.PAST_LEGISLATION_CHANNEL_ID)
+        past_ch = self._channel(prop["guild_id"], "past_legislation_channel_id")
         if past_ch:
             embed = discord.Embed(title=f"Bill #{bill_id}: {prop['title']}", description=prop['text'], color=discord.Color.dark_red(), timestamp=datetime.utcnow())
             embed.set_footer(text="Status: VETOED")
             await past_ch.send(embed=embed)
-        await ctx.reply(f"Bill #{bill_id} has been vetoed.", ephemeral=True)
+        await interaction.followup.send(f"Bill #{bill_id} has been vetoed.", ephemeral=True)
 
     @staff_group.command(name="remove_bill")
-    @commands.has_permissions(manage_guild=True)
-    async def remove_bill(self, ctx: commands.Context, bill_id: int):
+    @staff_only()
+    async def remove_bill(self, interaction: discord.Interaction, bill_id: int):
         """Remove a bill from DB (irreversible)."""
-        await ctx.defer()
-        await self.db.remove_bill(bill_id)
-        await ctx.reply(f"Bill #{bill_id} removed from database.", ephemeral=True)
+        await interaction.response.defer(ephemeral=True)
+        await self.scheduler.cancel(bill_id)
+        self.open_votes.pop(bill_id, None)
+        if not await self.db.remove_bill(bill_id):
+            await interaction.followup.send("Bill not found.", ephemeral=True)
+            return
+        await interaction.followup.send(f"Bill #{bill_id} removed from database.", ephemeral=True)
+
+    @laws_group.command(name="search", description="Search enacted acts or bill proposals")
+    @app_commands.describe(query="Words to look for", scope="Search enacted acts or all bill proposals")
+    async def search_laws(self, interaction: discord.Interaction, query: str, scope: Literal["acts", "bills"] = "acts"):
+        await interaction.response.defer(ephemeral=True)
+        if scope == "acts":
+            results = await self.db.search_laws(query, guild_id=interaction.guild_id)
+        else:
+            results = await self.db.search_proposals(query, guild_id=interaction.guild_id)
+        if not results:
+            await interaction.followup.send(f"No {scope} match `{query}`.", ephemeral=True)
+            return
+
+        embed = discord.Embed(
+            title=f"Search results for \"{query}\""[:256],
+            color=discord.Color.purple(),
+            timestamp=datetime.utcnow()
+        )
+        for r in results:
+            if scope == "acts":
+                name = f"Act #{r['law_id']} (Bill #{r['bill_id']}): {r['title']}"
+            else:
+                name = f"Bill #{r['bill_id']}: {r['title']} [{r['status']}]"
+            embed.add_field(name=name[:256], value=(r["snippet"] or "…")[:1024], inline=False)
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @governance_group.command(name="export", description="Download laws, proposals or vote records of this server")
+    @app_commands.describe(kind="What to export", fmt="File format", status="Only bills with this status",
+                           since="Only rows from this date on (YYYY-MM-DD)", until="Only rows before this date (YYYY-MM-DD)",
+                           bill_id="Only rows of this bill", compress="Gzip the file")
+    @app_commands.rename(fmt="format")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def export(self, interaction: discord.Interaction, kind: Literal["laws", "proposals", "votes"],
+                     fmt: Literal["ndjson", "csv"] = "csv", status: Optional[str] = None,
+                     since: Optional[str] = None, until: Optional[str] = None,
+                     bill_id: Optional[int] = None, compress: bool = True):
+        try:
+            since_dt = datetime.fromisoformat(since) if since else None
+            until_dt = datetime.fromisoformat(until) if until else None
+        except ValueError:
+            await interaction.response.send_message("Dates must look like 2024-05-31.", ephemeral=True)
+            return
+        await interaction.response.defer(ephemeral=True)
+
+        # Spool to disk past a few MB instead of holding the whole file in memory
+        with tempfile.SpooledTemporaryFile(max_size=4 * 1024 * 1024) as fp:
+            async for chunk in export_stream(self.db, kind, fmt, compress, status=status, since=since_dt,
+                                             until=until_dt, guild_id=interaction.guild_id, bill_id=bill_id):
+                fp.write(chunk)
+            size = fp.tell()
+            if size > interaction.guild.filesize_limit:
+                await interaction.followup.send(
+                    f"The export is {size / 1024 / 1024:.1f} MB, over this server's upload limit. "
+                    "Narrow it down with filters or download it from the dashboard (/governance/export).",
+                    ephemeral=True)
+                return
+            fp.seek(0)
+            await interaction.followup.send(file=discord.File(fp, filename=export_filename(kind, fmt, compress)),
+                                            ephemeral=True)
+
+    # ---------- Per-guild configuration ----------
+    @config_group.command(name="channels", description="Set the governance channels for this server")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def config_channels(self, interaction: discord.Interaction,
+                              proposals: Optional[discord.TextChannel] = None,
+                              debate: Optional[discord.TextChannel] = None,
+                              voting: Optional[discord.TextChannel] = None,
+                              past_legislation: Optional[discord.TextChannel] = None,
+                              statutes: Optional[discord.TextChannel] = None,
+                              announcements: Optional[discord.TextChannel] = None):
+        chosen = {"proposals": proposals, "debate": debate, "voting": voting,
+                  "past_legislation": past_legislation, "statutes": statutes, "announcements": announcements}
+        fields = {f"{name}_channel_id": channel.id for name, channel in chosen.items() if channel}
+        if fields:
+            await self.guild_configs.update(interaction.guild_id, **fields)
+        await interaction.response.send_message(embed=self._config_embed(interaction.guild_id), ephemeral=True)
+
+    @config_group.command(name="roles", description="Set the proposer/moderator roles and constitution link for this server")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    @app_commands.describe(moderator="Members with this role may also run the vote and staff commands")
+    async def config_roles(self, interaction: discord.Interaction,
+                           proposer: Optional[discord.Role] = None,
+                           moderator: Optional[discord.Role] = None,
+                           constitution_url: Optional[str] = None):
+        fields = {}
+        if proposer:
+            fields["proposer_role_id"] = proposer.id
+        if moderator:
+            fields["moderator_role_id"] = moderator.id
+        if constitution_url:
+            fields["constitution_url"] = constitution_url
+        if fields:
+            await self.guild_configs.update(interaction.guild_id, **fields)
+        await interaction.response.send_message(embed=self._config_embed(interaction.guild_id), ephemeral=True)
+
+    @config_group.command(name="show", description="Show the governance settings of this server")
+    async def config_show(self, interaction: discord.Interaction):
+        await interaction.response.send_message(embed=self._config_embed(interaction.guild_id), ephemeral=True)
+
+    def _config_embed(self, guild_id: int) -> discord.Embed:
+        config = self.guild_configs.get(guild_id)
+        embed = discord.Embed(title="Governance Settings", color=discord.Color.blurple())
+        for field in ("proposals", "debate", "voting", "past_legislation", "statutes", "announcements"):
+            channel_id = config.get(f"{field}_channel_id")
+            embed.add_field(name=field.replace("_", " ").title(), value=f"<#{channel_id}>" if channel_id else "Not set", inline=True)
+        for field in ("proposer", "moderator"):
+            role_id = config.get(f"{field}_role_id")
+            embed.add_field(name=f"{field.title()} Role", value=f"<@&{role_id}>" if role_id else "Not set", inline=True)
+        embed.add_field(name="Constitution", value=self._base_rules_url(guild_id), inline=False)
+        return embed
 
     # ---------- Internal flow ----------
     async def schedule_debate_and_voting(self, bill_id: int):
@@ -208,33 +483,21 @@ class Governance(commands.Cog):
         created = datetime.fromisoformat(prop["created_at"])
         vote_start = created + timedelta(hours=VOTE_DELAY_HOURS)
         vote_end = vote_start + timedelta(days=VOTE_DURATION_DAYS)
-        await self.db.set_vote_times(bill_id, vote_start, vote_end)
-        await self.db.set_status(bill_id, "debating")
+        if not await self.db.open_debate(bill_id, vote_start, vote_end):
+            return  # debate already opened (or voting already started)
         # schedule start and end
-        self._schedule_vote_start(bill_id, vote_start)
-        self._schedule_vote_end(bill_id, vote_end)
+        await self._schedule_vote_start(bill_id, vote_start)
+        await self._schedule_vote_end(bill_id, vote_end)
+        await self.events.publish(DebateOpened(bill_id, guild_id=prop["guild_id"], vote_start=vote_start, vote_end=vote_end))
 
     async def post_to_debate_channel(self, bill_id: int):
         prop = await self.db.get_proposal_by_id(bill_id)
         if not prop:
             return
-        debate_ch = self.bot.get_channel(constants.PAST_LEGISLATION_CHANNEL_ID)  # WAIT - we need debate channel id
-        # Use the correct debate channel constant (from user's earlier code, it was VOTING_CHANNEL etc.)
-        # Let's attempt to get a proper constant name
-        try:
-            debate_ch = self.bot.get_channel(constants.PAST_LEGISLATION_CHANNEL_ID)  # Fallback
-        except Exception:
-            debate_ch = None
-
-        # better to use a dedicated debate channel id if set:
-        debate_ch = self.bot.get_channel(constants.PAST_LEGISLATION_CHANNEL_ID) if hasattr(constants, "PAST_LEGISLATION_CHANNEL_ID") else None
-        # If constants contain a DEBATE channel id, prefer it:
-        if hasattr(constants, "DEBATE_CHANNEL_ID"):
-            debate_ch = self.bot.get_channel(constants.DEBATE_CHANNEL_ID)
-        if not debate_ch:
-            # try PROPOSALS channel as fallback
-            debate_ch = self.bot.get_channel(constants.PROPOSALS_CHANNEL_ID)
-
+        # Prefer the guild's debate channel; fall back to past legislation, then proposals
+        debate_ch = (self._channel(prop["guild_id"], "debate_channel_id")
+                     or self._channel(prop["guild_id"], "past_legislation_channel_id")
+                     or self._channel(prop["guild_id"], "proposals_channel_id"))
         if not debate_ch:
             print("Debate channel not found; cannot post debate message.")
             return
@@ -266,63 +529,73 @@ class Governance(commands.Cog):
         # schedule voting times based on created timestamp stored in DB
         await self.schedule_debate_and_voting(bill_id)
 
-    async def _post_vote_message(self, bill_id: int):
-        prop = await self.db.get_proposal_by_id(bill_id)
-        if not prop:
-            return
-        voting_ch = self.bot.get_channel(constants.VOTING_CHANNEL_ID)
+    async def _post_vote_message(self, bill_id: int, vote_start: Optional[datetime] = None,
+                                 vote_end: Optional[datetime] = None) -> Optional[dict]:
+        """Open voting and post the voting message. Without times (a scheduled start), the stored ones are kept.
+
+        Returns the proposal, or None if voting was not opened (e.g. it already is).
+        """
+        before = await self.db.get_proposal_by_id(bill_id)
+        if not before:
+            return None
+        voting_ch = self._channel(before["guild_id"], "voting_channel_id")
         if not voting_ch:
             print("Voting channel not found.")
-            return
+            return None
 
-        # vote_start and vote_end must exist in DB
-        if not prop.get("vote_start") or not prop.get("vote_end"):
-            # set now if missing
-            vote_start = datetime.utcnow()
-            vote_end = vote_start + timedelta(days=VOTE_DURATION_DAYS)
-            await self.db.set_vote_times(bill_id, vote_start, vote_end)
+        if vote_start is None:
+            # times missing in DB: start now
+            vote_start = self.clock.now()
+            prop = await self.db.open_vote(bill_id, vote_start, vote_start + timedelta(days=VOTE_DURATION_DAYS),
+                                           keep_scheduled=True)
         else:
-            vote_start = datetime.fromisoformat(prop["vote_start"])
-            vote_end = datetime.fromisoformat(prop["vote_end"])
-
-        embed = discord.Embed(
-            title=f"Voting — Bill #{bill_id}: {prop['title']}",
-            description=prop['text'],
-            color=discord.Color.green(),
-            timestamp=datetime.utcnow()
-        )
-        embed.add_field(name="Voting Opened", value=f"<t:{int(vote_start.timestamp())}:F>", inline=True)
-        embed.add_field(name="Voting Closes", value=f"<t:{int(vote_end.timestamp())}:F>", inline=True)
-        embed.set_footer(text="Cast your vote by clicking a button below.")
-
-        view = VotingView(self.bot, bill_id, self.db, vote_end)
-        vote_message = await voting_ch.send(embed=embed, view=view)
+            prop = await self.db.open_vote(bill_id, vote_start, vote_end)
+        if prop is None:
+            return None
+        vote_start = datetime.fromisoformat(prop["vote_start"])
+        vote_end = datetime.fromisoformat(prop["vote_end"])
+
+        if prop["tally_method"] != "majority":
+            embed = build_ballot_embed(prop, vote_start, vote_end, 0, voting_ch.guild.member_count)
+        else:
+            counts = {"yes": prop["yes_count"] or 0, "no": prop["no_count"] or 0, "abstain": prop["abstain_count"] or 0}
+            embed = build_vote_embed(prop, vote_start, vote_end, counts, voting_ch.guild.member_count)
+        try:
+            vote_message = await voting_ch.send(embed=embed, view=VotingView(bill_id, prop["tally_method"]))
+        except discord.HTTPException as e:
+            # No message means nobody can vote: put the bill back as it was, deadlines and all
+            print(f"Could not post the voting message for bill #{bill_id}: {e}")
+            await self.db.cancel_vote(before)
+            return None
         await self.db.update_proposal_message_ids(bill_id, vote_message_id=vote_message.id)
-        await self.db.set_status(bill_id, "voting")
-
-    async def _tally_votes_and_archive(self, bill_id: int):
+        await self.db.open_tally(bill_id)
+        self.open_votes[bill_id] = vote_end
+        await self.events.publish(VotingOpened(bill_id, guild_id=prop["guild_id"], vote_end=vote_end,
+                                               tally_method=prop["tally_method"]))
+        return prop
+
+    async def _tally_votes_and_archive(self, bill_id: int) -> bool:
+        """Close a bill's vote. Returns False if it was not open (e.g. a second trigger for the same end)."""
+        self.open_votes.pop(bill_id, None)
         prop = await self.db.get_proposal_by_id(bill_id)
-        if not prop:
-            return
-
-        counts = await self.db.get_vote_counts(bill_id)
+        if not prop or prop["status"] not in TRANSITIONS["close"]:
+            return False
+        if prop["tally_method"] in TALLY_METHODS:
+            return await self._tally_race(prop)
+
+        # Recount, status (simple majority: yes > no) and the new law commit together
+        closed = await self.db.close_bill(bill_id)
+        if closed is None:
+            return False
+        prop, counts, law_id = closed
         yes = counts["yes"]
         no = counts["no"]
         abstain = counts["abstain"]
-
-        # Determine outcome - currently simple majority yes > no
-        passed = yes > no
-
-        # Update status
-        await self.db.set_status(bill_id, "passed" if passed else "failed")
-
-        # If passed, add to laws
-        law_id = None
-        if passed:
-            law_id = await self.db.add_law_from_bill(bill_id)
+        passed = prop["status"] == "passed"
+        await self.events.publish(BillClosed(bill_id, guild_id=prop["guild_id"], status=prop["status"], counts=counts))
 
         # Post summary to past legislation
-        past_ch = self.bot.get_channel(constants.PAST_LEGISLATION_CHANNEL_ID)
+        past_ch = self._channel(prop["guild_id"], "past_legislation_channel_id")
         embed = discord.Embed(
             title=f"Bill #{bill_id}: {prop['title']}",
             description=prop['text'],
@@ -340,41 +613,46 @@ class Governance(commands.Cog):
             # Try to edit a central Approved Bills message / or leave as is
             # For simplicity, we rely on StatutesView to fetch from DB when users click "View Approved Bills"
             pass
-
-    # ---------- Event: when a new proposal message is posted to proposals channel ----------
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        # Only act on messages in the proposals channel that were sent by the bot (proposal embeds) OR detect new proposals from users?
-        # Instead, we rely on ProposalForm to insert into DB and post to proposals. So we watch bot messages in proposals to trigger debate.
-        if message.author != self.bot.user:
-            return
-        if message.channel.id != constants.PROPOSALS_CHANNEL_ID:
-            return
-        # try to detect embed with "Bill #"
-        if not message.embeds:
-            return
-        embed = message.embeds[0]
-        if not embed.title or not embed.title.startswith("Bill #"):
-            return
-
-        # parse bill id from embed title
-        try:
-            bill_id_str = embed.title.split(":")[0].split("#")[1]
-            bill_id = int(bill_id_str)
-        except Exception:
-            return
-
-        # If DB has no debate_message_id or status 'awaiting', post to debate channel and schedule
-        prop = await self.db.get_proposal_by_id(bill_id)
-        if not prop:
-            return
-        if prop["debate_message_id"] or prop["status"] != "awaiting":
-            return
-
-        # Post to debate channel and schedule voting
-        await self.post_to_debate_channel(bill_id)
+        return True
+
+    async def _tally_race(self, prop: dict) -> bool:
+        """Count a ranked/weighted race from its ballots and post the round-by-round result."""
+        bill_id = prop["bill_id"]
+        labels = race_options(prop)
+        groups = await self.db.get_ballot_groups(bill_id)
+        # Counting is pure CPU; keep big races off the event loop
+        result = await asyncio.to_thread(tally, prop["tally_method"], groups, len(labels))
+        if not await self.db.decide_race(bill_id, result):
+            return False  # decided by a concurrent trigger
+        final = result.rounds[-1].counts if result.rounds else {}
+        await self.events.publish(BillClosed(bill_id, guild_id=prop["guild_id"], status="decided",
+                                             counts={labels[o]: weight for o, weight in final.items()}))
+
+        past_ch = self._channel(prop["guild_id"], "past_legislation_channel_id")
+        if not past_ch:
+            return True
+        embed = discord.Embed(
+            title=f"Bill #{bill_id}: {prop['title']}",
+            description=prop['text'],
+            color=discord.Color.green() if result.winner is not None else discord.Color.red(),
+            timestamp=datetime.utcnow()
+        )
+        # Embeds allow 25 fields; with more rounds than that only the last ones are shown
+        for number, round_ in list(enumerate(result.rounds, start=1))[-(25 - 1):]:
+            lines = [f"{labels[o]}: {weight:g}" for o, weight in sorted(round_.counts.items(), key=lambda kv: -kv[1])]
+            if round_.exhausted:
+                lines.append(f"Exhausted: {round_.exhausted:g}")
+            if round_.eliminated:
+                lines.append(f"Eliminated: {', '.join(labels[o] for o in round_.eliminated)}")
+            embed.add_field(name=f"Round {number}", value="\n".join(lines)[:1024] or "No ballots", inline=False)
+        winner = labels[result.winner] if result.winner is not None else "none (no ballots or a tie)"
+        embed.add_field(name="Result", value=f"Winner: **{winner}** | Ballots: {result.ballots}", inline=False)
+        embed.set_footer(text=f"Status: DECIDED ({prop['tally_method'].upper()})")
+        await past_ch.send(embed=embed)
+        return True
 
 
 # Cog setup
 async def setup(bot):
-    await bot.add_cog(Governance(bot))
+    # A bot may carry its own clock / database path (see benchmarks/e2e_replay.py)
+    await bot.add_cog(Governance(bot, db_path=getattr(bot, "governance_db_path", DB_PATH), clock=getattr(bot, "clock", None)))
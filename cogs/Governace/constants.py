@@ -13,6 +13,34 @@ CONSTITUTION_CHANNEL_ID = 1404604984330424463 # Your #Constitution channel (for
 PROPOSER_ROLE_ID = 1403895959561310238    # Role ID for members who can propose bills (e.g., your "Citizen" role)
 MODERATOR_ROLE_ID = 1403895848479494206   # Role ID for moderators who can start votes and veto bills
 
+# --- Weighted Votes ---
+# Ballot weight per role in weighted races (role ID -> weight); a member counts with their
+# heaviest listed role, everyone else with weight 1.
+ROLE_VOTE_WEIGHTS = {}
+
+# --- Live Tally ---
+# Minimum seconds between two edits of the same voting message (keeps Discord rate limits happy).
+LIVE_TALLY_INTERVAL_SECONDS = 15
+
+# --- Rate Limits ---
+# Governance buttons, forms and commands allowed per user and per server: (interactions, seconds).
+# None turns that limit off. The server-wide limit is off by default: a busy vote is exactly the
+# burst the vote queue and live counters are built to absorb, so only set it for a known need.
+INTERACTION_RATE_PER_USER = (5, 10)
+INTERACTION_RATE_PER_GUILD = None
+
+# --- Vote Compaction ---
+# Days after a bill closes before its individual vote rows are folded into a compact archive.
+VOTE_ARCHIVE_AFTER_DAYS = 30
+# How often the compaction job looks for bills to archive.
+VOTE_COMPACTION_INTERVAL_MINUTES = 60
+
 # --- Database Path ---
 DB_PATH = "database/governance.db"
 
+# --- Database Profiling ---
+# Time every statement from startup (can also be toggled at runtime with /dev dbstats).
+DB_PROFILING = False
+# Statements slower than this are printed with their parameters while profiling is on.
+DB_SLOW_QUERY_MS = 50
+
@@ -0,0 +1,101 @@
+# cogs/Governace/dashboard_routes.py
+# Governance endpoints mounted on the FastAPI dashboard (see main.py).
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from .db_manager import DBManager
+from .export import EXPORT_FORMATS, export_filename, export_stream
+from .live_feed import FeedHub
+
+router = APIRouter(prefix="/governance", tags=["governance"])
+
+
+def get_db(request: Request) -> DBManager:
+    """The governance DBManager.
+
+    An out-of-process dashboard (run_dashboard.py) sets app.state.governance_db to a
+    read-only manager; in single-process mode it is taken from the Governance cog.
+    """
+    db = getattr(request.app.state, "governance_db", None)
+    if db is not None:
+        return db
+    bot = getattr(request.app.state, "bot", None)
+    cog = bot.get_cog("Governance") if bot else None
+    if cog is None:
+        raise HTTPException(status_code=503, detail="Governance is not loaded.")
+    return cog.db
+
+
+def get_feed(request: Request) -> FeedHub:
+    """The live feed hub: relayed over IPC out of process (run_dashboard.py), the cog's own in process."""
+    hub = getattr(request.app.state, "feed_hub", None)
+    if hub is not None:
+        return hub
+    bot = getattr(request.app.state, "bot", None)
+    cog = bot.get_cog("Governance") if bot else None
+    if cog is None:
+        raise HTTPException(status_code=503, detail="Governance is not loaded.")
+    return cog.live_feed.hub
+
+
+@router.get("/search")
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    scope: Literal["laws", "proposals"] = "laws",
+    limit: int = Query(20, ge=1, le=100),
+    guild_id: Optional[int] = None,
+):
+    """Full-text search over enacted laws or bill proposals, ranked with snippets."""
+    db = get_db(request)
+    if scope == "laws":
+        results = await db.search_laws(q, limit=limit, highlight=("<mark>", "</mark>"), guild_id=guild_id)
+    else:
+        results = await db.search_proposals(q, limit=limit, highlight=("<mark>", "</mark>"), guild_id=guild_id)
+    return {"query": q, "scope": scope, "results": results}
+
+
+@router.get("/export/{kind}")
+async def export(
+    request: Request,
+    kind: Literal["laws", "proposals", "votes"],
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    gzip: bool = False,
+    status: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    guild_id: int = Query(...),
+    bill_id: Optional[int] = None,
+):
+    """Stream one server's laws, proposals or vote records as NDJSON or CSV, optionally gzipped.
+
+    The dashboard has no login, so vote records come without voter IDs; staff get the full
+    records from /governance export in Discord.
+    """
+    db = get_db(request)
+    body = export_stream(db, kind, fmt, gzip, status=status, since=since, until=until,
+                         guild_id=guild_id, bill_id=bill_id, public=True)
+    filename = export_filename(kind, fmt, gzip)
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    media_type = "application/gzip" if gzip else EXPORT_FORMATS[fmt]
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+@router.get("/feed")
+async def feed(request: Request):
+    """Server-Sent Events: tally changes, new proposals, debates, votes opening, closures and vetoes."""
+    hub = get_feed(request)
+    return StreamingResponse(hub.sse(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@router.get("/bot")
+async def bot_status(request: Request):
+    """Live bot status, answered by the bot process (directly or over IPC)."""
+    try:
+        return await request.app.state.bot_bridge.call("status")
+    except ConnectionError as e:
+        raise HTTPException(status_code=503, detail=str(e))
@@ -1,179 +1,914 @@
 # cogs/Governace/db_manager.py
+import asyncio
+import json
+import re
+import sys
 import aiosqlite
+from array import array
+from bisect import bisect_left
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Set, Tuple
 
+from metrics import REGISTRY, time_methods
+
+from .cache import LRUCache
+from .clock import SystemClock
+from .migrations import run_migrations
+from .query_profiler import QueryProfiler
+from .tally_engine import TallyResult
+from .tally_store import TallyStore
+from .vote_queue import VoteQueue
+
+# Number of read-only connections kept open next to the single writer.
+READER_POOL_SIZE = 3
+
+# Proposal rows and law listings kept in memory (entries, seconds). Writes through this
+# DBManager invalidate them; the TTL only bounds how long a missed invalidation can last.
+PROPOSAL_CACHE_SIZE = 512
+LAW_CACHE_SIZE = 128
+CACHE_TTL_SECONDS = 60.0
+
+# Rows fetched per reader borrow while streaming an export.
+EXPORT_BATCH_SIZE = 500
+
+# Export kind -> (columns, source, key column, guild column, timestamp column).
+# Rows are read in key order; status filters apply to the bill a row belongs to.
+EXPORT_QUERIES = {
+    "laws": ("l.law_id, l.bill_id, l.guild_id, l.title, l.text, l.enacted_at",
+             "laws l LEFT JOIN proposals p ON p.bill_id = l.bill_id", "l.law_id", "l.guild_id", "l.enacted_at"),
+    "proposals": ("p.*", "proposals p", "p.bill_id", "p.guild_id", "p.created_at"),
+    "votes": ("v.vote_id, v.bill_id, v.user_id, v.vote_type, v.created_at",
+              "votes v JOIN proposals p ON p.bill_id = v.bill_id", "v.vote_id", "p.guild_id", "v.created_at"),
+}
+
+DB_CALL_SECONDS = REGISTRY.histogram("governance_db_call_seconds", "Duration of each DBManager call.", ["method"])
+BILL_TRANSITIONS = REGISTRY.counter("governance_bill_transitions_total",
+                                    "Bill lifecycle transitions; 'skipped' when the bill had already moved on.",
+                                    ["transition", "result"])
+
+
+# Choices kept in vote_archives, one blob column each
+ARCHIVED_CHOICES = ("yes", "no", "abstain")
+
+# Outcomes of a vote click (DBManager.record_votes)
+VOTE_RECORDED = "recorded"
+VOTE_CHANGED = "changed"
+VOTE_RETRACTED = "retracted"
+VOTE_UNCHANGED = "unchanged"
+VOTE_CLOSED = "closed"  # the bill is not (or no longer) open for voting
+
+# Statuses after which a bill's votes can no longer change
+CLOSED_STATUSES = ("passed", "failed", "vetoed", "archived")
+
+# Bill lifecycle: transition -> statuses it may start from. Each transition is one
+# conditional UPDATE, so a second trigger for the same step (a deadline racing a staff
+# command) matches no row and does nothing.
+TRANSITIONS = {
+    "open_debate": ("awaiting",),
+    "open_vote": ("awaiting", "debating"),
+    "close": ("voting",),
+    "cancel_vote": ("voting",),  # back out of open_vote when the voting message could not be posted
+    "veto": ("awaiting", "debating", "voting", "passed", "failed", "decided", "archived"),
+}
+
+
+def _pack_ids(ids) -> bytes:
+    """Sorted user IDs as little-endian uint64s."""
+    packed = array("Q", sorted(ids))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_ids(blob: bytes) -> array:
+    ids = array("Q", blob)
+    if sys.byteorder == "big":
+        ids.byteswap()
+    return ids
+
+
+def _fts_query(text: str) -> str:
+    """Turn free user text into a safe FTS5 query: every word must match, as a prefix."""
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+@time_methods(DB_CALL_SECONDS)
 class DBManager:
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, reader_pool_size: int = READER_POOL_SIZE, read_only: bool = False,
+                 clock: Optional[SystemClock] = None):
         self.db_path = db_path
+        self.clock = clock or SystemClock()  # timestamps of proposals, votes and laws
+        self.reader_pool_size = reader_pool_size
+        # Read-only managers (e.g. an out-of-process dashboard) open no writer and never migrate
+        self.read_only = read_only
+        self._opened = False
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._reader_pool: "asyncio.Queue[aiosqlite.Connection]" = asyncio.Queue()
+        self._write_lock = asyncio.Lock()
+        self.vote_queue = VoteQueue(self)
+        self.tallies = TallyStore(self)
+        self.laws_version = 0  # bumped whenever a law is enacted; lets callers drop cached pages
+        # Read-only managers see another process's writes, so they do not cache at all
+        self.proposal_cache = LRUCache("proposals", 0 if read_only else PROPOSAL_CACHE_SIZE, CACHE_TTL_SECONDS)
+        self.law_cache = LRUCache("laws", 0 if read_only else LAW_CACHE_SIZE, CACHE_TTL_SECONDS)
+        self.profiler: Optional[QueryProfiler] = None  # set by enable_profiling()
+
+    # ---------- Connection pool ----------
+    async def _connect(self, read_only: bool = False) -> aiosqlite.Connection:
+        if read_only:
+            # WAL lets this process read while the bot process writes
+            conn = await aiosqlite.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        else:
+            conn = await aiosqlite.connect(self.db_path)
+            await conn.execute("PRAGMA journal_mode = WAL")
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA synchronous = NORMAL")
+        await conn.execute("PRAGMA foreign_keys = ON")
+        await conn.execute("PRAGMA busy_timeout = 5000")
+        return conn
+
+    async def _open(self):
+        """Open the writer and the reader pool (once)."""
+        if self._opened:
+            return
+        if not self.read_only:
+            self._writer = await self._connect()
+        for _ in range(self.reader_pool_size):
+            conn = await self._connect(read_only=self.read_only)
+            self._readers.append(conn)
+            self._reader_pool.put_nowait(conn)
+        self._opened = True
+
+    async def close(self):
+        """Flush queued votes and live counters, then close every pooled connection. Safe to call more than once."""
+        await self.vote_queue.stop()
+        if self._writer is not None:
+            await self.tallies.stop()
+        async with self._write_lock:
+            if not self._opened:
+                return
+            for conn in self._readers:
+                await conn.close()
+            if self._writer is not None:
+                await self._writer.close()
+            self._readers = []
+            self._reader_pool = asyncio.Queue()
+            self._writer = None
+            self._opened = False
+
+    def enable_profiling(self, slow_ms: float = 50.0) -> QueryProfiler:
+        """Start timing every statement (see query_profiler.py). Keeps existing stats if already on."""
+        if self.profiler is None:
+            self.profiler = QueryProfiler(slow_ms)
+        self.profiler.slow_ms = slow_ms
+        return self.profiler
+
+    def disable_profiling(self):
+        self.profiler = None
+
+    def _profiled(self, conn: aiosqlite.Connection):
+        return self.profiler.wrap(conn) if self.profiler is not None else conn
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Serialize writers on the single write connection; commit on success, roll back on error."""
+        async with self._write_lock:
+            if self._writer is None:
+                raise RuntimeError("DBManager is read-only." if self.read_only else "DBManager is not initialized.")
+            try:
+                yield self._profiled(self._writer)
+                await self._writer.commit()
+            except BaseException:
+                await self._writer.rollback()
+                raise
+
+    @asynccontextmanager
+    async def _read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a reader connection from the pool."""
+        if not self._opened:
+            raise RuntimeError("DBManager is not initialized.")
+        conn = await self._reader_pool.get()
+        try:
+            yield self._profiled(conn)
+        finally:
+            self._reader_pool.put_nowait(conn)
 
     async def initialize(self):
-        """Create tables if they do not exist."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executescript(
-                """
-                PRAGMA foreign_keys = ON;
-
-                CREATE TABLE IF NOT EXISTS proposals (
-                    bill_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    text TEXT NOT NULL,
-                    proposer_id INTEGER NOT NULL,
-                    proposal_message_id INTEGER,
-                    debate_message_id INTEGER,
-                    vote_message_id INTEGER,
-                    status TEXT NOT NULL DEFAULT 'awaiting', -- awaiting, debating, voting, passed, failed, vetoed, archived
-                    created_at TEXT NOT NULL,
-                    vote_start TEXT,
-                    vote_end TEXT,
-                    yes_count INTEGER DEFAULT 0,
-                    no_count INTEGER DEFAULT 0,
-                    abstain_count INTEGER DEFAULT 0
-                );
-
-                CREATE TABLE IF NOT EXISTS votes (
-                    vote_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    bill_id INTEGER NOT NULL,
-                    vote_type TEXT NOT NULL, -- yes/no/abstain
-                    created_at TEXT NOT NULL,
-                    UNIQUE(user_id, bill_id),
-                    FOREIGN KEY(bill_id) REFERENCES proposals(bill_id) ON DELETE CASCADE
-                );
-
-                CREATE TABLE IF NOT EXISTS laws (
-                    law_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    bill_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    text TEXT NOT NULL,
-                    enacted_at TEXT NOT NULL
-                );
-                """
-            )
-            await db.commit()
+        """Open the connection pool and bring the schema up to date."""
+        await self._open()
+        if self.read_only:
+            return
+        async with self._write() as db:
+            await run_migrations(db)
+        self.vote_queue.start()
+        self.tallies.start()
+
+    # ---------- Caches ----------
+    # Invalidate only after the write has committed, so no reader can re-cache the old row
+    def _proposals_changed(self, *bill_ids: int):
+        for bill_id in bill_ids:
+            self.proposal_cache.invalidate(bill_id)
+
+    def _proposal_updated(self, bill_id: int, **fields):
+        self.proposal_cache.update(bill_id, fields)
+
+    def _laws_changed(self):
+        self.laws_version += 1
+        self.law_cache.clear()
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {"proposals": self.proposal_cache.stats(), "laws": self.law_cache.stats()}
 
     # ---------- Proposal CRUD ----------
-    async def insert_proposal(self, title: str, text: str, proposer_id: int) -> int:
-        created_at = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
+    async def insert_proposal(self, title: str, text: str, proposer_id: int, guild_id: Optional[int] = None,
+                              tally_method: str = "majority", options: Optional[List[str]] = None) -> int:
+        created_at = self.clock.now().isoformat()
+        async with self._write() as db:
             cursor = await db.execute(
-                "INSERT INTO proposals (title, text, proposer_id, created_at) VALUES (?, ?, ?, ?)",
-                (title, text, proposer_id, created_at)
+                "INSERT INTO proposals (title, text, proposer_id, created_at, guild_id, tally_method, options) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (title, text, proposer_id, created_at, guild_id, tally_method, json.dumps(options) if options else None)
             )
-            await db.commit()
             return cursor.lastrowid
 
     async def update_proposal_message_ids(self, bill_id: int, proposal_message_id: Optional[int] = None,
                                           debate_message_id: Optional[int] = None, vote_message_id: Optional[int] = None):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._write() as db:
             if proposal_message_id is not None:
                 await db.execute("UPDATE proposals SET proposal_message_id = ? WHERE bill_id = ?", (proposal_message_id, bill_id))
             if debate_message_id is not None:
                 await db.execute("UPDATE proposals SET debate_message_id = ? WHERE bill_id = ?", (debate_message_id, bill_id))
             if vote_message_id is not None:
                 await db.execute("UPDATE proposals SET vote_message_id = ? WHERE bill_id = ?", (vote_message_id, bill_id))
-            await db.commit()
+        ids = {"proposal_message_id": proposal_message_id, "debate_message_id": debate_message_id,
+               "vote_message_id": vote_message_id}
+        self._proposal_updated(bill_id, **{column: value for column, value in ids.items() if value is not None})
 
-    async def set_vote_times(self, bill_id: int, vote_start: datetime, vote_end: datetime):
-        await self.update_proposal_times(bill_id, vote_start.isoformat(), vote_end.isoformat())
+    async def get_proposal_by_id(self, bill_id: int) -> Optional[Dict[str, Any]]:
+        """The proposal row, from the cache when possible. Callers get their own copy."""
+        cached = self.proposal_cache.get(bill_id)
+        if cached is not None:
+            return dict(cached)
+        token = self.proposal_cache.token()
+        async with self._read() as db:
+            cursor = await db.execute("SELECT * FROM proposals WHERE bill_id = ?", (bill_id,))
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        prop = dict(row)
+        self.proposal_cache.put(bill_id, prop, token)
+        return dict(prop)
 
-    async def update_proposal_times(self, bill_id: int, vote_start_iso: Optional[str], vote_end_iso: Optional[str]):
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("UPDATE proposals SET vote_start = ?, vote_end = ?, status = ? WHERE bill_id = ?",
-                             (vote_start_iso, vote_end_iso, "voting" if vote_start_iso and vote_end_iso else "debating", bill_id))
-            await db.commit()
+    async def get_open_votes(self) -> List[Dict[str, Any]]:
+        """bill_id and vote_end of every bill currently in 'voting'."""
+        async with self._read() as db:
+            cursor = await db.execute("SELECT bill_id, vote_end FROM proposals WHERE status = 'voting' AND vote_end IS NOT NULL")
+            rows = await cursor.fetchall()
+            return [dict(r) for r in rows]
 
-    async def set_status(self, bill_id: int, status: str):
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("UPDATE proposals SET status = ? WHERE bill_id = ?", (status, bill_id))
-            await db.commit()
+    async def get_undebated_proposals(self) -> List[Dict[str, Any]]:
+        """Bills still waiting for their debate post (e.g. the bot stopped right after they were proposed)."""
+        async with self._read() as db:
+            cursor = await db.execute(
+                "SELECT bill_id, guild_id, proposer_id, title FROM proposals "
+                "WHERE status = 'awaiting' AND debate_message_id IS NULL AND tally_method = 'majority' ORDER BY bill_id"
+            )
+            return [dict(r) for r in await cursor.fetchall()]
 
-    async def get_proposal_by_id(self, bill_id: int) -> Optional[Dict[str, Any]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("SELECT * FROM proposals WHERE bill_id = ?", (bill_id,))
+    async def get_bill_id_by_vote_message(self, vote_message_id: int) -> Optional[int]:
+        async with self._read() as db:
+            cursor = await db.execute("SELECT bill_id FROM proposals WHERE vote_message_id = ?", (vote_message_id,))
             row = await cursor.fetchone()
-            return dict(row) if row else None
+            return row["bill_id"] if row else None
 
-    async def get_all_pending_votes(self) -> List[Dict[str, Any]]:
-        """Return proposals that have vote_start or vote_end in future or voting ongoing."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("SELECT * FROM proposals WHERE status IN ('debating','voting') AND (vote_end IS NOT NULL OR vote_start IS NOT NULL)")
+    # ---------- Scheduled deadlines ----------
+    async def upsert_scheduled_event(self, bill_id: int, kind: str, due_at_iso: str):
+        async with self._write() as db:
+            await db.execute(
+                "INSERT INTO scheduled_events (bill_id, kind, due_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(bill_id, kind) DO UPDATE SET due_at = excluded.due_at",
+                (bill_id, kind, due_at_iso)
+            )
+
+    async def delete_scheduled_events(self, bill_id: int, kind: Optional[str] = None):
+        async with self._write() as db:
+            if kind is None:
+                await db.execute("DELETE FROM scheduled_events WHERE bill_id = ?", (bill_id,))
+            else:
+                await db.execute("DELETE FROM scheduled_events WHERE bill_id = ? AND kind = ?", (bill_id, kind))
+
+    async def get_scheduled_events(self) -> List[Dict[str, Any]]:
+        async with self._read() as db:
+            cursor = await db.execute("SELECT bill_id, kind, due_at FROM scheduled_events")
             rows = await cursor.fetchall()
             return [dict(r) for r in rows]
 
     # ---------- Voting ----------
-    async def record_vote(self, user_id: int, bill_id: int, vote_type: str) -> bool:
-        """Return True if recorded, False if user already voted (and preserved previous)."""
-        created_at = datetime.utcnow().isoformat()
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    "INSERT INTO votes (user_id, bill_id, vote_type, created_at) VALUES (?, ?, ?, ?)",
-                    (user_id, bill_id, vote_type, created_at)
+    async def record_vote(self, user_id: int, bill_id: int, vote_type: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Apply one vote click (vote_type None retracts). Returns (outcome, previous vote); see record_votes."""
+        results = await self.record_votes([(user_id, bill_id, vote_type)])
+        return results[0]
+
+    async def submit_vote(self, user_id: int, bill_id: int, vote_type: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Like record_vote, but goes through the group-commit queue."""
+        return await self.vote_queue.submit(user_id, bill_id, vote_type)
+
+    async def record_votes(self, votes: List[Tuple[int, int, Optional[str]]]) -> List[Tuple[str, Optional[str]]]:
+        """Apply a batch of vote clicks (user_id, bill_id, vote_type) in one transaction.
+
+        A vote_type of None retracts the user's vote. Returns one (outcome, previous vote)
+        per click: VOTE_RECORDED for a first vote, VOTE_CHANGED, VOTE_RETRACTED, or
+        VOTE_UNCHANGED for a repeat of the current choice (or retracting nothing), or
+        VOTE_CLOSED when the bill is not in voting by the time the batch is written.
+        Several clicks of one user on one bill apply in order.
+        """
+        now = self.clock.now().isoformat()
+        results: List[Tuple[str, Optional[str]]] = [(VOTE_UNCHANGED, vote_type) for _, _, vote_type in votes]
+        # Each statement may touch a (user, bill) pair once, so repeat clicks go into later rounds
+        rounds: List[List[int]] = []
+        seen: Dict[Tuple[int, int], int] = {}
+        for i, (user_id, bill_id, _) in enumerate(votes):
+            n = seen.get((user_id, bill_id), 0)
+            seen[(user_id, bill_id)] = n + 1
+            if n == len(rounds):
+                rounds.append([])
+            rounds[n].append(i)
+
+        applied: List[Tuple[int, int, Optional[str], Optional[str]]] = []  # (user_id, bill_id, old, new)
+        empty_retractions: List[int] = []  # retracted nothing: no vote, or the bill is not in voting
+        async with self._write() as db:
+            for indexes in rounds:
+                casts = [i for i in indexes if votes[i][2] is not None]
+                retractions = [i for i in indexes if votes[i][2] is None]
+                changed, repeats = {}, set()
+                if casts:
+                    changed, repeats = await self._cast_votes(db, [votes[i] for i in casts], now)
+                if retractions:
+                    changed.update(await self._retract_votes(db, [votes[i] for i in retractions]))
+                for i in indexes:
+                    user_id, bill_id, vote_type = votes[i]
+                    if (user_id, bill_id) in changed:
+                        old = changed[(user_id, bill_id)]
+                        results[i] = (VOTE_RECORDED if old is None else VOTE_CHANGED if vote_type else VOTE_RETRACTED, old)
+                        applied.append((user_id, bill_id, old, vote_type))
+                    elif vote_type is None:
+                        empty_retractions.append(i)
+                    elif (user_id, bill_id) not in repeats:
+                        # The upsert answers for every vote on a bill in voting
+                        results[i] = (VOTE_CLOSED, None)
+
+            # Rare (the retract button without a vote), so only here is the status looked up
+            if empty_retractions:
+                bill_ids = list({votes[i][1] for i in empty_retractions})
+                cursor = await db.execute(
+                    f"SELECT bill_id FROM proposals WHERE status = 'voting' AND bill_id IN ({', '.join('?' * len(bill_ids))})",
+                    bill_ids
+                )
+                open_bills = {row["bill_id"] for row in await cursor.fetchall()}
+                for i in empty_retractions:
+                    if votes[i][1] not in open_bills:
+                        results[i] = (VOTE_CLOSED, None)
+
+            audit = [(bill_id, user_id, old, new, now) for user_id, bill_id, old, new in applied if old is not None]
+            if audit:
+                await db.executemany(
+                    "INSERT INTO vote_audit (bill_id, user_id, old_type, new_type, at) VALUES (?, ?, ?, ?, ?)", audit
                 )
-                # increment counts
-                if vote_type == "yes":
-                    await db.execute("UPDATE proposals SET yes_count = yes_count + 1 WHERE bill_id = ?", (bill_id,))
-                elif vote_type == "no":
-                    await db.execute("UPDATE proposals SET no_count = no_count + 1 WHERE bill_id = ?", (bill_id,))
-                else:
-                    await db.execute("UPDATE proposals SET abstain_count = abstain_count + 1 WHERE bill_id = ?", (bill_id,))
-                await db.commit()
-            return True
-        except aiosqlite.IntegrityError:
-            # Unique constraint: user already voted
-            return False
+
+            # Bills with live counters are counted in memory after commit;
+            # any other bill gets one counter UPDATE here (old choice -1, new choice +1)
+            deltas: Dict[int, Dict[str, int]] = {}
+            for _, bill_id, old, new in applied:
+                if bill_id in self.tallies:
+                    continue
+                delta = deltas.setdefault(bill_id, {"yes": 0, "no": 0, "abstain": 0})
+                if old is not None:
+                    delta[old] -= 1
+                if new is not None:
+                    delta[new] += 1
+            if deltas:
+                await db.executemany(
+                    "UPDATE proposals SET yes_count = yes_count + ?, no_count = no_count + ?, abstain_count = abstain_count + ? WHERE bill_id = ?",
+                    [(d["yes"], d["no"], d["abstain"], bill_id) for bill_id, d in deltas.items()]
+                )
+        self._proposals_changed(*deltas)
+
+        for _, bill_id, old, new in applied:
+            if bill_id not in deltas:
+                if old is not None:
+                    self.tallies.add(bill_id, old, -1)
+                if new is not None:
+                    self.tallies.add(bill_id, new)
+        return results
+
+    async def _cast_votes(self, db: aiosqlite.Connection, votes: List[Tuple[int, int, str]],
+                          now: str) -> Tuple[Dict[Tuple[int, int], Optional[str]], Set[Tuple[int, int]]]:
+        """Insert, change or repeat votes on bills in voting, one upsert.
+
+        Returns ({(user_id, bill_id): previous choice or None} of rows that changed,
+        {(user_id, bill_id)} of repeats). Votes on bills not in voting are in neither.
+        """
+        # A repeat takes the update branch too (only previous_type moves), so every vote on a bill in
+        # voting returns a row: previous_type is NULL for a fresh insert and equals vote_type for a repeat
+        sql = ("WITH clicks (user_id, bill_id, vote_type, created_at) AS (VALUES {}) "
+               "INSERT INTO votes (user_id, bill_id, vote_type, created_at) SELECT * FROM clicks "
+               "WHERE bill_id IN (SELECT bill_id FROM proposals WHERE status = 'voting') "
+               "ON CONFLICT(user_id, bill_id) DO UPDATE SET previous_type = vote_type, vote_type = excluded.vote_type, "
+               "changed_at = CASE WHEN vote_type IS excluded.vote_type THEN changed_at ELSE excluded.created_at END "
+               "RETURNING user_id, bill_id, vote_type, previous_type")
+        cursor = await db.execute(sql.format(", ".join(["(?, ?, ?, ?)"] * len(votes))),
+                                  [value for vote in votes for value in (*vote, now)])
+        changed, repeats = {}, set()
+        for row in await cursor.fetchall():
+            key = (row["user_id"], row["bill_id"])
+            if row["previous_type"] == row["vote_type"]:
+                repeats.add(key)
+            else:
+                changed[key] = row["previous_type"]
+        return changed, repeats
+
+    async def _retract_votes(self, db: aiosqlite.Connection,
+                             votes: List[Tuple[int, int, None]]) -> Dict[Tuple[int, int], Optional[str]]:
+        """Delete votes on bills in voting, one statement. Returns {(user_id, bill_id): retracted choice} of votes that existed."""
+        cursor = await db.execute(
+            f"DELETE FROM votes WHERE (user_id, bill_id) IN (VALUES {', '.join(['(?, ?)'] * len(votes))}) "
+            "AND bill_id IN (SELECT bill_id FROM proposals WHERE status = 'voting') "
+            "RETURNING user_id, bill_id, vote_type",
+            [value for user_id, bill_id, _ in votes for value in (user_id, bill_id)]
+        )
+        return {(row["user_id"], row["bill_id"]): row["vote_type"] for row in await cursor.fetchall()}
 
     async def get_user_vote(self, user_id: int, bill_id: int) -> Optional[str]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._read() as db:
             cursor = await db.execute("SELECT vote_type FROM votes WHERE user_id = ? AND bill_id = ?", (user_id, bill_id))
             row = await cursor.fetchone()
-            return row["vote_type"] if row else None
+            if row:
+                return row["vote_type"]
+            cursor = await db.execute("SELECT yes, no, abstain FROM vote_archives WHERE bill_id = ?", (bill_id,))
+            archive = await cursor.fetchone()
+        if archive is None:
+            return None
+        for choice in ARCHIVED_CHOICES:
+            ids = _unpack_ids(archive[choice])
+            i = bisect_left(ids, user_id)
+            if i < len(ids) and ids[i] == user_id:
+                return choice
+        return None
 
     async def get_vote_counts(self, bill_id: int) -> Dict[str, int]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        live = self.tallies.get(bill_id)
+        if live is not None:
+            return live
+        async with self._read() as db:
             cur = await db.execute("SELECT yes_count, no_count, abstain_count FROM proposals WHERE bill_id = ?", (bill_id,))
             row = await cur.fetchone()
             if not row:
                 return {"yes": 0, "no": 0, "abstain": 0}
             return {"yes": row["yes_count"], "no": row["no_count"], "abstain": row["abstain_count"]}
 
-    # ---------- Laws and archival ----------
-    async def add_law_from_bill(self, bill_id: int):
-        proposal = await self.get_proposal_by_id(bill_id)
-        if not proposal:
+    # ---------- Live counters ----------
+    async def open_tally(self, bill_id: int, reconcile: bool = False):
+        """Start counting a bill's votes in memory.
+
+        Seeds from the proposals row, or from the votes table when `reconcile` is set
+        (e.g. after a restart, when the last write-back may have been lost).
+        """
+        if reconcile:
+            counts = await self.count_votes(bill_id)
+        else:
+            async with self._read() as db:
+                cur = await db.execute("SELECT yes_count, no_count, abstain_count FROM proposals WHERE bill_id = ?", (bill_id,))
+                row = await cur.fetchone()
+            counts = {"yes": row["yes_count"], "no": row["no_count"], "abstain": row["abstain_count"]} if row else {}
+        self.tallies.seed(bill_id, counts)
+
+    async def count_votes(self, bill_id: int) -> Dict[str, int]:
+        """Authoritative counts straight from the votes table (plus the bill's vote archive, if any)."""
+        async with self._read() as db:
+            return await self._count_votes(db, bill_id)
+
+    @staticmethod
+    async def _count_votes(db: aiosqlite.Connection, bill_id: int) -> Dict[str, int]:
+        counts = {"yes": 0, "no": 0, "abstain": 0}
+        cur = await db.execute("SELECT vote_type, COUNT(*) AS n FROM votes WHERE bill_id = ? GROUP BY vote_type", (bill_id,))
+        for row in await cur.fetchall():
+            counts[row["vote_type"]] = row["n"]
+        cur = await db.execute(
+            "SELECT length(yes) / 8 AS yes, length(no) / 8 AS no, length(abstain) / 8 AS abstain "
+            "FROM vote_archives WHERE bill_id = ?", (bill_id,)
+        )
+        archive = await cur.fetchone()
+        if archive:
+            for choice in ARCHIVED_CHOICES:
+                counts[choice] += archive[choice]
+        return counts
+
+    async def reconcile_vote_counts(self, bill_id: int) -> Dict[str, int]:
+        """Recompute a bill's counts from the votes table, store them and stop counting it in memory."""
+        await self.vote_queue.drain()
+        counts = await self.count_votes(bill_id)
+        self.tallies.drop(bill_id)
+        await self.write_vote_counts([(bill_id, counts)])
+        return counts
+
+    async def write_vote_counts(self, rows: List[Tuple[int, Dict[str, int]]]):
+        if not rows:
+            return
+        async with self._write() as db:
+            await db.executemany(
+                "UPDATE proposals SET yes_count = ?, no_count = ?, abstain_count = ? WHERE bill_id = ?",
+                [(c["yes"], c["no"], c["abstain"], bill_id) for bill_id, c in rows]
+            )
+        for bill_id, c in rows:
+            self._proposal_updated(bill_id, yes_count=c["yes"], no_count=c["no"], abstain_count=c["abstain"])
+
+    # ---------- Ranked and weighted races ----------
+    async def submit_ballot(self, user_id: int, bill_id: int, ranking: bytes, weight: float = 1.0) -> bool:
+        """Store a voter's ballot (encoded with tally_engine.encode_ranking). False if they already cast one."""
+        async with self._write() as db:
+            cursor = await db.execute(
+                "INSERT INTO ballots (bill_id, user_id, ranking, weight, created_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(bill_id, user_id) DO NOTHING",
+                (bill_id, user_id, ranking, weight, self.clock.now().isoformat())
+            )
+            return cursor.rowcount == 1
+
+    async def get_ballot(self, user_id: int, bill_id: int) -> Optional[Dict[str, Any]]:
+        async with self._read() as db:
+            cursor = await db.execute("SELECT ranking, weight, created_at FROM ballots WHERE bill_id = ? AND user_id = ?",
+                                      (bill_id, user_id))
+            row = await cursor.fetchone()
+            return dict(row) if row else None
+
+    async def count_ballots(self, bill_id: int) -> int:
+        async with self._read() as db:
+            cursor = await db.execute("SELECT COUNT(*) FROM ballots WHERE bill_id = ?", (bill_id,))
+            return (await cursor.fetchone())[0]
+
+    async def get_ballot_groups(self, bill_id: int) -> List[Tuple[bytes, float, int]]:
+        """(ranking, total weight, voters) per distinct ranking; identical ballots are merged in SQL."""
+        async with self._read() as db:
+            cursor = await db.execute(
+                "SELECT ranking, SUM(weight), COUNT(*) FROM ballots WHERE bill_id = ? GROUP BY ranking", (bill_id,)
+            )
+            return [(row[0], row[1], row[2]) for row in await cursor.fetchall()]
+
+    async def get_tally_rounds(self, bill_id: int) -> List[Dict[str, Any]]:
+        async with self._read() as db:
+            cursor = await db.execute(
+                "SELECT round, counts, exhausted, eliminated FROM tally_rounds WHERE bill_id = ? ORDER BY round", (bill_id,)
+            )
+            return [
+                {"round": row["round"], "counts": {int(k): v for k, v in json.loads(row["counts"]).items()},
+                 "exhausted": row["exhausted"], "eliminated": json.loads(row["eliminated"])}
+                for row in await cursor.fetchall()
+            ]
+
+    # ---------- Vote archives ----------
+    async def get_compactable_bills(self, closed_before: datetime, limit: int = 50) -> List[int]:
+        """Closed bills that ended before `closed_before` and still have individual vote rows."""
+        placeholders = ", ".join("?" * len(CLOSED_STATUSES))
+        async with self._read() as db:
+            cursor = await db.execute(
+                f"SELECT bill_id FROM proposals p WHERE status IN ({placeholders}) "
+                "AND COALESCE(vote_end, created_at) < ? "
+                "AND EXISTS (SELECT 1 FROM votes v WHERE v.bill_id = p.bill_id) ORDER BY bill_id LIMIT ?",
+                (*CLOSED_STATUSES, closed_before.isoformat(), limit)
+            )
+            return [row["bill_id"] for row in await cursor.fetchall()]
+
+    async def compact_votes(self, bill_id: int) -> int:
+        """Fold a closed bill's vote rows into its vote archive and delete them. Returns the rows folded."""
+        async with self._write() as db:
+            cursor = await db.execute("SELECT user_id, vote_type FROM votes WHERE bill_id = ?", (bill_id,))
+            rows = await cursor.fetchall()
+            if not rows:
+                return 0
+            cursor = await db.execute("SELECT yes, no, abstain FROM vote_archives WHERE bill_id = ?", (bill_id,))
+            archive = await cursor.fetchone()
+            voters = {choice: list(_unpack_ids(archive[choice])) if archive else [] for choice in ARCHIVED_CHOICES}
+            for row in rows:
+                voters[row["vote_type"]].append(row["user_id"])
+            await db.execute(
+                "INSERT INTO vote_archives (bill_id, yes, no, abstain, archived_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(bill_id) DO UPDATE SET yes = excluded.yes, no = excluded.no, "
+                "abstain = excluded.abstain, archived_at = excluded.archived_at",
+                (bill_id, *(_pack_ids(voters[choice]) for choice in ARCHIVED_CHOICES), self.clock.now().isoformat())
+            )
+            await db.execute("DELETE FROM votes WHERE bill_id = ?", (bill_id,))
+        return len(rows)
+
+    async def get_archived_votes(self, bill_id: int) -> Optional[Dict[str, List[int]]]:
+        """Voter IDs per choice from a bill's vote archive, or None if it has none."""
+        async with self._read() as db:
+            cursor = await db.execute("SELECT yes, no, abstain FROM vote_archives WHERE bill_id = ?", (bill_id,))
+            archive = await cursor.fetchone()
+        if archive is None:
             return None
-        enacted_at = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
+        return {choice: _unpack_ids(archive[choice]).tolist() for choice in ARCHIVED_CHOICES}
+
+    # ---------- Laws and archival ----------
+    async def add_law_from_bill(self, bill_id: int) -> Optional[int]:
+        """Enact a bill as a law. Returns the new law_id, or None if the bill is missing or already enacted."""
+        async with self._write() as db:
+            law_id = await self._enact(db, bill_id)
+        if law_id is not None:
+            self._laws_changed()
+        return law_id
+
+    async def _enact(self, db: aiosqlite.Connection, bill_id: int) -> Optional[int]:
+        # laws.bill_id is unique, so enacting twice is a no-op
+        cursor = await db.execute(
+            "INSERT INTO laws (bill_id, title, text, enacted_at, guild_id) "
+            "SELECT bill_id, title, text, ?, guild_id FROM proposals WHERE bill_id = ? "
+            "ON CONFLICT(bill_id) DO NOTHING RETURNING law_id",
+            (self.clock.now().isoformat(), bill_id)
+        )
+        row = await cursor.fetchone()
+        return row["law_id"] if row else None
+
+    async def count_laws(self, guild_id: Optional[int] = None) -> int:
+        key = ("count", guild_id)
+        cached = self.law_cache.get(key)
+        if cached is None:
+            token = self.law_cache.token()
+            async with self._read() as db:
+                cur = await db.execute("SELECT COUNT(*) FROM laws WHERE guild_id IS ?", (guild_id,))
+                cached = (await cur.fetchone())[0]
+            self.law_cache.put(key, cached, token)
+        return cached
+
+    async def get_laws_page(self, guild_id: Optional[int] = None, after: Optional[Tuple[str, int]] = None,
+                            limit: int = 5) -> List[Dict[str, Any]]:
+        """Keyset page of a guild's laws, newest first.
+
+        `after` is the (enacted_at, law_id) of the last law on the previous page.
+        """
+        key = ("page", guild_id, after, limit)
+        cached = self.law_cache.get(key)
+        if cached is not None:
+            return [dict(law) for law in cached]
+        token = self.law_cache.token()
+        async with self._read() as db:
+            if after is None:
+                cur = await db.execute(
+                    "SELECT * FROM laws WHERE guild_id IS ? ORDER BY enacted_at DESC, law_id DESC LIMIT ?",
+                    (guild_id, limit)
+                )
+            else:
+                cur = await db.execute(
+                    "SELECT * FROM laws WHERE guild_id IS ? AND (enacted_at, law_id) < (?, ?) "
+                    "ORDER BY enacted_at DESC, law_id DESC LIMIT ?",
+                    (guild_id, after[0], after[1], limit)
+                )
+            laws = [dict(r) for r in await cur.fetchall()]
+        self.law_cache.put(key, laws, token)
+        return [dict(law) for law in laws]
+
+    async def get_law_key_at(self, offset: int, guild_id: Optional[int] = None) -> Optional[Tuple[str, int]]:
+        """(enacted_at, law_id) of the guild's law at `offset` in newest-first order, read from the index only."""
+        key = ("key_at", guild_id, offset)
+        cached = self.law_cache.get(key, ())
+        if cached != ():
+            return cached
+        token = self.law_cache.token()
+        async with self._read() as db:
             cur = await db.execute(
-                "INSERT INTO laws (bill_id, title, text, enacted_at) VALUES (?, ?, ?, ?)",
-                (bill_id, proposal["title"], proposal["text"], enacted_at)
+                "SELECT enacted_at, law_id FROM laws WHERE guild_id IS ? ORDER BY enacted_at DESC, law_id DESC LIMIT 1 OFFSET ?",
+                (guild_id, offset)
             )
-            await db.commit()
-            return cur.lastrowid
+            row = await cur.fetchone()
+        law_key = (row["enacted_at"], row["law_id"]) if row else None
+        self.law_cache.put(key, law_key, token)
+        return law_key
 
-    async def get_all_approved_laws(self) -> List[Dict[str, Any]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cur = await db.execute("SELECT * FROM laws ORDER BY enacted_at DESC")
+    # ---------- Search ----------
+    async def search_laws(self, query: str, limit: int = 10, highlight: Tuple[str, str] = ("**", "**"),
+                          guild_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Laws matching `query` (in one guild, if given), best match first, with a highlighted snippet of the text."""
+        match = _fts_query(query)
+        if not match:
+            return []
+        async with self._read() as db:
+            cur = await db.execute(
+                """
+                SELECT l.law_id, l.bill_id, l.title, l.enacted_at,
+                       snippet(laws_fts, 1, ?, ?, '…', 24) AS snippet,
+                       bm25(laws_fts, 5.0, 1.0) AS rank
+                FROM laws_fts JOIN laws l ON l.law_id = laws_fts.rowid
+                WHERE laws_fts MATCH ? AND (? IS NULL OR l.guild_id = ?)
+                ORDER BY rank LIMIT ?
+                """,
+                (highlight[0], highlight[1], match, guild_id, guild_id, limit)
+            )
             rows = await cur.fetchall()
             return [dict(r) for r in rows]
 
-    # ---------- Staff actions ----------
-    async def veto_bill(self, bill_id: int, reason: Optional[str] = None) -> bool:
-        prop = await self.get_proposal_by_id(bill_id)
-        if not prop:
-            return False
-        await self.set_status(bill_id, "vetoed")
+    async def search_proposals(self, query: str, limit: int = 10, highlight: Tuple[str, str] = ("**", "**"),
+                               guild_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Proposals matching `query` (in one guild, if given), best match first, with a highlighted snippet of the text."""
+        match = _fts_query(query)
+        if not match:
+            return []
+        async with self._read() as db:
+            cur = await db.execute(
+                """
+                SELECT p.bill_id, p.title, p.status, p.created_at,
+                       snippet(proposals_fts, 1, ?, ?, '…', 24) AS snippet,
+                       bm25(proposals_fts, 5.0, 1.0) AS rank
+                FROM proposals_fts JOIN proposals p ON p.bill_id = proposals_fts.rowid
+                WHERE proposals_fts MATCH ? AND (? IS NULL OR p.guild_id = ?)
+                ORDER BY rank LIMIT ?
+                """,
+                (highlight[0], highlight[1], match, guild_id, guild_id, limit)
+            )
+            rows = await cur.fetchall()
+            return [dict(r) for r in rows]
+
+    # ---------- Guild configuration ----------
+    async def get_guild_configs(self) -> List[Dict[str, Any]]:
+        async with self._read() as db:
+            cur = await db.execute("SELECT * FROM guild_config")
+            rows = await cur.fetchall()
+            return [dict(r) for r in rows]
+
+    async def upsert_guild_config(self, guild_id: int, fields: Dict[str, Any]):
+        columns = list(fields)
+        async with self._write() as db:
+            await db.execute("INSERT OR IGNORE INTO guild_config (guild_id) VALUES (?)", (guild_id,))
+            if columns:
+                assignments = ", ".join(f"{column} = ?" for column in columns)
+                await db.execute(
+                    f"UPDATE guild_config SET {assignments} WHERE guild_id = ?",
+                    [fields[column] for column in columns] + [guild_id]
+                )
+
+    async def adopt_unscoped_rows(self, guild_id: int):
+        """Assign proposals and laws created before multi-guild support to `guild_id`."""
+        async with self._write() as db:
+            await db.execute("UPDATE proposals SET guild_id = ? WHERE guild_id IS NULL", (guild_id,))
+            await db.execute("UPDATE laws SET guild_id = ? WHERE guild_id IS NULL", (guild_id,))
+        self.proposal_cache.clear()
+        self._laws_changed()
+
+    # ---------- Export ----------
+    async def iter_export(self, kind: str, status: Optional[str] = None, since: Optional[datetime] = None,
+                          until: Optional[datetime] = None, guild_id: Optional[int] = None,
+                          bill_id: Optional[int] = None, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every row of `kind` (laws/proposals/votes) matching the filters, oldest key first.
+
+        Rows are fetched in keyset-paginated batches, each on a briefly borrowed reader,
+        so memory stays flat and a slow consumer never holds a pooled connection.
+        `since` is inclusive, `until` exclusive. Archived votes (see compact_votes) come
+        last, without vote_id or created_at, and only when no date range is given.
+        """
+        columns, source, key, guild_column, time_column = EXPORT_QUERIES[kind]
+        sql = (
+            f"SELECT {columns}, {key} AS export_key FROM {source} "
+            f"WHERE {key} > ? AND (? IS NULL OR {guild_column} = ?) AND (? IS NULL OR p.status = ?) "
+            f"AND (? IS NULL OR p.bill_id = ?) AND (? IS NULL OR {time_column} >= ?) AND (? IS NULL OR {time_column} < ?) "
+            f"ORDER BY {key} LIMIT ?"
+        )
+        since_s = since.isoformat() if since else None
+        until_s = until.isoformat() if until else None
+        last = -1
+        while True:
+            async with self._read() as db:
+                cursor = await db.execute(sql, (last, guild_id, guild_id, status, status, bill_id, bill_id,
+                                                since_s, since_s, until_s, until_s, batch_size))
+                rows = await cursor.fetchall()
+            for row in rows:
+                record = dict(row)
+                last = record.pop("export_key")
+                yield record
+            if len(rows) < batch_size:
+                break
+        if kind != "votes" or since or until:
+            return
+
+        last = -1
+        while True:
+            async with self._read() as db:
+                cursor = await db.execute(
+                    "SELECT a.* FROM vote_archives a JOIN proposals p ON p.bill_id = a.bill_id "
+                    "WHERE a.bill_id > ? AND (? IS NULL OR p.guild_id = ?) AND (? IS NULL OR p.status = ?) "
+                    "AND (? IS NULL OR a.bill_id = ?) ORDER BY a.bill_id LIMIT 1",
+                    (last, guild_id, guild_id, status, status, bill_id, bill_id)
+                )
+                archive = await cursor.fetchone()
+            if archive is None:
+                return
+            last = archive["bill_id"]
+            for choice in ARCHIVED_CHOICES:
+                for user_id in _unpack_ids(archive[choice]):
+                    yield {"vote_id": None, "bill_id": last, "user_id": user_id, "vote_type": choice, "created_at": None}
+
+    # ---------- Bill lifecycle ----------
+    # awaiting -> debating -> voting -> passed/failed (majority) or decided (races); any -> vetoed.
+    # voting -> awaiting/debating only undoes an open_vote whose message never went out.
+    # Every method returns None when the bill is not in a status the transition starts from.
+    async def _transition(self, db: aiosqlite.Connection, bill_id: int, transition: str, assignments: str,
+                          params: Tuple = ()) -> Optional[Dict[str, Any]]:
+        allowed = TRANSITIONS[transition]
+        placeholders = ", ".join("?" * len(allowed))
+        cursor = await db.execute(
+            f"UPDATE proposals SET {assignments} WHERE bill_id = ? AND status IN ({placeholders}) RETURNING *",
+            (*params, bill_id, *allowed)
+        )
+        row = await cursor.fetchone()
+        BILL_TRANSITIONS.inc(transition=transition, result="applied" if row else "skipped")
+        return dict(row) if row else None
+
+    async def open_debate(self, bill_id: int, vote_start: datetime, vote_end: datetime) -> Optional[Dict[str, Any]]:
+        async with self._write() as db:
+            prop = await self._transition(db, bill_id, "open_debate", "status = ?, vote_start = ?, vote_end = ?",
+                                          ("debating", vote_start.isoformat(), vote_end.isoformat()))
+        if prop:
+            self.proposal_cache.update(bill_id, prop)
+        return prop
+
+    async def open_vote(self, bill_id: int, vote_start: datetime, vote_end: datetime,
+                        keep_scheduled: bool = False) -> Optional[Dict[str, Any]]:
+        """Open voting. With `keep_scheduled`, times already stored for the bill win over the ones given."""
+        times = "vote_start = COALESCE(vote_start, ?), vote_end = COALESCE(vote_end, ?)" if keep_scheduled \
+            else "vote_start = ?, vote_end = ?"
+        async with self._write() as db:
+            prop = await self._transition(db, bill_id, "open_vote", f"status = ?, {times}",
+                                          ("voting", vote_start.isoformat(), vote_end.isoformat()))
+        if prop:
+            self.proposal_cache.update(bill_id, prop)
+        return prop
+
+    async def cancel_vote(self, before: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Undo open_vote: put the bill back to `before` (its row as read before opening), status and times."""
+        if before["status"] not in TRANSITIONS["open_vote"]:
+            raise ValueError(f"Cannot return a bill to {before['status']!r}")
+        async with self._write() as db:
+            prop = await self._transition(db, before["bill_id"], "cancel_vote", "status = ?, vote_start = ?, vote_end = ?",
+                                          (before["status"], before["vote_start"], before["vote_end"]))
+        if prop:
+            self.proposal_cache.update(before["bill_id"], prop)
+        return prop
+
+    async def close_bill(self, bill_id: int) -> Optional[Tuple[Dict[str, Any], Dict[str, int], Optional[int]]]:
+        """Close a majority vote: recount, store the outcome (yes > no passes) and enact it, in one transaction.
+
+        Returns (proposal, counts, law_id or None).
+        """
+        # Counts come from the votes table, so unflushed counters and queued votes cannot skew them
+        await self.vote_queue.drain()
+        self.tallies.drop(bill_id)
+        law_id = None
+        async with self._write() as db:
+            counts = await self._count_votes(db, bill_id)
+            passed = counts["yes"] > counts["no"]
+            prop = await self._transition(db, bill_id, "close",
+                                          "status = ?, yes_count = ?, no_count = ?, abstain_count = ?",
+                                          ("passed" if passed else "failed", counts["yes"], counts["no"], counts["abstain"]))
+            if prop and passed:
+                law_id = await self._enact(db, bill_id)
+        if prop is None:
+            return None
+        self.proposal_cache.update(bill_id, prop)
+        if law_id is not None:
+            self._laws_changed()
+        return prop, counts, law_id
+
+    async def decide_race(self, bill_id: int, result: TallyResult) -> Optional[Dict[str, Any]]:
+        """Close a ranked/weighted race with its counted result: status, winner and per-round breakdown together."""
+        async with self._write() as db:
+            prop = await self._transition(db, bill_id, "close", "status = ?, winner = ?", ("decided", result.winner))
+            if prop:
+                await db.execute("DELETE FROM tally_rounds WHERE bill_id = ?", (bill_id,))
+                await db.executemany(
+                    "INSERT INTO tally_rounds (bill_id, round, counts, exhausted, eliminated) VALUES (?, ?, ?, ?, ?)",
+                    [(bill_id, number, json.dumps(r.counts), r.exhausted, json.dumps(r.eliminated))
+                     for number, r in enumerate(result.rounds, start=1)]
+                )
+        if prop:
+            self.proposal_cache.update(bill_id, prop)
+        return prop
+
+    async def veto_bill(self, bill_id: int, reason: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Veto a bill in any status, even after passage. None if it does not exist or is already vetoed."""
+        async with self._write() as db:
+            prop = await self._transition(db, bill_id, "veto", "status = ?", ("vetoed",))
+        if prop is None:
+            return None
+        self.proposal_cache.update(bill_id, prop)
         # keep vote counts for record but mark as vetoed
-        return True
+        if bill_id in self.tallies:
+            await self.reconcile_vote_counts(bill_id)
+        return prop
 
     async def remove_bill(self, bill_id: int) -> bool:
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("DELETE FROM proposals WHERE bill_id = ?", (bill_id,))
-            await db.commit()
-            return True
+        self.tallies.drop(bill_id)
+        async with self._write() as db:
+            cursor = await db.execute("DELETE FROM proposals WHERE bill_id = ? RETURNING bill_id", (bill_id,))
+            removed = await cursor.fetchone() is not None
+        BILL_TRANSITIONS.inc(transition="remove", result="applied" if removed else "skipped")
+        self._proposals_changed(bill_id)
+        return removed
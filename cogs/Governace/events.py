@@ -0,0 +1,164 @@
+# cogs/Governace/events.py
+# In-process event bus for the bill lifecycle. ProposalForm and the Governance cog publish
+# typed events; subscribers (debate posting, live tallies, metrics, dashboard feeds) each
+# consume them from their own bounded queue in a background task.
+import asyncio
+import traceback
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from metrics import REGISTRY
+
+EVENTS_PUBLISHED = REGISTRY.counter("governance_events_total", "Governance events published, by type.", ["event"])
+EVENTS_DROPPED = REGISTRY.counter(
+    "governance_events_dropped_total", "Events a lossy subscriber dropped because it fell behind.", ["subscriber"])
+SUBSCRIBER_BACKLOG = REGISTRY.gauge("governance_event_backlog", "Events waiting in a subscriber's queue.", ["subscriber"])
+
+
+# ---------- Events ----------
+@dataclass(frozen=True)
+class GovernanceEvent:
+    bill_id: int
+    at: datetime = field(default_factory=datetime.utcnow, compare=False)
+
+
+@dataclass(frozen=True)
+class ProposalCreated(GovernanceEvent):
+    guild_id: Optional[int] = None
+    proposer_id: Optional[int] = None
+    title: str = ""
+
+
+@dataclass(frozen=True)
+class DebateOpened(GovernanceEvent):
+    guild_id: Optional[int] = None
+    vote_start: Optional[datetime] = None
+    vote_end: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class VotingOpened(GovernanceEvent):
+    guild_id: Optional[int] = None
+    vote_end: Optional[datetime] = None
+    tally_method: str = "majority"
+
+
+@dataclass(frozen=True)
+class VoteCast(GovernanceEvent):
+    user_id: int = 0
+    choice: Optional[str] = ""  # yes/no/abstain, None when retracted, or "ballot" for ranked and weighted races
+    previous: Optional[str] = None  # the choice this vote replaced or retracted
+
+
+@dataclass(frozen=True)
+class BillClosed(GovernanceEvent):
+    guild_id: Optional[int] = None
+    status: str = ""  # passed/failed/decided
+    counts: Dict[str, float] = field(default_factory=dict, compare=False)
+
+
+@dataclass(frozen=True)
+class BillVetoed(GovernanceEvent):
+    guild_id: Optional[int] = None
+    reason: Optional[str] = None
+
+
+EventTypes = Union[Type[GovernanceEvent], Tuple[Type[GovernanceEvent], ...]]
+Handler = Callable[[GovernanceEvent], Awaitable[None]]
+
+
+# ---------- Bus ----------
+class Subscription:
+    """One subscriber: a bounded queue drained in order by its own task.
+
+    When the queue is full, a lossless subscription makes publishers wait (backpressure);
+    a lossy one drops its oldest event instead, for consumers that only need recent state.
+    """
+
+    def __init__(self, name: str, event_types: EventTypes, handler: Handler, maxsize: int, lossy: bool):
+        self.name = name
+        self.event_types = event_types
+        self.handler = handler
+        self.lossy = lossy
+        self.queue: "asyncio.Queue[GovernanceEvent]" = asyncio.Queue(maxsize)
+        self._task: Optional[asyncio.Task] = None
+        SUBSCRIBER_BACKLOG.set_function(self.queue.qsize, subscriber=name)
+
+    def wants(self, event: GovernanceEvent) -> bool:
+        return isinstance(event, self.event_types)
+
+    async def offer(self, event: GovernanceEvent):
+        if not self.lossy:
+            await self.queue.put(event)
+            return
+        while self.queue.full():
+            self.queue.get_nowait()
+            self.queue.task_done()
+            EVENTS_DROPPED.inc(subscriber=self.name)
+        self.queue.put_nowait(event)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self, drain: bool = True):
+        if self._task is None:
+            return
+        if drain:
+            await self.queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            event = await self.queue.get()
+            try:
+                await self.handler(event)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self.queue.task_done()
+
+
+class EventBus:
+    """Fan-out of governance events to subscribers. Events queue up until start()."""
+
+    def __init__(self):
+        self._subscriptions: List[Subscription] = []
+        self.running = False
+
+    def subscribe(self, event_types: EventTypes, handler: Handler, name: Optional[str] = None,
+                  maxsize: int = 1000, lossy: bool = False) -> Subscription:
+        subscription = Subscription(name or getattr(handler, "__qualname__", repr(handler)), event_types, handler,
+                                    maxsize, lossy)
+        self._subscriptions.append(subscription)
+        if self.running:
+            subscription.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            asyncio.get_running_loop().create_task(subscription.stop(drain=False))
+
+    async def publish(self, event: GovernanceEvent):
+        """Hand `event` to every interested subscriber; waits only while a lossless queue is full."""
+        EVENTS_PUBLISHED.inc(event=type(event).__name__)
+        for subscription in list(self._subscriptions):
+            if subscription.wants(event):
+                await subscription.offer(event)
+
+    def start(self):
+        self.running = True
+        for subscription in self._subscriptions:
+            subscription.start()
+
+    async def stop(self, drain: bool = True):
+        """Stop every subscriber, by default after it has handled what is already queued."""
+        self.running = False
+        await asyncio.gather(*(subscription.stop(drain) for subscription in self._subscriptions))
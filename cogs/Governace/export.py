@@ -0,0 +1,89 @@
+# cogs/Governace/export.py
+# Streaming exports of governance history (laws, proposals, vote records) as NDJSON or CSV,
+# served by the dashboard (dashboard_routes.py) and the /governance export command.
+import csv
+import io
+import json
+import zlib
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Optional
+
+from .db_manager import DBManager, EXPORT_QUERIES
+
+EXPORT_KINDS = tuple(EXPORT_QUERIES)
+EXPORT_FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Encoded output is handed on in pieces of about this many bytes.
+CHUNK_SIZE = 64 * 1024
+
+# Columns left out of public exports (the dashboard's): who voted how stays with the server's staff.
+PRIVATE_COLUMNS = {"votes": ("user_id",)}
+
+
+def naive_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    """Timestamps in the database are naive UTC; bring filter bounds to the same form."""
+    if dt is not None and dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def export_filename(kind: str, fmt: str, compress: bool = False) -> str:
+    return f"{kind}.{fmt}" + (".gz" if compress else "")
+
+
+async def without_columns(rows: AsyncIterator[Dict[str, Any]], columns) -> AsyncIterator[Dict[str, Any]]:
+    async for row in rows:
+        for column in columns:
+            row.pop(column, None)
+        yield row
+
+
+async def encode_rows(rows: AsyncIterator[Dict[str, Any]], fmt: str) -> AsyncIterator[bytes]:
+    """Encode rows as NDJSON lines or CSV (header from the first row's columns)."""
+    buffer = io.StringIO()
+    writer = None
+    async for row in rows:
+        if fmt == "csv":
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(row, ensure_ascii=False))
+            buffer.write("\n")
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip a byte stream on the fly."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip header and trailer
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_stream(db: DBManager, kind: str, fmt: str = "ndjson", compress: bool = False,
+                  status: Optional[str] = None, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                  guild_id: Optional[int] = None, bill_id: Optional[int] = None,
+                  public: bool = False) -> AsyncIterator[bytes]:
+    """The encoded (and optionally gzipped) export of `kind`, produced as it is read.
+
+    `public` leaves out PRIVATE_COLUMNS, for exports anyone can download.
+    """
+    if kind not in EXPORT_KINDS:
+        raise ValueError(f"Unknown export: {kind}")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    rows = db.iter_export(kind, status=status, since=naive_utc(since), until=naive_utc(until),
+                          guild_id=guild_id, bill_id=bill_id)
+    if public and kind in PRIVATE_COLUMNS:
+        rows = without_columns(rows, PRIVATE_COLUMNS[kind])
+    chunks = encode_rows(rows, fmt)
+    return gzip_chunks(chunks) if compress else chunks
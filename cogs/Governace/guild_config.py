@@ -0,0 +1,77 @@
+# cogs/Governace/guild_config.py
+from typing import Any, Dict, Optional
+
+import discord
+
+from . import constants
+
+# Columns of the guild_config table that can be set per guild
+CONFIG_FIELDS = (
+    "proposals_channel_id",
+    "debate_channel_id",
+    "voting_channel_id",
+    "announcements_channel_id",
+    "past_legislation_channel_id",
+    "statutes_channel_id",
+    "proposer_role_id",
+    "moderator_role_id",
+    "constitution_url",
+)
+
+
+def legacy_config() -> Dict[str, Any]:
+    """The single-guild settings from constants.py, as a guild_config row."""
+    return {
+        "proposals_channel_id": constants.PROPOSALS_CHANNEL_ID,
+        "debate_channel_id": getattr(constants, "DEBATE_CHANNEL_ID", None),
+        "voting_channel_id": constants.VOTING_CHANNEL_ID,
+        "announcements_channel_id": constants.ANNOUNCEMENTS_CHANNEL_ID,
+        "past_legislation_channel_id": constants.PAST_LEGISLATION_CHANNEL_ID,
+        "statutes_channel_id": constants.STATUTES_AND_ACTS_CHANNEL_ID,
+        "proposer_role_id": constants.PROPOSER_ROLE_ID,
+        "moderator_role_id": getattr(constants, "MODERATOR_ROLE_ID", None),
+        "constitution_url": getattr(constants, "CONSTITUTION_URL", None),
+    }
+
+
+class GuildConfigStore:
+    """Per-guild channel/role settings, loaded once and served from memory by guild_id."""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._configs: Dict[int, Dict[str, Any]] = {}
+
+    async def load(self):
+        self._configs = {row["guild_id"]: row for row in await self.db_manager.get_guild_configs()}
+
+    def get(self, guild_id: Optional[int]) -> Dict[str, Any]:
+        """Settings for a guild; an empty dict if the guild is not configured."""
+        return self._configs.get(guild_id, {}) if guild_id is not None else {}
+
+    async def update(self, guild_id: int, **fields):
+        unknown = set(fields) - set(CONFIG_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown guild config fields: {', '.join(sorted(unknown))}")
+        await self.db_manager.upsert_guild_config(guild_id, fields)
+        config = self._configs.setdefault(guild_id, {"guild_id": guild_id, **{f: None for f in CONFIG_FIELDS}})
+        config.update(fields)
+
+    def channel(self, bot: discord.Client, guild_id: Optional[int], field: str):
+        """Resolve a configured channel of a guild from the bot's cache."""
+        channel_id = self.get(guild_id).get(field)
+        return bot.get_channel(channel_id) if channel_id else None
+
+    async def adopt_legacy_guild(self, bot: discord.Client) -> Optional[int]:
+        """Turn the constants.py setup into the config of the guild that owns those channels.
+
+        Also assigns bills and laws created before multi-guild support to that guild.
+        Returns the adopted guild id, or None if the channels are not visible.
+        """
+        channel = bot.get_channel(constants.PROPOSALS_CHANNEL_ID)
+        if channel is None or getattr(channel, "guild", None) is None:
+            return None
+        guild_id = channel.guild.id
+        if guild_id not in self._configs:
+            await self.update(guild_id, **legacy_config())
+        await self.db_manager.adopt_unscoped_rows(guild_id)
+        return guild_id
@@ -0,0 +1,195 @@
+# cogs/Governace/live_feed.py
+# Live governance feed for the dashboard (Server-Sent Events). The bot turns governance
+# events into updates, encodes each one once and fans the same bytes out to every
+# connected client. An out-of-process dashboard relays the bot's feed over IPC into its
+# own hub, so the bot produces one stream per dashboard process, not per browser.
+import asyncio
+import dataclasses
+import itertools
+import json
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional, Set, Tuple
+
+from metrics import REGISTRY
+
+from .events import (EventBus, GovernanceEvent, ProposalCreated, DebateOpened, VotingOpened, VoteCast, BillClosed,
+                     BillVetoed)
+
+FEED_CLIENTS = REGISTRY.gauge("governance_feed_clients", "Clients connected to the live governance feed.")
+FEED_DROPPED = REGISTRY.counter("governance_feed_dropped_total", "Feed updates dropped for clients that fell behind.")
+
+# Seconds between keepalive comments on an idle stream (also how disconnects get noticed)
+HEARTBEAT_SECONDS = 15
+
+FEED_EVENTS = {
+    ProposalCreated: "proposal",
+    DebateOpened: "debate",
+    VotingOpened: "voting",
+    BillClosed: "closed",
+    BillVetoed: "vetoed",
+}
+
+
+def encode_sse(kind: str, data: Dict[str, Any], seq: int) -> bytes:
+    return f"id: {seq}\nevent: {kind}\ndata: {json.dumps(data, default=str)}\n\n".encode()
+
+
+class FeedClient:
+    """One consumer's buffer of encoded updates.
+
+    Updates with the same key (e.g. the tally of one bill) replace each other while
+    waiting, so a slow client gets the latest state instead of every step. Past
+    `maxsize` pending updates the oldest are dropped.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.pending: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self.dropped = 0
+        self._wakeup = asyncio.Event()
+
+    def push(self, key: Hashable, payload: bytes):
+        self.pending.pop(key, None)
+        self.pending[key] = payload
+        while len(self.pending) > self.maxsize:
+            self.pending.popitem(last=False)
+            self.dropped += 1
+            FEED_DROPPED.inc()
+        self._wakeup.set()
+
+    async def next_batch(self, timeout: Optional[float] = None) -> List[Tuple[Hashable, bytes]]:
+        """Everything pending, oldest first; empty if nothing arrived within `timeout`."""
+        if not self.pending:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        batch = list(self.pending.items())
+        self.pending.clear()
+        return batch
+
+
+class FeedHub:
+    """Fan-out of encoded feed updates to every connected client."""
+
+    def __init__(self, client_buffer: int = 256):
+        self.client_buffer = client_buffer
+        self._clients: Set[FeedClient] = set()
+        self._seq = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def publish(self, kind: str, data: Dict[str, Any], key: Optional[Hashable] = None):
+        """Encode an update once and queue it for every client. Updates sharing a key coalesce."""
+        seq = next(self._seq)
+        self.publish_encoded(encode_sse(kind, data, seq), ("seq", seq) if key is None else key)
+
+    def publish_encoded(self, payload: bytes, key: Optional[Hashable] = None):
+        if key is None:
+            key = ("seq", next(self._seq))
+        for client in self._clients:
+            client.push(key, payload)
+
+    def connect(self) -> FeedClient:
+        client = FeedClient(self.client_buffer)
+        self._clients.add(client)
+        FEED_CLIENTS.set(len(self._clients))
+        return client
+
+    def disconnect(self, client: FeedClient):
+        self._clients.discard(client)
+        FEED_CLIENTS.set(len(self._clients))
+
+    async def sse(self) -> AsyncIterator[bytes]:
+        """One client's Server-Sent Events stream."""
+        client = self.connect()
+        try:
+            yield b": connected\n\n"
+            while True:
+                batch = await client.next_batch(HEARTBEAT_SECONDS)
+                yield b"".join(payload for _, payload in batch) if batch else b": keepalive\n\n"
+        finally:
+            self.disconnect(client)
+
+    async def relay_items(self) -> AsyncIterator[List[List[Any]]]:
+        """Batches of [key, payload] for a downstream hub (served over IPC). Empty batches are heartbeats."""
+        client = self.connect()
+        try:
+            while True:
+                batch = await client.next_batch(HEARTBEAT_SECONDS)
+                # Coalescing keys survive the trip; one-off updates get fresh keys downstream
+                yield [[key if isinstance(key, str) else None, payload.decode()] for key, payload in batch]
+        finally:
+            self.disconnect(client)
+
+
+async def relay_ipc_feed(client, hub: FeedHub, retry_seconds: float = 2.0):
+    """Feed a dashboard process's hub from the bot's feed over IPC, reconnecting when it drops."""
+    while True:
+        try:
+            async for batch in client.stream("governance_feed"):
+                for key, payload in batch:
+                    hub.publish_encoded(payload.encode(), key)
+        except (ConnectionError, RuntimeError) as e:
+            print(f"Live feed relay: {e}; retrying in {retry_seconds:.0f}s")
+        await asyncio.sleep(retry_seconds)
+
+
+class LiveFeed:
+    """Bot-side producer: governance events become feed updates.
+
+    Lifecycle events are published as they come. Votes only mark their bill; its
+    tally is published at most once per `interval`, and not at all while nobody listens.
+    """
+
+    def __init__(self, db_manager, events: EventBus, interval: float = 1.0):
+        self.db_manager = db_manager
+        self.interval = interval
+        self.hub = FeedHub()
+        self._dirty: Dict[int, bool] = {}  # bill_id -> is a ranked/weighted race
+        self._pending = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        events.subscribe(tuple(FEED_EVENTS), self._on_event, name="live_feed", lossy=True)
+        events.subscribe(VoteCast, self._on_vote, name="live_feed_votes", maxsize=10000, lossy=True)
+
+    async def _on_event(self, event: GovernanceEvent):
+        if self.hub:
+            self.hub.publish(FEED_EVENTS[type(event)], dataclasses.asdict(event))
+
+    async def _on_vote(self, event: VoteCast):
+        if self.hub:
+            self._dirty[event.bill_id] = event.choice == "ballot"
+            self._pending.set()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            await self._pending.wait()
+            await asyncio.sleep(self.interval)
+            self._pending.clear()
+            dirty, self._dirty = self._dirty, {}
+            for bill_id, is_race in dirty.items():
+                try:
+                    if is_race:
+                        data = {"bill_id": bill_id, "ballots": await self.db_manager.count_ballots(bill_id)}
+                    else:
+                        data = {"bill_id": bill_id, "counts": await self.db_manager.get_vote_counts(bill_id)}
+                except Exception as e:
+                    print(f"Live feed: could not read the tally of bill #{bill_id}: {e}")
+                    continue
+                self.hub.publish("tally", data, key=f"tally:{bill_id}")
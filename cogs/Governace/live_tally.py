@@ -0,0 +1,82 @@
+# cogs/Governace/live_tally.py
+import asyncio
+import traceback
+from datetime import datetime
+from typing import Optional, Set
+
+import discord
+
+from .ui_components import build_ballot_embed, build_vote_embed
+
+
+class LiveTally:
+    """Keeps voting messages showing the current tally without flooding Discord.
+
+    Votes only mark their bill dirty. One background task wakes at most once per
+    `interval` and edits each dirty message once, so the number of HTTP calls is
+    bounded by open bills per interval, not by votes cast.
+    """
+
+    def __init__(self, bot: discord.Client, db_manager, guild_configs, interval: float = 15):
+        self.bot = bot
+        self.db_manager = db_manager
+        self.guild_configs = guild_configs
+        self.interval = interval
+        self._dirty: Set[int] = set()
+        self._pending = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def mark_dirty(self, bill_id: int):
+        self._dirty.add(bill_id)
+        self._pending.set()
+
+    async def _run(self):
+        while True:
+            await self._pending.wait()
+            # Everything that arrives during this window shares one edit per message
+            await asyncio.sleep(self.interval)
+            self._pending.clear()
+            dirty, self._dirty = self._dirty, set()
+            for bill_id in dirty:
+                try:
+                    await self.refresh(bill_id)
+                except Exception:
+                    traceback.print_exc()
+
+    async def refresh(self, bill_id: int):
+        """Edit the bill's voting message to show the current counts."""
+        prop = await self.db_manager.get_proposal_by_id(bill_id)
+        if not prop or prop["status"] != "voting" or not prop.get("vote_message_id"):
+            return
+        voting_ch = self.guild_configs.channel(self.bot, prop["guild_id"], "voting_channel_id")
+        if not voting_ch:
+            return
+        member_count = voting_ch.guild.member_count if getattr(voting_ch, "guild", None) else None
+        vote_start = datetime.fromisoformat(prop["vote_start"])
+        vote_end = datetime.fromisoformat(prop["vote_end"])
+        if prop["tally_method"] != "majority":
+            # Races only show turnout while open; rankings are counted at the close
+            ballots_cast = await self.db_manager.count_ballots(bill_id)
+            embed = build_ballot_embed(prop, vote_start, vote_end, ballots_cast, member_count)
+        else:
+            counts = await self.db_manager.get_vote_counts(bill_id)
+            embed = build_vote_embed(prop, vote_start, vote_end, counts, member_count)
+        await voting_ch.get_partial_message(prop["vote_message_id"]).edit(embed=embed)
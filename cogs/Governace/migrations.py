@@ -0,0 +1,234 @@
+# cogs/Governace/migrations.py
+import time
+from datetime import datetime
+from typing import List, Tuple
+
+# Ordered schema steps, applied once each and tracked with PRAGMA user_version.
+# Never edit a step that has shipped; append a new one instead.
+MIGRATIONS: List[Tuple[int, str, str]] = [
+    (1, "initial schema", """
+        CREATE TABLE IF NOT EXISTS proposals (
+            bill_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            text TEXT NOT NULL,
+            proposer_id INTEGER NOT NULL,
+            proposal_message_id INTEGER,
+            debate_message_id INTEGER,
+            vote_message_id INTEGER,
+            status TEXT NOT NULL DEFAULT 'awaiting', -- awaiting, debating, voting, passed, failed, vetoed, archived
+            created_at TEXT NOT NULL,
+            vote_start TEXT,
+            vote_end TEXT,
+            yes_count INTEGER DEFAULT 0,
+            no_count INTEGER DEFAULT 0,
+            abstain_count INTEGER DEFAULT 0
+        );
+
+        CREATE TABLE IF NOT EXISTS votes (
+            vote_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            bill_id INTEGER NOT NULL,
+            vote_type TEXT NOT NULL, -- yes/no/abstain
+            created_at TEXT NOT NULL,
+            UNIQUE(user_id, bill_id),
+            FOREIGN KEY(bill_id) REFERENCES proposals(bill_id) ON DELETE CASCADE
+        );
+
+        CREATE TABLE IF NOT EXISTS laws (
+            law_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            bill_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            text TEXT NOT NULL,
+            enacted_at TEXT NOT NULL
+        );
+        """),
+    (2, "scheduled events", """
+        CREATE TABLE IF NOT EXISTS scheduled_events (
+            bill_id INTEGER NOT NULL,
+            kind TEXT NOT NULL, -- vote_start/vote_end
+            due_at TEXT NOT NULL,
+            PRIMARY KEY(bill_id, kind),
+            FOREIGN KEY(bill_id) REFERENCES proposals(bill_id) ON DELETE CASCADE
+        );
+
+        -- Adopt deadlines of bills scheduled before scheduled_events existed
+        INSERT OR IGNORE INTO scheduled_events (bill_id, kind, due_at)
+            SELECT bill_id, 'vote_start', vote_start FROM proposals
+            WHERE status = 'debating' AND vote_start IS NOT NULL;
+        INSERT OR IGNORE INTO scheduled_events (bill_id, kind, due_at)
+            SELECT bill_id, 'vote_end', vote_end FROM proposals
+            WHERE status IN ('debating', 'voting') AND vote_end IS NOT NULL;
+        """),
+    (3, "hot query indexes", """
+        -- bills in a status, with their deadline from the index (get_open_votes at startup recovery)
+        CREATE INDEX IF NOT EXISTS idx_proposals_status_vote_end ON proposals(status, vote_end);
+        -- laws by enactment time across guilds; get_laws_page pages per guild on idx_laws_guild_enacted_at (migration 5)
+        CREATE INDEX IF NOT EXISTS idx_laws_enacted_at ON laws(enacted_at);
+        -- per-bill vote lookups and counts
+        CREATE INDEX IF NOT EXISTS idx_votes_bill_type ON votes(bill_id, vote_type);
+        """),
+    (4, "full-text search", """
+        CREATE VIRTUAL TABLE IF NOT EXISTS laws_fts USING fts5(
+            title, text, content='laws', content_rowid='law_id', tokenize='unicode61 remove_diacritics 2'
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS proposals_fts USING fts5(
+            title, text, content='proposals', content_rowid='bill_id', tokenize='unicode61 remove_diacritics 2'
+        );
+
+        -- Keep the external-content indexes in sync with their tables
+        CREATE TRIGGER IF NOT EXISTS laws_fts_insert AFTER INSERT ON laws BEGIN
+            INSERT INTO laws_fts(rowid, title, text) VALUES (new.law_id, new.title, new.text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS laws_fts_delete AFTER DELETE ON laws BEGIN
+            INSERT INTO laws_fts(laws_fts, rowid, title, text) VALUES ('delete', old.law_id, old.title, old.text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS laws_fts_update AFTER UPDATE OF title, text ON laws BEGIN
+            INSERT INTO laws_fts(laws_fts, rowid, title, text) VALUES ('delete', old.law_id, old.title, old.text);
+            INSERT INTO laws_fts(rowid, title, text) VALUES (new.law_id, new.title, new.text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS proposals_fts_insert AFTER INSERT ON proposals BEGIN
+            INSERT INTO proposals_fts(rowid, title, text) VALUES (new.bill_id, new.title, new.text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS proposals_fts_delete AFTER DELETE ON proposals BEGIN
+            INSERT INTO proposals_fts(proposals_fts, rowid, title, text) VALUES ('delete', old.bill_id, old.title, old.text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS proposals_fts_update AFTER UPDATE OF title, text ON proposals BEGIN
+            INSERT INTO proposals_fts(proposals_fts, rowid, title, text) VALUES ('delete', old.bill_id, old.title, old.text);
+            INSERT INTO proposals_fts(rowid, title, text) VALUES (new.bill_id, new.title, new.text);
+        END;
+
+        -- Index everything that already exists
+        INSERT INTO laws_fts(laws_fts) VALUES ('rebuild');
+        INSERT INTO proposals_fts(proposals_fts) VALUES ('rebuild');
+        """),
+    (5, "per-guild configuration", """
+        CREATE TABLE IF NOT EXISTS guild_config (
+            guild_id INTEGER PRIMARY KEY,
+            proposals_channel_id INTEGER,
+            debate_channel_id INTEGER,
+            voting_channel_id INTEGER,
+            announcements_channel_id INTEGER,
+            past_legislation_channel_id INTEGER,
+            statutes_channel_id INTEGER,
+            proposer_role_id INTEGER,
+            moderator_role_id INTEGER,
+            constitution_url TEXT
+        );
+
+        -- NULL guild_id marks rows from before multi-guild support; they are adopted
+        -- by the guild configured in constants.py on first start (see Governance._start_when_ready).
+        -- Votes are scoped through their bill.
+        ALTER TABLE proposals ADD COLUMN guild_id INTEGER;
+        ALTER TABLE laws ADD COLUMN guild_id INTEGER;
+
+        CREATE INDEX IF NOT EXISTS idx_proposals_guild_status_vote_end ON proposals(guild_id, status, vote_end);
+        CREATE INDEX IF NOT EXISTS idx_laws_guild_enacted_at ON laws(guild_id, enacted_at);
+        """),
+    (6, "ranked and weighted races", """
+        -- 'majority' bills keep using votes + the yes/no/abstain counters; other methods
+        -- (see tally_engine.TALLY_METHODS) take ballots over the options listed in `options`
+        ALTER TABLE proposals ADD COLUMN tally_method TEXT NOT NULL DEFAULT 'majority';
+        ALTER TABLE proposals ADD COLUMN options TEXT; -- JSON list of option labels
+        ALTER TABLE proposals ADD COLUMN winner INTEGER; -- index into options once decided
+
+        -- One ballot per voter: option indexes in preference order, one byte each
+        CREATE TABLE IF NOT EXISTS ballots (
+            bill_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            ranking BLOB NOT NULL,
+            weight REAL NOT NULL DEFAULT 1,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY(bill_id, user_id),
+            FOREIGN KEY(bill_id) REFERENCES proposals(bill_id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+
+        -- Per-round breakdown of a decided race
+        CREATE TABLE IF NOT EXISTS tally_rounds (
+            bill_id INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            counts TEXT NOT NULL, -- JSON {option index: weight}
+            exhausted REAL NOT NULL DEFAULT 0,
+            eliminated TEXT NOT NULL DEFAULT '[]', -- JSON list of option indexes
+            PRIMARY KEY(bill_id, round),
+            FOREIGN KEY(bill_id) REFERENCES proposals(bill_id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+        """),
+    (7, "vote archives", """
+        -- Votes of long-closed bills, folded out of `votes` (see DBManager.compact_votes):
+        -- each choice is a sorted array of little-endian uint64 voter IDs
+        CREATE TABLE IF NOT EXISTS vote_archives (
+            bill_id INTEGER PRIMARY KEY,
+            yes BLOB NOT NULL,
+            no BLOB NOT NULL,
+            abstain BLOB NOT NULL,
+            archived_at TEXT NOT NULL,
+            FOREIGN KEY(bill_id) REFERENCES proposals(bill_id) ON DELETE CASCADE
+        );
+        """),
+    (8, "one law per bill", """
+        -- A tally that ran twice could enact the same bill twice; keep the first law
+        DELETE FROM laws WHERE law_id NOT IN (SELECT MIN(law_id) FROM laws GROUP BY bill_id);
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_laws_bill_id ON laws(bill_id);
+        """),
+    (9, "vote changes", """
+        -- Votes can be changed or retracted (row deleted); previous_type is the choice before the latest click,
+        -- so it equals vote_type after a repeat
+        ALTER TABLE votes ADD COLUMN previous_type TEXT;
+        ALTER TABLE votes ADD COLUMN changed_at TEXT;
+
+        -- Every change and retraction, in order; rows are never updated or deleted
+        CREATE TABLE IF NOT EXISTS vote_audit (
+            audit_id INTEGER PRIMARY KEY,
+            bill_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            old_type TEXT NOT NULL,
+            new_type TEXT, -- NULL when the vote was retracted
+            at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_vote_audit_bill_user ON vote_audit(bill_id, user_id);
+        CREATE TRIGGER IF NOT EXISTS vote_audit_no_update BEFORE UPDATE ON vote_audit BEGIN
+            SELECT RAISE(ABORT, 'vote_audit is append-only');
+        END;
+        CREATE TRIGGER IF NOT EXISTS vote_audit_no_delete BEFORE DELETE ON vote_audit BEGIN
+            SELECT RAISE(ABORT, 'vote_audit is append-only');
+        END;
+        """),
+]
+
+
+async def run_migrations(db) -> List[Tuple[int, str, float]]:
+    """Apply pending migrations in order on `db`. Returns (version, name, ms) per applied step."""
+    cursor = await db.execute("PRAGMA user_version")
+    current = (await cursor.fetchone())[0]
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL,
+            duration_ms REAL NOT NULL
+        )
+        """
+    )
+    await db.commit()
+
+    applied = []
+    for version, name, sql in MIGRATIONS:
+        if version <= current:
+            continue
+        started = time.perf_counter()
+        try:
+            # Step and version bump commit together, or not at all
+            await db.executescript(f"BEGIN;\n{sql}\nPRAGMA user_version = {version};\nCOMMIT;")
+        except Exception:
+            await db.rollback()
+            raise
+        duration_ms = (time.perf_counter() - started) * 1000
+        await db.execute(
+            "INSERT OR REPLACE INTO schema_migrations (version, name, applied_at, duration_ms) VALUES (?, ?, ?, ?)",
+            (version, name, datetime.utcnow().isoformat(), duration_ms)
+        )
+        await db.commit()
+        print(f"Applied migration {version} ({name}) in {duration_ms:.1f} ms")
+        applied.append((version, name, duration_ms))
+    return applied
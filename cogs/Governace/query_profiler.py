@@ -0,0 +1,143 @@
+# cogs/Governace/query_profiler.py
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+import aiosqlite
+
+# Statements EXPLAIN QUERY PLAN can describe (not PRAGMA, BEGIN, DDL...)
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|REPLACE|WITH)\b", re.IGNORECASE)
+# Multi-row VALUES lists differ only in length; count them as one statement
+_VALUES_GROUP = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_GROUPS = re.compile(r"(\(\?, \.\.\.\))(?:\s*,\s*\(\?, \.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _VALUES_GROUP.sub("(?, ...)", sql)
+    return _REPEATED_GROUPS.sub(r"\1, ...", sql)
+
+
+class QueryProfiler:
+    """Opt-in statement profiler for DBManager.
+
+    Times every execute (plus the fetches on its cursor), prints statements slower
+    than `slow_ms` with their parameters, records EXPLAIN QUERY PLAN the first time
+    each statement is seen, and keeps per-statement totals for a top-N report.
+    """
+
+    def __init__(self, slow_ms: float = 50.0, max_statements: int = 500):
+        self.slow_ms = slow_ms
+        self.max_statements = max_statements
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.started_at = time.time()
+
+    def wrap(self, conn: aiosqlite.Connection) -> "ProfiledConnection":
+        return ProfiledConnection(conn, self)
+
+    def reset(self):
+        self.stats.clear()
+        self.started_at = time.time()
+
+    def top(self, n: int = 10, key: str = "total_ms") -> List[Dict[str, Any]]:
+        """The n most expensive statements, by total time (or "max_ms", "calls")."""
+        rows = sorted(self.stats.values(), key=lambda s: s[key], reverse=True)[:n]
+        return [dict(s, avg_ms=s["total_ms"] / s["calls"]) for s in rows]
+
+    def _entry(self, sql: str) -> Optional[Dict[str, Any]]:
+        key = normalize_sql(sql)
+        entry = self.stats.get(key)
+        if entry is None:
+            if len(self.stats) >= self.max_statements:
+                return None
+            entry = self.stats[key] = {"sql": key, "calls": 0, "total_ms": 0.0, "max_ms": 0.0, "plan": None}
+        return entry
+
+    def _record(self, entry: Optional[Dict[str, Any]], sql: str, params: Any, elapsed_ms: float, count_call: bool = True):
+        if entry is not None:
+            if count_call:
+                entry["calls"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        if elapsed_ms >= self.slow_ms:
+            print(f"[DB] Slow query ({elapsed_ms:.1f} ms): {normalize_sql(sql)} params={params!r}")
+
+    async def _explain(self, conn: aiosqlite.Connection, entry: Optional[Dict[str, Any]], sql: str, params: Any):
+        if entry is None or entry["plan"] is not None:
+            return
+        entry["plan"] = ""
+        if not _EXPLAINABLE.match(sql):
+            return
+        try:
+            cursor = await conn.execute(f"EXPLAIN QUERY PLAN {sql}", params or ())
+            rows = await cursor.fetchall()
+            await cursor.close()
+        except Exception as e:
+            entry["plan"] = f"(no plan: {e})"
+            return
+        entry["plan"] = "\n".join(row["detail"] for row in rows)
+        print(f"[DB] Query plan for {entry['sql']}:\n{entry['plan']}")
+
+
+class ProfiledCursor:
+    """Cursor proxy that adds fetch time to its statement's totals."""
+
+    def __init__(self, cursor: aiosqlite.Cursor, profiler: QueryProfiler, entry, sql: str, params: Any):
+        self._cursor = cursor
+        self._profiler = profiler
+        self._entry = entry
+        self._sql = sql
+        self._params = params
+
+    async def _timed(self, fetch, *args):
+        start = time.perf_counter()
+        try:
+            return await fetch(*args)
+        finally:
+            self._profiler._record(self._entry, self._sql, self._params, (time.perf_counter() - start) * 1000,
+                                   count_call=False)
+
+    async def fetchone(self):
+        return await self._timed(self._cursor.fetchone)
+
+    async def fetchall(self):
+        return await self._timed(self._cursor.fetchall)
+
+    async def fetchmany(self, size: Optional[int] = None):
+        return await self._timed(self._cursor.fetchmany, size)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class ProfiledConnection:
+    """Connection proxy handed out by DBManager._read()/_write() while profiling is on."""
+
+    def __init__(self, conn: aiosqlite.Connection, profiler: QueryProfiler):
+        self._conn = conn
+        self._profiler = profiler
+
+    async def execute(self, sql: str, parameters: Any = None) -> ProfiledCursor:
+        entry = self._profiler._entry(sql)
+        start = time.perf_counter()
+        try:
+            cursor = await self._conn.execute(sql, parameters)
+        finally:
+            self._profiler._record(entry, sql, parameters, (time.perf_counter() - start) * 1000)
+        await self._profiler._explain(self._conn, entry, sql, parameters)
+        return ProfiledCursor(cursor, self._profiler, entry, sql, parameters)
+
+    async def executemany(self, sql: str, parameters) -> aiosqlite.Cursor:
+        parameters = list(parameters)
+        entry = self._profiler._entry(sql)
+        start = time.perf_counter()
+        try:
+            cursor = await self._conn.executemany(sql, parameters)
+        finally:
+            self._profiler._record(entry, sql, f"<{len(parameters)} rows>", (time.perf_counter() - start) * 1000)
+        await self._profiler._explain(self._conn, entry, sql, parameters[0] if parameters else None)
+        return cursor
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
@@ -0,0 +1,122 @@
+# cogs/Governace/scheduler.py
+import asyncio
+import heapq
+import itertools
+import traceback
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .clock import SystemClock
+
+# Event kinds stored in the scheduled_events table
+VOTE_START = "vote_start"
+VOTE_END = "vote_end"
+
+
+class DeadlineScheduler:
+    """Single task that fires bill deadlines in order.
+
+    Deadlines live in a min-heap mirrored to the scheduled_events table, so the
+    task only wakes for the next due event and the schedule survives restarts.
+    Cancelled or rescheduled entries are dropped lazily when they reach the top.
+    """
+
+    def __init__(self, db_manager, handlers: Dict[str, Callable[[int], Awaitable[None]]], clock: Optional[SystemClock] = None):
+        self.db_manager = db_manager
+        self.handlers = handlers
+        self.clock = clock or SystemClock()
+        self._heap: List[Tuple[datetime, int, int, str]] = []  # (due, seq, bill_id, kind)
+        self._entries: Dict[Tuple[int, str], Tuple[datetime, int]] = {}  # live entry per (bill_id, kind)
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ---------- Lifecycle ----------
+    async def load(self):
+        """Rebuild the heap from the database. Overdue events fire first, oldest first."""
+        self._heap.clear()
+        self._entries.clear()
+        for event in await self.db_manager.get_scheduled_events():
+            self._push(event["bill_id"], event["kind"], datetime.fromisoformat(event["due_at"]))
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    # ---------- Public API ----------
+    async def schedule(self, bill_id: int, kind: str, due: datetime):
+        """Schedule (or move) the `kind` deadline of a bill."""
+        await self.db_manager.upsert_scheduled_event(bill_id, kind, due.isoformat())
+        self._push(bill_id, kind, due)
+        self._wakeup.set()
+
+    async def cancel(self, bill_id: int, kind: Optional[str] = None):
+        """Cancel one deadline of a bill, or all of them when kind is None."""
+        await self.db_manager.delete_scheduled_events(bill_id, kind)
+        kinds = [kind] if kind else list(self.handlers)
+        for k in kinds:
+            self._entries.pop((bill_id, k), None)
+        # Stale heap entries are skipped lazily; rebuild when they dominate
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [e for e in self._heap if self._entries.get((e[2], e[3])) == (e[0], e[1])]
+            heapq.heapify(self._heap)
+
+    # ---------- Internals ----------
+    def _push(self, bill_id: int, kind: str, due: datetime):
+        seq = next(self._seq)
+        self._entries[(bill_id, kind)] = (due, seq)
+        heapq.heappush(self._heap, (due, seq, bill_id, kind))
+
+    def _peek(self) -> Optional[Tuple[datetime, int, int, str]]:
+        while self._heap:
+            due, seq, bill_id, kind = self._heap[0]
+            if self._entries.get((bill_id, kind)) == (due, seq):
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    async def _run(self):
+        while True:
+            head = self._peek()
+            if head is None:
+                self._wakeup.clear()
+                await self.clock.wait(self._wakeup)
+                continue
+
+            due, _, bill_id, kind = head
+            delay = (due - self.clock.now()).total_seconds()
+            if delay > 0:
+                self._wakeup.clear()
+                await self.clock.wait(self._wakeup, timeout=delay)
+                continue
+
+            heapq.heappop(self._heap)
+            del self._entries[(bill_id, kind)]
+            try:
+                await self.handlers[kind](bill_id)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                # The handler may have rescheduled the same deadline; keep that one
+                if (bill_id, kind) not in self._entries:
+                    try:
+                        await self.db_manager.delete_scheduled_events(bill_id, kind)
+                    except Exception:
+                        traceback.print_exc()
@@ -0,0 +1,134 @@
+# cogs/Governace/tally_engine.py
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# A ballot is stored as the option indexes in preference order, one byte each
+# (array('B')), so a ranking of 5 candidates takes 5 bytes. Up to 25 options
+# fit a Discord select menu, well within a byte.
+MAX_OPTIONS = 25
+
+# (ranking, total weight, number of voters) for every distinct ballot; the ranking is
+# the stored blob itself or any other sequence of option indexes
+BallotGroup = Tuple[Sequence[int], float, int]
+
+
+def encode_ranking(indexes: Sequence[int]) -> bytes:
+    if len(set(indexes)) != len(indexes):
+        raise ValueError("A ranking cannot list an option twice.")
+    return array("B", indexes).tobytes()
+
+
+def decode_ranking(blob: bytes) -> List[int]:
+    return array("B", blob).tolist()
+
+
+@dataclass
+class TallyRound:
+    counts: Dict[int, float]  # option index -> weight counted for it this round
+    exhausted: float = 0.0  # weight of ballots with no remaining preference
+    eliminated: List[int] = field(default_factory=list)  # options dropped after this round
+
+
+@dataclass
+class TallyResult:
+    method: str
+    winner: Optional[int]  # option index; None without ballots (or a plurality tie)
+    rounds: List[TallyRound]
+    ballots: int
+    total_weight: float
+
+
+def weighted_plurality(groups: Iterable[BallotGroup], option_count: int) -> TallyResult:
+    """Each ballot's first choice gets the ballot's weight; most weight wins."""
+    counts = {i: 0.0 for i in range(option_count)}
+    ballots = 0
+    total = 0.0
+    for ranking, weight, voters in groups:
+        ballots += voters
+        total += weight
+        if ranking:
+            counts[ranking[0]] += weight
+    winner = _leader(counts)
+    return TallyResult("weighted", winner, [TallyRound(counts)], ballots, total)
+
+
+def instant_runoff(groups: Iterable[BallotGroup], option_count: int) -> TallyResult:
+    """Instant-runoff over grouped ballots.
+
+    Identical rankings are counted once with their combined weight, and each
+    round only the ballots sitting on the eliminated option move, so the work
+    over all rounds is bounded by the total length of the distinct rankings.
+    """
+    groups = list(groups)
+    ballots = sum(voters for _, _, voters in groups)
+    total = sum(weight for _, weight, _ in groups)
+    position = [0] * len(groups)  # index into each ranking of its current preference
+    piles: Dict[int, List[int]] = {i: [] for i in range(option_count)}  # option -> groups counted for it
+    counts = {i: 0.0 for i in range(option_count)}
+    exhausted = 0.0
+    for g, (ranking, weight, _) in enumerate(groups):
+        if ranking:
+            piles[ranking[0]].append(g)
+            counts[ranking[0]] += weight
+        else:
+            exhausted += weight
+
+    rounds: List[TallyRound] = []
+    history: List[Dict[int, float]] = []
+    while True:
+        live = dict(counts)
+        history.append(live)
+        round_ = TallyRound(live, exhausted)
+        rounds.append(round_)
+        active = sum(live.values())
+        if not live or active == 0:
+            return TallyResult("irv", None, rounds, ballots, total)
+        leader = _leader(live)
+        if len(live) == 1 or (leader is not None and live[leader] * 2 > active):
+            return TallyResult("irv", leader, rounds, ballots, total)
+
+        # Drop the weakest option; ties go back through earlier rounds, then to the higher index
+        loser = min(live, key=lambda o: ([h.get(o, 0.0) for h in reversed(history)], -o))
+        round_.eliminated.append(loser)
+        del counts[loser]
+        for g in piles.pop(loser):
+            ranking, weight, _ = groups[g]
+            p = position[g] + 1
+            while p < len(ranking) and ranking[p] not in counts:
+                p += 1
+            position[g] = p
+            if p < len(ranking):
+                piles[ranking[p]].append(g)
+                counts[ranking[p]] += weight
+            else:
+                exhausted += weight
+
+
+def _leader(counts: Dict[int, float]) -> Optional[int]:
+    """The option with the most weight, or None when nobody voted or the top is tied."""
+    if not counts:
+        return None
+    best = max(counts.values())
+    top = [o for o, c in counts.items() if c == best]
+    return top[0] if len(top) == 1 and best > 0 else None
+
+
+# Tally methods by the name stored in proposals.tally_method. Register new ones here.
+TALLY_METHODS: Dict[str, Callable[[Iterable[BallotGroup], int], TallyResult]] = {
+    "irv": instant_runoff,
+    "weighted": weighted_plurality,
+}
+
+# What each method asks of the voter
+RANKED_METHODS = {"irv"}
+
+
+def tally(method: str, groups: Iterable[BallotGroup], option_count: int) -> TallyResult:
+    """Run a registered tally method over (ranking blob, weight, voters) groups."""
+    try:
+        engine = TALLY_METHODS[method]
+    except KeyError:
+        raise ValueError(f"Unknown tally method: {method}") from None
+    # bytes index to ints, so the stored blobs are counted as they are, without decoding
+    return engine(groups, option_count)
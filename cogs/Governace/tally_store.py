@@ -0,0 +1,91 @@
+# cogs/Governace/tally_store.py
+import asyncio
+import traceback
+from typing import Dict, Optional, Set
+
+# Seconds between background write-backs of changed counters
+FLUSH_INTERVAL_SECONDS = 5.0
+
+VOTE_TYPES = ("yes", "no", "abstain")
+
+
+class TallyStore:
+    """Live vote counters for bills in 'voting', kept in memory.
+
+    Accepted votes bump the counters synchronously (no await, so each update is
+    atomic on the event loop); changed bills are written back to the
+    proposals.*_count columns in the background. The votes table stays the source
+    of truth: DBManager.close_bill recounts from it when a vote closes.
+    """
+
+    def __init__(self, db_manager, flush_interval: float = FLUSH_INTERVAL_SECONDS):
+        self.db_manager = db_manager
+        self.flush_interval = flush_interval
+        self._counts: Dict[int, Dict[str, int]] = {}
+        self._dirty: Set[int] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def __contains__(self, bill_id: int) -> bool:
+        return bill_id in self._counts
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ---------- Counters ----------
+    def seed(self, bill_id: int, counts: Dict[str, int]):
+        """Start tracking a bill from known counts."""
+        self._counts[bill_id] = {t: counts.get(t) or 0 for t in VOTE_TYPES}
+        self._dirty.discard(bill_id)
+
+    def add(self, bill_id: int, vote_type: str, delta: int = 1):
+        counts = self._counts.get(bill_id)
+        if counts is None:
+            return
+        counts[vote_type] += delta
+        self._dirty.add(bill_id)
+
+    def get(self, bill_id: int) -> Optional[Dict[str, int]]:
+        counts = self._counts.get(bill_id)
+        return dict(counts) if counts is not None else None
+
+    def drop(self, bill_id: int):
+        """Stop tracking a bill; unflushed changes are discarded."""
+        self._counts.pop(bill_id, None)
+        self._dirty.discard(bill_id)
+
+    # ---------- Write-back ----------
+    async def flush(self):
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        rows = [(bill_id, self._counts[bill_id]) for bill_id in dirty if bill_id in self._counts]
+        try:
+            await self.db_manager.write_vote_counts(rows)
+        except Exception:
+            # Retry on the next pass
+            self._dirty |= dirty
+            raise
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop the background writer and write back whatever changed."""
+        if self.running:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                traceback.print_exc()
@@ -1,23 +1,56 @@
 # cogs/Governace/ui_components.py
 import discord
-from discord.ui import Modal, TextInput, View, Button
+import json
+from discord.ui import Modal, TextInput, View, Button, Select
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+from metrics import INTERACTION_SECONDS
 
-from .db_manager import DBManager
 from . import constants
+from .db_manager import DBManager, VOTE_CHANGED, VOTE_CLOSED, VOTE_RECORDED, VOTE_RETRACTED, VOTE_UNCHANGED
+from .events import ProposalCreated, VoteCast
+from .tally_engine import RANKED_METHODS, encode_ranking
+
 
-# Constants alias (to match user's constants file)
-PROPOSALS_CHANNEL_ID = constants.PROPOSALS_CHANNEL_ID
-VOTING_CHANNEL_ID = constants.VOTING_CHANNEL_ID
-ANNOUNCEMENTS_CHANNEL_ID = constants.ANNOUNCEMENTS_CHANNEL_ID
-PAST_LEGISLATION_CHANNEL_ID = constants.PAST_LEGISLATION_CHANNEL_ID
-STATUTES_AND_ACTS_CHANNEL_ID = constants.STATUTES_AND_ACTS_CHANNEL_ID
-PROPOSER_ROLE_ID = constants.PROPOSER_ROLE_ID
-STAFF_ROLE_ID = getattr(constants, "STAFF_ROLE_ID", None)  # optional
+def guild_config(interaction: discord.Interaction) -> Dict:
+    """Channel/role settings of the guild an interaction came from (cached by the Governance cog)."""
+    governance = interaction.client.get_cog("Governance")
+    return governance.guild_configs.get(interaction.guild_id) if governance else {}
 
 
-class ProposalForm(Modal, title='Submit a Bill Proposal'):
+def build_vote_embed(prop: Dict, vote_start: datetime, vote_end: datetime,
+                     counts: Optional[Dict[str, int]] = None, member_count: Optional[int] = None) -> discord.Embed:
+    """Embed for the voting-booth message; with `counts` it also shows the live tally and turnout."""
+    embed = discord.Embed(
+        title=f"Voting — Bill #{prop['bill_id']}: {prop['title']}",
+        description=prop['text'],
+        color=discord.Color.green(),
+        timestamp=datetime.utcnow()
+    )
+    embed.add_field(name="Voting Opened", value=f"<t:{int(vote_start.timestamp())}:F>", inline=True)
+    embed.add_field(name="Voting Closes", value=f"<t:{int(vote_end.timestamp())}:F>", inline=True)
+    if counts is not None:
+        total = counts["yes"] + counts["no"] + counts["abstain"]
+        turnout = f"{total} vote{'s' if total != 1 else ''}"
+        if member_count:
+            turnout += f" ({total / member_count:.1%} of {member_count:,} members)"
+        embed.add_field(name="Live Tally", value=f"Yes: {counts['yes']} | No: {counts['no']} | Abstain: {counts['abstain']}", inline=False)
+        embed.add_field(name="Turnout", value=turnout, inline=False)
+    embed.set_footer(text="Cast your vote by clicking a button below. You can change or retract it until voting ends.")
+    return embed
+
+
+class RateLimitedMixin:
+    """interaction_check for governance views, modals and buttons: clicks over the user's or
+    server's budget (Governance.rate_limiter) get a short reply and go no further."""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        governance = interaction.client.get_cog("Governance")
+        return governance is None or await governance.rate_limiter.check(interaction)
+
+
+class ProposalForm(RateLimitedMixin, Modal, title='Submit a Bill Proposal'):
     title_input = TextInput(
         label='Bill Title',
         placeholder='e.g., The New Member Onboarding Act',
@@ -40,10 +73,12 @@ class ProposalForm(Modal, title='Submit a Bill Proposal'):
         self.bot = bot_instance
         self.db_manager = db_manager
 
+    @INTERACTION_SECONDS.time(handler="proposal_form")
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
 
-        proposals_channel = self.bot.get_channel(PROPOSALS_CHANNEL_ID)
+        proposals_channel_id = guild_config(interaction).get("proposals_channel_id")
+        proposals_channel = self.bot.get_channel(proposals_channel_id) if proposals_channel_id else None
         if not proposals_channel:
             await interaction.followup.send("Error: proposals channel not found. Contact an admin.", ephemeral=True)
             return
@@ -52,7 +87,8 @@ class ProposalForm(Modal, title='Submit a Bill Proposal'):
         bill_id = await self.db_manager.insert_proposal(
             self.title_input.value,
             self.text_input.value,
-            interaction.user.id
+            interaction.user.id,
+            interaction.guild_id
         )
 
         # Embed for proposals channel (intro / rules)
@@ -69,6 +105,12 @@ class ProposalForm(Modal, title='Submit a Bill Proposal'):
         try:
             proposal_message = await proposals_channel.send(embed=embed)
             await self.db_manager.update_proposal_message_ids(bill_id, proposal_message_id=proposal_message.id)
+            governance = self.bot.get_cog("Governance")
+            if governance is not None:
+                # Debate posting and scheduling happen in the Governance cog's subscriber
+                await governance.events.publish(ProposalCreated(bill_id, guild_id=interaction.guild_id,
+                                                                proposer_id=interaction.user.id,
+                                                                title=self.title_input.value))
             await interaction.followup.send(
                 f"Your proposal for **Bill #{bill_id}: \"{self.title_input.value}\"** has been posted in {proposals_channel.mention}. It will be scheduled for debate and voting automatically.",
                 ephemeral=True
@@ -77,91 +119,429 @@ class ProposalForm(Modal, title='Submit a Bill Proposal'):
             await interaction.followup.send("There was an error creating the proposal message. Contact an admin.", ephemeral=True)
 
 
-class ProposeButtonView(View):
+class ProposeButtonView(RateLimitedMixin, View):
     def __init__(self, bot_instance: discord.Client, db_manager: DBManager):
         super().__init__(timeout=None)
         self.bot = bot_instance
         self.db_manager = db_manager
 
     @discord.ui.button(label="Propose New Bill", style=discord.ButtonStyle.primary, custom_id="propose_bill_button")
+    @INTERACTION_SECONDS.time(handler="propose_button")
     async def propose_button(self, interaction: discord.Interaction, button: Button):
         # role check
-        if PROPOSER_ROLE_ID:
-            proposer_role = discord.utils.get(interaction.user.roles, id=PROPOSER_ROLE_ID)
+        proposer_role_id = guild_config(interaction).get("proposer_role_id")
+        if proposer_role_id:
+            proposer_role = discord.utils.get(interaction.user.roles, id=proposer_role_id)
             if not proposer_role:
                 return await interaction.response.send_message("You do not have permission to propose bills.", ephemeral=True)
 
         await interaction.response.send_modal(ProposalForm(self.bot, self.db_manager))
 
 
-class VotingView(View):
-    def __init__(self, bot_instance: discord.Client, bill_id: int, db_manager: DBManager, end_time_dt: datetime):
-        super().__init__(timeout=None)
-        self.bot = bot_instance
+VOTE_CHOICES = ("yes", "no", "abstain")
+RETRACT = "retract"  # button that withdraws the user's vote
+VOTE_BUTTON_STYLES = {
+    "yes": discord.ButtonStyle.success,
+    "no": discord.ButtonStyle.danger,
+    "abstain": discord.ButtonStyle.secondary,
+    RETRACT: discord.ButtonStyle.secondary,
+}
+
+
+@INTERACTION_SECONDS.time(handler="vote")
+async def handle_vote(interaction: discord.Interaction, bill_id: int, vote_type: str):
+    """Record one vote click (a choice, or RETRACT). All state comes from the Governance cog, none from the message.
+
+    Clicking another choice changes the vote; the answer comes from the write itself, no extra lookup.
+    """
+    await interaction.response.defer(ephemeral=True)
+    governance = interaction.client.get_cog("Governance")
+    if governance is None:
+        await interaction.followup.send("Voting is unavailable right now. Try again shortly.", ephemeral=True)
+        return
+
+    vote_end = governance.open_votes.get(bill_id)
+    if vote_end is None or governance.clock.now() >= vote_end:
+        await interaction.followup.send("Voting for this bill has already ended.", ephemeral=True)
+        return
+
+    choice = None if vote_type == RETRACT else vote_type
+    outcome, previous = await governance.db.submit_vote(interaction.user.id, bill_id, choice)
+    if outcome == VOTE_CLOSED:
+        # Closed or vetoed while the click waited in the vote queue
+        await interaction.followup.send("Voting for this bill has already ended.", ephemeral=True)
+        return
+    if outcome != VOTE_UNCHANGED:
+        await governance.events.publish(VoteCast(bill_id, user_id=interaction.user.id, choice=choice, previous=previous))
+    if outcome == VOTE_RECORDED:
+        await interaction.followup.send(f"You have cast your vote: **{choice.capitalize()}**.", ephemeral=True)
+    elif outcome == VOTE_CHANGED:
+        await interaction.followup.send(f"You changed your vote from **{previous.capitalize()}** to **{choice.capitalize()}**.", ephemeral=True)
+    elif outcome == VOTE_RETRACTED:
+        await interaction.followup.send(f"Your vote (**{previous.capitalize()}**) has been retracted.", ephemeral=True)
+    elif choice is None:
+        await interaction.followup.send("You have not voted on this bill.", ephemeral=True)
+    else:
+        await interaction.followup.send(f"Your vote is already **{choice.capitalize()}**.", ephemeral=True)
+
+
+class VoteButton(RateLimitedMixin, discord.ui.DynamicItem[Button], template=r"vote:(?P<bill_id>[0-9]+):(?P<choice>yes|no|abstain|retract)"):
+    """Vote button whose custom_id ("vote:<bill_id>:<choice>") carries everything needed to route a click.
+
+    Registered once with bot.add_dynamic_items, so buttons on every voting message
+    keep working after restarts without keeping a View per message.
+    """
+
+    def __init__(self, bill_id: int, choice: str):
+        super().__init__(Button(label=choice.capitalize(), style=VOTE_BUTTON_STYLES[choice], custom_id=f"vote:{bill_id}:{choice}"))
         self.bill_id = bill_id
-        self.db_manager = db_manager
-        self.end_time_dt = end_time_dt
+        self.choice = choice
 
-    async def _handle_vote(self, interaction: discord.Interaction, vote_type: str):
-        await interaction.response.defer(ephemeral=True)
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: Button, match):
+        return cls(int(match["bill_id"]), match["choice"])
 
-        if datetime.utcnow() >= self.end_time_dt:
-            await interaction.followup.send("Voting for this bill has already ended.", ephemeral=True)
-            return
+    async def callback(self, interaction: discord.Interaction):
+        await handle_vote(interaction, self.bill_id, self.choice)
 
-        recorded = await self.db_manager.record_vote(interaction.user.id, self.bill_id, vote_type)
-        if recorded:
-            await interaction.followup.send(f"You have cast your vote: **{vote_type.capitalize()}**.", ephemeral=True)
+
+class VotingView(View):
+    """Buttons for a bill's voting message. Only used to send the message.
+
+    Yes/No/Abstain (plus Retract) for ordinary bills; a single "Cast ballot" button for ranked
+    and weighted races, which opens a select-menu ballot.
+    """
+
+    def __init__(self, bill_id: int, tally_method: str = "majority"):
+        super().__init__(timeout=None)
+        if tally_method == "majority":
+            for choice in VOTE_CHOICES:
+                self.add_item(VoteButton(bill_id, choice))
+            self.add_item(VoteButton(bill_id, RETRACT))
         else:
-            existing = await self.db_manager.get_user_vote(interaction.user.id, self.bill_id)
-            if existing:
-                await interaction.followup.send(f"You've already voted on this bill (your current vote: **{existing.capitalize()}**).", ephemeral=True)
-            else:
-                await interaction.followup.send("You have already voted on this bill.", ephemeral=True)
+            self.add_item(BallotButton(bill_id))
+
+
+class LegacyVotingView(RateLimitedMixin, View):
+    """Routes clicks on voting messages posted before vote buttons carried their bill id."""
+
+    def __init__(self, db_manager: DBManager):
+        super().__init__(timeout=None)
+        self.db_manager = db_manager
+
+    async def _route(self, interaction: discord.Interaction, vote_type: str):
+        bill_id = await self.db_manager.get_bill_id_by_vote_message(interaction.message.id)
+        if bill_id is None:
+            await interaction.response.send_message("This vote is no longer available.", ephemeral=True)
+            return
+        await handle_vote(interaction, bill_id, vote_type)
 
     @discord.ui.button(label="Yes", style=discord.ButtonStyle.success, custom_id="vote_yes_button")
     async def yes_button(self, interaction: discord.Interaction, button: Button):
-        await self._handle_vote(interaction, "yes")
+        await self._route(interaction, "yes")
 
     @discord.ui.button(label="No", style=discord.ButtonStyle.danger, custom_id="vote_no_button")
     async def no_button(self, interaction: discord.Interaction, button: Button):
-        await self._handle_vote(interaction, "no")
+        await self._route(interaction, "no")
 
     @discord.ui.button(label="Abstain", style=discord.ButtonStyle.secondary, custom_id="vote_abstain_button")
     async def abstain_button(self, interaction: discord.Interaction, button: Button):
-        await self._handle_vote(interaction, "abstain")
+        await self._route(interaction, "abstain")
+
+
+# ---------- Ranked and weighted races ----------
+def race_options(prop: Dict) -> List[str]:
+    """Option labels of a ranked/weighted race (empty for yes/no bills)."""
+    return json.loads(prop["options"]) if prop.get("options") else []
+
+
+def voter_weight(member: discord.abc.User) -> float:
+    """Weight of a member's ballot in weighted races: their heaviest role in ROLE_VOTE_WEIGHTS, else 1."""
+    weights = getattr(constants, "ROLE_VOTE_WEIGHTS", {})
+    return max((weights[role.id] for role in getattr(member, "roles", []) if role.id in weights), default=1.0)
+
+
+def _ordinal(n: int) -> str:
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+def build_ballot_embed(prop: Dict, vote_start: datetime, vote_end: datetime,
+                       ballots_cast: Optional[int] = None, member_count: Optional[int] = None) -> discord.Embed:
+    """Embed for a race's voting message; with `ballots_cast` it also shows turnout."""
+    ranked = prop["tally_method"] in RANKED_METHODS
+    embed = discord.Embed(
+        title=f"{'Ranked' if ranked else 'Weighted'} Vote — Bill #{prop['bill_id']}: {prop['title']}",
+        description=prop['text'],
+        color=discord.Color.purple(),
+        timestamp=datetime.utcnow()
+    )
+    embed.add_field(name="Options", value="\n".join(f"**{i}.** {label}" for i, label in enumerate(race_options(prop), start=1)), inline=False)
+    embed.add_field(name="Voting Opened", value=f"<t:{int(vote_start.timestamp())}:F>", inline=True)
+    embed.add_field(name="Voting Closes", value=f"<t:{int(vote_end.timestamp())}:F>", inline=True)
+    if ballots_cast is not None:
+        turnout = f"{ballots_cast} ballot{'s' if ballots_cast != 1 else ''}"
+        if member_count:
+            turnout += f" ({ballots_cast / member_count:.1%} of {member_count:,} members)"
+        embed.add_field(name="Turnout", value=turnout, inline=False)
+    embed.set_footer(text="Instant-runoff: rank as many options as you like." if ranked
+                     else "Pick one option; your vote counts with your role's weight.")
+    return embed
+
+
+@INTERACTION_SECONDS.time(handler="open_ballot")
+async def open_ballot(interaction: discord.Interaction, bill_id: int):
+    """Show the voter a private select-menu ballot for a race."""
+    governance = interaction.client.get_cog("Governance")
+    if governance is None:
+        return await interaction.response.send_message("Voting is unavailable right now. Try again shortly.", ephemeral=True)
+    vote_end = governance.open_votes.get(bill_id)
+    if vote_end is None or governance.clock.now() >= vote_end:
+        return await interaction.response.send_message("Voting for this bill has already ended.", ephemeral=True)
+    if await governance.db.get_ballot(interaction.user.id, bill_id):
+        return await interaction.response.send_message("You have already cast your ballot on this bill.", ephemeral=True)
+
+    prop = await governance.db.get_proposal_by_id(bill_id)
+    weight = voter_weight(interaction.user) if prop["tally_method"] == "weighted" else 1.0
+    ballot = RankedBallotView(governance.db, prop, weight)
+    await interaction.response.send_message(embed=ballot.render(), view=ballot, ephemeral=True)
+
+
+class BallotButton(RateLimitedMixin, discord.ui.DynamicItem[Button], template=r"ballot:(?P<bill_id>[0-9]+)"):
+    """"Cast ballot" button of a race ("ballot:<bill_id>"), registered once like VoteButton."""
+
+    def __init__(self, bill_id: int):
+        super().__init__(Button(label="Cast ballot", style=discord.ButtonStyle.primary, custom_id=f"ballot:{bill_id}"))
+        self.bill_id = bill_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: Button, match):
+        return cls(int(match["bill_id"]))
+
+    async def callback(self, interaction: discord.Interaction):
+        await open_ballot(interaction, self.bill_id)
+
+
+class RankedBallotView(View):
+    """One voter's ephemeral ballot: pick options one at a time from a shrinking select menu, then submit."""
+
+    def __init__(self, db_manager: DBManager, prop: Dict, weight: float = 1.0):
+        super().__init__(timeout=300)
+        self.db_manager = db_manager
+        self.bill_id = prop["bill_id"]
+        self.title = prop["title"]
+        self.options = race_options(prop)
+        self.ranked = prop["tally_method"] in RANKED_METHODS
+        self.weight = weight
+        self.ranking: List[int] = []
+        self.select = Select(min_values=1, max_values=1, row=0)
+        self.select.callback = self.pick
+        self.add_item(self.select)
+        self._refresh()
+
+    def _refresh(self):
+        remaining = [i for i in range(len(self.options)) if i not in self.ranking]
+        done = not remaining or (not self.ranked and self.ranking)
+        # A select needs at least one option even while disabled
+        self.select.options = [discord.SelectOption(label=self.options[i][:100], value=str(i)) for i in remaining] \
+            or [discord.SelectOption(label="All options ranked", value="-1")]
+        self.select.placeholder = (f"Choose your {_ordinal(len(self.ranking) + 1)} preference" if self.ranked
+                                   else "Choose an option")
+        self.select.disabled = bool(done)
+        self.submit_button.disabled = not self.ranking
+        self.reset_button.disabled = not self.ranking
+
+    def render(self) -> discord.Embed:
+        embed = discord.Embed(title=f"Your ballot — Bill #{self.bill_id}: {self.title}", color=discord.Color.purple())
+        if self.ranking:
+            embed.description = "\n".join(f"**{_ordinal(n)}:** {self.options[i]}" for n, i in enumerate(self.ranking, start=1))
+        else:
+            embed.description = ("Pick options in order of preference. You can stop after any number."
+                                 if self.ranked else "Pick the option you support.")
+        if self.weight != 1.0:
+            embed.set_footer(text=f"Your ballot counts with weight {self.weight:g}.")
+        return embed
+
+    async def pick(self, interaction: discord.Interaction):
+        choice = int(self.select.values[0])
+        if choice >= 0 and choice not in self.ranking:
+            self.ranking.append(choice)
+        self._refresh()
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+    @discord.ui.button(label="Submit ballot", style=discord.ButtonStyle.success, row=1)
+    @INTERACTION_SECONDS.time(handler="submit_ballot")
+    async def submit_button(self, interaction: discord.Interaction, button: Button):
+        governance = interaction.client.get_cog("Governance")
+        vote_end = governance.open_votes.get(self.bill_id) if governance else None
+        if vote_end is None or governance.clock.now() >= vote_end:
+            self.stop()
+            return await interaction.response.edit_message(content="Voting for this bill has already ended.", embed=None, view=None)
+
+        recorded = await self.db_manager.submit_ballot(interaction.user.id, self.bill_id, encode_ranking(self.ranking), self.weight)
+        self.stop()
+        if recorded:
+            await governance.events.publish(VoteCast(self.bill_id, user_id=interaction.user.id, choice="ballot"))
+            await interaction.response.edit_message(content="Your ballot has been recorded.", embed=self.render(), view=None)
+        else:
+            await interaction.response.edit_message(content="You have already cast your ballot on this bill.", embed=None, view=None)
+
+    @discord.ui.button(label="Start over", style=discord.ButtonStyle.secondary, row=1)
+    async def reset_button(self, interaction: discord.Interaction, button: Button):
+        self.ranking.clear()
+        self._refresh()
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+
+class ApprovedBillsPages:
+    """Rendered pages of the Approved Bills browser, per guild.
+
+    Pages are fetched with keyset pagination and cached until a new law is
+    enacted (DBManager.laws_version changes).
+    """
+    PAGE_SIZE = 5
+    MAX_TEXT_LENGTH = 600  # per act, keeps a full page well under the 4096-char embed limit
+
+    def __init__(self, db_manager: DBManager):
+        self.db_manager = db_manager
+        self._version = None
+        self._totals: Dict[Optional[int], int] = {}
+        self._pages: Dict[Tuple[Optional[int], int], discord.Embed] = {}
+        self._starts: Dict[Tuple[Optional[int], int], Optional[Tuple[str, int]]] = {}  # (guild, page) -> key of last law before it
+
+    def _check_version(self):
+        if self._version != self.db_manager.laws_version:
+            self._version = self.db_manager.laws_version
+            self._totals.clear()
+            self._pages.clear()
+            self._starts.clear()
+
+    async def law_count(self, guild_id: Optional[int]) -> int:
+        self._check_version()
+        if guild_id not in self._totals:
+            self._totals[guild_id] = await self.db_manager.count_laws(guild_id)
+        return self._totals[guild_id]
+
+    async def page_count(self, guild_id: Optional[int]) -> int:
+        return max(1, -(-(await self.law_count(guild_id)) // self.PAGE_SIZE))
+
+    async def get(self, guild_id: Optional[int], page: int) -> discord.Embed:
+        total_pages = await self.page_count(guild_id)
+        page = min(max(page, 0), total_pages - 1)
+        if (guild_id, page) in self._pages:
+            return self._pages[(guild_id, page)]
+
+        if page == 0:
+            start = None
+        elif (guild_id, page) in self._starts:
+            start = self._starts[(guild_id, page)]
+        else:
+            # Jumped past the pages seen so far: find the boundary key on the index
+            start = await self.db_manager.get_law_key_at(page * self.PAGE_SIZE - 1, guild_id)
+        laws = await self.db_manager.get_laws_page(guild_id, start, self.PAGE_SIZE)
+        if laws:
+            self._starts[(guild_id, page + 1)] = (laws[-1]["enacted_at"], laws[-1]["law_id"])
+
+        self._pages[(guild_id, page)] = self._render(laws, page, total_pages)
+        return self._pages[(guild_id, page)]
+
+    def _render(self, laws, page: int, total_pages: int) -> discord.Embed:
+        entries = []
+        for law in laws:
+            enacted = law["enacted_at"].split(".")[0]
+            text = law["text"]
+            if len(text) > self.MAX_TEXT_LENGTH:
+                text = text[:self.MAX_TEXT_LENGTH - 1] + "…"
+            entries.append(f"**Act #{law['law_id']} (Bill #{law['bill_id']}): {law['title']}**\n{text}\n*(Enacted: {enacted})*")
+        embed = discord.Embed(
+            title="Approved Bills",
+            description="\n\n".join(entries) or "There are currently no approved bills.",
+            color=discord.Color.purple()
+        )
+        embed.set_footer(text=f"Page {page + 1}/{total_pages}")
+        return embed
+
+
+class JumpToPageModal(Modal, title='Jump to Page'):
+    page_input = TextInput(label='Page number', placeholder='e.g., 3', min_length=1, max_length=6, required=True)
+
+    def __init__(self, pager: "ApprovedBillsPager"):
+        super().__init__()
+        self.pager = pager
+
+    async def on_submit(self, interaction: discord.Interaction):
+        try:
+            page = int(self.page_input.value) - 1
+        except ValueError:
+            return await interaction.response.send_message("Please enter a page number.", ephemeral=True)
+        await self.pager.show(interaction, page)
+
+
+class ApprovedBillsPager(View):
+    """Prev/Next/Jump controls for one user's ephemeral Approved Bills message."""
+
+    def __init__(self, pages: ApprovedBillsPages, guild_id: Optional[int], page: int = 0):
+        super().__init__(timeout=300)
+        self.pages = pages
+        self.guild_id = guild_id
+        self.page = page
+
+    async def refresh_buttons(self):
+        total_pages = await self.pages.page_count(self.guild_id)
+        self.prev_button.disabled = self.page <= 0
+        self.next_button.disabled = self.page >= total_pages - 1
+        self.jump_button.disabled = total_pages <= 1
+
+    @INTERACTION_SECONDS.time(handler="approved_bills_page")
+    async def show(self, interaction: discord.Interaction, page: int):
+        total_pages = await self.pages.page_count(self.guild_id)
+        self.page = min(max(page, 0), total_pages - 1)
+        embed = await self.pages.get(self.guild_id, self.page)
+        await self.refresh_buttons()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="◀ Prev", style=discord.ButtonStyle.secondary)
+    async def prev_button(self, interaction: discord.Interaction, button: Button):
+        await self.show(interaction, self.page - 1)
 
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: Button):
+        await self.show(interaction, self.page + 1)
 
-class StatutesView(View):
-    def __init__(self, bot_instance: discord.Client, base_rules_url: str, db_manager: DBManager):
+    @discord.ui.button(label="Jump to…", style=discord.ButtonStyle.primary)
+    async def jump_button(self, interaction: discord.Interaction, button: Button):
+        await interaction.response.send_modal(JumpToPageModal(self))
+
+
+class StatutesView(RateLimitedMixin, View):
+    def __init__(self, bot_instance: discord.Client, base_rules_url: str, db_manager: DBManager,
+                 pages: Optional[ApprovedBillsPages] = None):
         super().__init__(timeout=None)
         self.bot = bot_instance
         self.db_manager = db_manager
+        self.pages = pages or ApprovedBillsPages(db_manager)
         # Link button - no custom_id allowed on link buttons
         self.add_item(Button(label="Base Rules (Constitution)", style=discord.ButtonStyle.link, url=base_rules_url))
         # Add a callback button for viewing approved bills
         self.add_item(Button(label="View Approved Bills", style=discord.ButtonStyle.primary, custom_id="view_approved_bills"))
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if not await super().interaction_check(interaction):
+            return False
         # Only intercept the approved bills button; link button handled by Discord
         if interaction.data.get("custom_id") == "view_approved_bills":
             await self.show_approved_bills(interaction)
             return False
         return True
 
+    @INTERACTION_SECONDS.time(handler="approved_bills")
     async def show_approved_bills(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
-        laws = await self.db_manager.get_all_approved_laws()
-        if not laws:
+        if not await self.pages.law_count(interaction.guild_id):
             await interaction.followup.send("There are currently no approved bills.", ephemeral=True)
             return
 
-        approved_text = ""
-        for law in laws:
-            enacted = law["enacted_at"].split(".")[0]
-            approved_text += f"**Act #{law['law_id']} (Bill #{law['bill_id']}): {law['title']}**\n{law['text']}\n*(Enacted: {enacted})*\n\n"
-
-        # chunking to avoid >2000 characters
-        chunks = [approved_text[i:i + 1900] for i in range(0, len(approved_text), 1900)]
-        for i, chunk in enumerate(chunks):
-            await interaction.followup.send(f"__**Approved Bills (Part {i+1}):**__\n{chunk}", ephemeral=True)
+        pager = ApprovedBillsPager(self.pages, interaction.guild_id)
+        embed = await self.pages.get(interaction.guild_id, 0)
+        await pager.refresh_buttons()
+        await interaction.followup.send(embed=embed, view=pager, ephemeral=True)
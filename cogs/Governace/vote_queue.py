@@ -0,0 +1,100 @@
+# cogs/Governace/vote_queue.py
+import asyncio
+from typing import List, Optional, Tuple
+
+# A batch is written once it holds MAX_BATCH_SIZE votes or FLUSH_INTERVAL_SECONDS
+# have passed since its first vote arrived, whichever comes first.
+FLUSH_INTERVAL_SECONDS = 0.005
+MAX_BATCH_SIZE = 256
+
+_STOP = object()
+
+
+class VoteQueue:
+    """Group-commit queue: concurrent vote clicks share one transaction.
+
+    Each caller awaits its own future and still gets an individual
+    (outcome, previous vote) answer, as from DBManager.record_votes.
+    """
+
+    def __init__(self, db_manager, flush_interval: float = FLUSH_INTERVAL_SECONDS, max_batch: int = MAX_BATCH_SIZE):
+        self.db_manager = db_manager
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self):
+        if not self.running:
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Write out everything already queued, then stop the worker."""
+        if not self.running:
+            return
+        self._queue.put_nowait(_STOP)
+        await self._worker
+        self._worker = None
+
+    async def drain(self):
+        """Wait until every vote queued so far has been written."""
+        if self.running:
+            await self._queue.join()
+
+    async def submit(self, user_id: int, bill_id: int, vote_type: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Queue a vote and wait for the batch containing it to commit."""
+        if not self.running:
+            # No worker (not initialized yet, or shutting down): write directly.
+            results = await self.db_manager.record_votes([(user_id, bill_id, vote_type)])
+            return results[0]
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((user_id, bill_id, vote_type, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stopping = False
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if item is _STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+            for _ in batch:
+                self._queue.task_done()
+            if stopping:
+                return
+
+    async def _flush(self, batch: List[Tuple[int, int, Optional[str], asyncio.Future]]):
+        try:
+            results = await self.db_manager.record_votes([(u, b, t) for u, b, t, _ in batch])
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (*_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -2,6 +2,13 @@ import discord
 from discord.ext import commands
 from discord import app_commands, Interaction
 
+from ratelimit import InteractionLimiter
+
+# Renames allowed per user and per server: (renames, seconds).
+# Discord itself only lets a channel be renamed twice every 10 minutes.
+RENAME_RATE_PER_USER = (2, 60)
+RENAME_RATE_PER_GUILD = (5, 60)
+
 double_struck_map = {
     # Uppercase
     "A": "𝔸", "B": "𝔹", "C": "ℂ", "D": "𝔻", "E": "𝔼", "F": "𝔽", "G": "𝔾",
@@ -36,6 +43,11 @@ def to_double_struck(text: str) -> str:
 class Server(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.rate_limiter = InteractionLimiter("server", RENAME_RATE_PER_USER, RENAME_RATE_PER_GUILD)
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        # Covers every command of this cog (currently only the renames)
+        return await self.rate_limiter.app_check(interaction)
 
 
     server_group = app_commands.Group(name="server", description="Server management commands")
@@ -0,0 +1,199 @@
+# ipc.py
+# Small local RPC channel between the bot process and an out-of-process dashboard.
+# Newline-delimited JSON over a Unix socket:
+#   request:  {"id": 1, "method": "status", "params": {}}
+#   response: {"id": 1, "result": ...}  or  {"id": 1, "error": "..."}
+# Methods that return an async iterator stream instead, one line per item, until the
+# client disconnects:  {"id": 1, "item": ...}
+import asyncio
+import itertools
+import json
+import os
+import socket
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+import discord
+
+from metrics import REGISTRY
+
+Handler = Callable[..., Awaitable[Any]]
+
+
+def bot_methods(bot: discord.Client) -> Dict[str, Handler]:
+    """The bot operations the dashboard may call, by name."""
+
+    async def status():
+        return {
+            "user": str(bot.user) if bot.user else None,
+            "ready": bot.is_ready(),
+            "latency_ms": round(bot.latency * 1000, 1) if bot.is_ready() else None,
+            "guilds": len(bot.guilds),
+            "shards": bot.shard_count,
+        }
+
+    async def metrics():
+        return REGISTRY.render()
+
+    async def governance_feed():
+        governance = bot.get_cog("Governance")
+        if governance is None:
+            raise LookupError("Governance is not loaded.")
+        return governance.live_feed.hub.relay_items()
+
+    return {"status": status, "metrics": metrics, "governance_feed": governance_feed}
+
+
+class LocalBotBridge:
+    """Same interface as IPCClient, for a dashboard running inside the bot process."""
+
+    def __init__(self, methods: Dict[str, Handler]):
+        self.methods = methods
+
+    async def call(self, method: str, **params) -> Any:
+        handler = self.methods.get(method)
+        if handler is None:
+            raise LookupError(f"Unknown bot method: {method}")
+        return await handler(**params)
+
+    async def stream(self, method: str, **params) -> AsyncIterator[Any]:
+        async for item in await self.call(method, **params):
+            yield item
+
+    async def close(self):
+        pass
+
+
+class IPCServer:
+    """Serves bot methods on a Unix socket (bot process side)."""
+
+    def __init__(self, socket_path: str, methods: Dict[str, Handler]):
+        self.socket_path = socket_path
+        self.methods = methods
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Set[asyncio.StreamWriter] = set()
+        self._streams: Set[asyncio.Task] = set()
+
+    async def start(self):
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)  # stale socket from a previous run
+        # Bind under a umask so the socket is owner-only from the moment it exists; the
+        # bind is synchronous, so the umask is back before any other task runs
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            sock.bind(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            os.umask(old_umask)
+        self._server = await asyncio.start_unix_server(self._handle_client, sock=sock)
+
+    async def stop(self):
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in list(self._clients):
+            writer.close()  # readline() returns EOF and each client handler exits
+        for task in list(self._streams):
+            task.cancel()  # streams may be waiting for their next item
+        await self._server.wait_closed()
+        self._server = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._clients.add(writer)
+        try:
+            while line := await reader.readline():
+                request = json.loads(line)
+                response = {"id": request.get("id")}
+                handler = self.methods.get(request.get("method"))
+                if handler is None:
+                    response["error"] = f"Unknown bot method: {request.get('method')}"
+                else:
+                    try:
+                        response["result"] = await handler(**request.get("params", {}))
+                    except Exception as e:
+                        response["error"] = f"{type(e).__name__}: {e}"
+                if hasattr(response.get("result"), "__aiter__"):
+                    await self._stream(writer, response["id"], response["result"])
+                    break
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, json.JSONDecodeError, asyncio.CancelledError):
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _stream(self, writer: asyncio.StreamWriter, request_id: Any, items):
+        """Write every item of a streaming method; the connection carries nothing else afterwards."""
+        task = asyncio.current_task()
+        self._streams.add(task)
+        try:
+            async for item in items:
+                writer.write(json.dumps({"id": request_id, "item": item}, default=str).encode() + b"\n")
+                await writer.drain()
+        finally:
+            self._streams.discard(task)
+            await items.aclose()
+
+
+class IPCClient:
+    """Calls bot methods over the Unix socket (dashboard process side).
+
+    Keeps one connection open and reconnects on the next call if it drops.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 5.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+        self._ids = itertools.count(1)
+
+    async def call(self, method: str, **params) -> Any:
+        async with self._lock:
+            try:
+                return await asyncio.wait_for(self._roundtrip(method, params), self.timeout)
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+                await self.close()
+                raise ConnectionError(f"Bot process unavailable: {e}") from e
+
+    async def _roundtrip(self, method: str, params: Dict[str, Any]) -> Any:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+        self._writer.write(json.dumps({"id": next(self._ids), "method": method, "params": params}).encode() + b"\n")
+        await self._writer.drain()
+        line = await self._reader.readline()
+        if not line:
+            raise asyncio.IncompleteReadError(b"", None)
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    async def stream(self, method: str, **params) -> AsyncIterator[Any]:
+        """Items of a streaming bot method, on a connection of its own. Raises ConnectionError when it drops."""
+        try:
+            reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        except OSError as e:
+            raise ConnectionError(f"Bot process unavailable: {e}") from e
+        try:
+            writer.write(json.dumps({"id": 1, "method": method, "params": params}).encode() + b"\n")
+            await writer.drain()
+            while line := await reader.readline():
+                response = json.loads(line)
+                if "error" in response:
+                    raise RuntimeError(response["error"])
+                yield response["item"]
+            raise ConnectionError("Bot process closed the stream.")
+        finally:
+            writer.close()
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
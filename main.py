@@ -2,14 +2,16 @@
 
 import os
 import asyncio
+import time
 from dotenv import load_dotenv
 import discord
+from discord import app_commands
 from discord.ext import commands
 import uvicorn
 
-# Import the FastAPI app instance from your dashboard module
-# The 'as dashboard_app' alias is used to avoid name conflicts.
-from dashboard.app import app as dashboard_app
+from ipc import IPCServer, LocalBotBridge, bot_methods
+from metrics import STARTUP_PHASE_SECONDS, LoopLagProbe, instrument_http, router as metrics_router, startup_phase
+from ratelimit import RateLimited
 
 # --- Configuration ---
 # Load environment variables from a .env file
@@ -17,42 +19,75 @@ load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 if not TOKEN:
     raise ValueError("DISCORD_TOKEN is missing from your .env file!")
+# Optional: force a shard count. Leave unset to use the count Discord recommends.
+SHARD_COUNT = int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None
+# Where the dashboard runs:
+#   "inprocess" - uvicorn inside this process, on the bot's event loop (small installs)
+#   "external"  - run_dashboard.py in separate process(es); this process only serves IPC
+#   "off"       - no dashboard
+DASHBOARD_MODE = os.getenv("DASHBOARD_MODE", "inprocess")
+IPC_SOCKET = os.getenv("BOT_IPC_SOCKET", "bot.sock")
 
 # --- Custom Bot Class ---
-class CombinedBot(commands.Bot):
+class CombinedBot(commands.AutoShardedBot):
     """
     A custom bot class that integrates a FastAPI web server.
+    Runs as an AutoShardedBot so guild load spreads across gateway shards.
     """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.web_server_task = None
         self.uvicorn_server = None
+        self.ipc_server = None
+        self.loop_lag_probe = LoopLagProbe()
+        self.started_at = time.perf_counter()
+        self.ready_count = 0  # on_ready fires again after every reconnect
+        self.tree.error(self.on_tree_error)
 
     async def setup_hook(self):
         """
         This special method is called by discord.py after login but before
         connecting to the gateway. It's the ideal place for async setup tasks.
         """
-        # --- 1. Load Cogs ---
         print("- - - - - - - - - - - - - - - -")
-        print("Loading Cogs...")
-        # Example cog loading logic (customize for your project)
-        for folder in os.listdir("./cogs"):
-            path = f"./cogs/{folder}"
-            if os.path.isdir(path):
-                cog_path = f"cogs.{folder}.cog"
-                try:
-                    await bot.load_extension(cog_path)
-                    print(f"Loaded cog from {cog_path}")
-                except Exception as e:
-                    print(f"Failed to load {cog_path}: {e}")
-        print("Cogs loaded successfully.")
+        print("Starting up...")
+        # --- 0. Metrics: event-loop lag and Discord REST calls ---
+        with startup_phase("metrics"):
+            self.loop_lag_probe.start()
+            instrument_http(self.http)
+
+        # --- 1. Load Cogs ---
+        # All at once: each cog's one-time setup (cog_load) overlaps with the others'
+        with startup_phase("cogs"):
+            cog_paths = [
+                f"cogs.{folder}.cog" for folder in sorted(os.listdir("./cogs"))
+                if os.path.isdir(f"./cogs/{folder}") and not folder.startswith("_")
+            ]
+            await asyncio.gather(*(self._load_cog(cog_path) for cog_path in cog_paths))
         print("- - - - - - - - - - - - - - - -")
 
+        if DASHBOARD_MODE == "external":
+            # --- 2. Serve bot methods to the out-of-process dashboard ---
+            self.ipc_server = IPCServer(IPC_SOCKET, bot_methods(self))
+            await self.ipc_server.start()
+            print(f"IPC socket for the dashboard listening at {IPC_SOCKET}")
+            print("- - - - - - - - - - - - - - - -")
+            return
+        if DASHBOARD_MODE == "off":
+            return
+
         # --- 2. Share Bot Instance with FastAPI ---
+        # Imported only here: the external and off modes don't need the dashboard package.
+        # The 'as dashboard_app' alias is used to avoid name conflicts.
+        from dashboard.app import app as dashboard_app
+        from cogs.Governace.dashboard_routes import router as governance_router
+
         # This makes the 'bot' object available in your FastAPI routes
         # via 'request.app.state.bot'.
         dashboard_app.state.bot = self
+        dashboard_app.state.bot_bridge = LocalBotBridge(bot_methods(self))
+        dashboard_app.include_router(governance_router)
+        dashboard_app.include_router(metrics_router)
         print("Bot instance shared with FastAPI app.")
 
         # --- 3. Start the Uvicorn Web Server ---
@@ -64,19 +99,39 @@ class CombinedBot(commands.Bot):
             log_level="info"
         )
         self.uvicorn_server = uvicorn.Server(config)
-        
+
         # Start the server
         self.web_server_task = asyncio.create_task(self.uvicorn_server.serve())
         print(f"Dashboard started on http://0.0.0.0:8000")
         print("- - - - - - - - - - - - - - - -")
 
+    async def on_tree_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        # Rate-limited commands were already answered by the limiter; not worth a traceback
+        if isinstance(error, RateLimited):
+            return
+        await app_commands.CommandTree.on_error(self.tree, interaction, error)
+
+    async def _load_cog(self, cog_path: str):
+        try:
+            with startup_phase(f"load {cog_path}"):
+                await self.load_extension(cog_path)
+        except Exception as e:
+            print(f"Failed to load {cog_path}: {e}")
+
     async def on_ready(self):
         """
         Event fired when the bot is fully connected and ready.
         """
+        self.ready_count += 1
+        if self.ready_count > 1:
+            print(f"Reconnected and ready again (#{self.ready_count - 1}).")
+            return
+        ready_after = time.perf_counter() - self.started_at
+        STARTUP_PHASE_SECONDS.set(ready_after, phase="ready")
         print(f"\nLogged in as: {self.user.name} (ID: {self.user.id})")
         print(f"Discord.py Version: {discord.__version__}")
-        print("Bot is online and ready! 🚀")
+        print(f"Shards: {self.shard_count} | Guilds: {len(self.guilds)}")
+        print(f"Bot is online and ready! 🚀 ({ready_after:.2f} s after start)")
         print("- - - - - - - - - - - - - - - -")
 
     async def close(self):
@@ -91,8 +146,12 @@ class CombinedBot(commands.Bot):
             # Wait for the server task to finish
             if self.web_server_task:
                 await asyncio.wait([self.web_server_task], timeout=5.0)
-        
-        # Then, call the original close method to shut down the bot
+        if self.ipc_server:
+            await self.ipc_server.stop()
+        await self.loop_lag_probe.stop()
+
+        # Then, call the original close method to shut down the bot. It unloads every cog first,
+        # and each cog stops its own tasks before closing its database (see cog_unload).
         await super().close()
         print("Bot and dashboard have been closed.")
 
@@ -105,7 +164,7 @@ if __name__ == "__main__":
     intents.members = True          # Enable member tracking if needed
 
     # Create an instance of our custom bot
-    bot = CombinedBot(command_prefix="!", intents=intents)
+    bot = CombinedBot(command_prefix="!", intents=intents, shard_count=SHARD_COUNT)
     
     # The bot.run() method handles the entire application lifecycle,
     # including catching KeyboardInterrupt (Ctrl+C) and calling bot.close().
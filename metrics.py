@@ -0,0 +1,270 @@
+# metrics.py
+# In-process metrics in the Prometheus text format, served at /metrics on the dashboard.
+# Recording is a dict lookup plus a couple of additions, so it stays on in production.
+import asyncio
+import functools
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+
+# Upper bounds in seconds; suits DB calls (sub-ms) through Discord round-trips (seconds)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[n]) for n in self.label_names)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.label_names, k)} {v}" for k, v in self._values.items()]
+
+
+class Gauge(_Metric):
+    """A value that is set directly, or read from a callback at scrape time."""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self._functions: Dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels):
+        self._values[self._key(labels)] = value
+
+    def set_function(self, function: Callable[[], float], **labels):
+        self._functions[self._key(labels)] = function
+
+    def _samples(self) -> List[str]:
+        values = dict(self._values)
+        for key, function in self._functions.items():
+            try:
+                values[key] = function()
+            except Exception:
+                continue
+        return [f"{self.name}{_format_labels(self.label_names, k)} {v}" for k, v in values.items()]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last), sum]
+        self._values: Dict[LabelValues, List] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def time(self, **labels):
+        """Decorator for coroutine functions: observe how long each call takes."""
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.observe(time.perf_counter() - start, **labels)
+            return wrapper
+        return decorator
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound!r}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _add(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            # Re-registering (e.g. a reloaded cog) returns the metric already collecting
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Counter:
+        return self._add(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._add(Gauge(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, documentation, labels, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+INTERACTION_SECONDS = REGISTRY.histogram(
+    "interaction_handler_seconds", "Time spent handling a component or modal interaction.", ["handler"])
+LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "event_loop_lag_seconds", "How late the event loop ran a timer that was due.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0))
+ASYNCIO_TASKS = REGISTRY.gauge("asyncio_tasks", "Tasks alive on the bot's event loop.")
+DISCORD_HTTP_REQUESTS = REGISTRY.counter(
+    "discord_http_requests_total", "Discord REST calls by route and outcome.", ["method", "route", "status"])
+DISCORD_HTTP_SECONDS = REGISTRY.histogram(
+    "discord_http_request_seconds", "Discord REST call latency, including rate-limit waits.", ["method", "route"])
+STARTUP_PHASE_SECONDS = REGISTRY.gauge("startup_phase_seconds", "Duration of each startup phase.", ["phase"])
+
+
+# ---------- Instrumentation helpers ----------
+def time_methods(histogram: Histogram, label: str = "method"):
+    """Class decorator: time every public coroutine method, labelled by its name."""
+    def decorator(cls):
+        for name, attr in list(vars(cls).items()):
+            if not name.startswith("_") and asyncio.iscoroutinefunction(attr):
+                setattr(cls, name, histogram.time(**{label: name})(attr))
+        return cls
+    return decorator
+
+
+def instrument_http(http) -> None:
+    """Count and time every request made through a discord.py HTTPClient."""
+    original = http.request
+
+    @functools.wraps(original)
+    async def request(route, *args, **kwargs):
+        # route.path is the template ("/channels/{channel_id}/messages"), so cardinality stays low
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            return await original(route, *args, **kwargs)
+        except Exception as e:
+            status = str(getattr(e, "status", type(e).__name__))
+            raise
+        finally:
+            DISCORD_HTTP_SECONDS.observe(time.perf_counter() - start, method=route.method, route=route.path)
+            DISCORD_HTTP_REQUESTS.inc(method=route.method, route=route.path, status=status)
+
+    http.request = request
+
+
+class LoopLagProbe:
+    """Background task that measures event-loop lag: how late a short sleep wakes up."""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            ASYNCIO_TASKS.set_function(lambda: len(asyncio.all_tasks()))
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            LOOP_LAG_SECONDS.observe(max(0.0, loop.time() - expected))
+
+
+@contextmanager
+def startup_phase(name: str):
+    """Time one startup phase: printed, and exported as startup_phase_seconds{phase=name}."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STARTUP_PHASE_SECONDS.set(elapsed, phase=name)
+        print(f"  {name}: {elapsed * 1000:.1f} ms")
+
+
+# ---------- Dashboard endpoint ----------
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(request: Request):
+    """Bot metrics, answered by the bot process (directly or over IPC)."""
+    try:
+        return PlainTextResponse(await request.app.state.bot_bridge.call("metrics"))
+    except ConnectionError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+# Included only by run_dashboard.py: in-process, REGISTRY is the bot's own and /metrics covers it
+process_router = APIRouter(tags=["metrics"])
+
+
+@process_router.get("/metrics/dashboard", response_class=PlainTextResponse)
+async def dashboard_metrics():
+    """Metrics of this dashboard worker process (e.g. its read-only DB calls); one worker per scrape."""
+    return PlainTextResponse(REGISTRY.render())
@@ -0,0 +1,157 @@
+# ratelimit.py
+# In-memory token buckets for Discord interactions. A bucket holds up to `rate` tokens and
+# refills at rate/per tokens a second; every interaction takes one. A bucket left idle
+# for `per` seconds is full again, i.e. no different from a new one, so it is dropped:
+# memory follows the users active right now, with a hard cap for floods of new keys.
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+import discord
+from discord import app_commands
+
+from metrics import REGISTRY
+
+RATE_LIMITED = REGISTRY.counter("interactions_rate_limited_total", "Interactions refused by a rate limiter.",
+                                ["limiter", "scope"])
+RATE_LIMIT_BUCKETS = REGISTRY.gauge("rate_limit_buckets", "Token buckets held in memory.", ["limiter", "scope"])
+
+# Most buckets one limiter keeps; past this the least recently used go first
+MAX_BUCKETS = 10000
+
+Rate = Tuple[int, float]  # (interactions, seconds)
+
+
+class RateLimited(app_commands.CheckFailure):
+    """Raised by InteractionLimiter.app_check; the user has already been answered."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limited; retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucketLimiter:
+    """One token bucket per key, least recently used first."""
+
+    def __init__(self, rate: int, per: float, max_buckets: int = MAX_BUCKETS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.per = per
+        self.max_buckets = max_buckets
+        self.clock = clock
+        # key -> [tokens, updated_at, warned_until]
+        self._buckets: "OrderedDict[Hashable, list]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _bucket(self, key: Hashable, now: float) -> list:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.rate), now, 0.0]
+            self._evict(now)
+        else:
+            bucket[0] = min(self.rate, bucket[0] + (now - bucket[1]) * self.rate / self.per)
+            bucket[1] = now
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def _evict(self, now: float):
+        # Oldest first, so this stops at the first bucket still in use
+        while self._buckets:
+            key, (_, updated_at, _) = next(iter(self._buckets.items()))
+            if now - updated_at < self.per and len(self._buckets) <= self.max_buckets:
+                break
+            del self._buckets[key]
+
+    def retry_after(self, key: Hashable, now: Optional[float] = None) -> float:
+        """Seconds until `key` has a token (0 if it has one now). Takes nothing."""
+        now = self.clock() if now is None else now
+        tokens = self._bucket(key, now)[0]
+        return 0.0 if tokens >= 1 else (1 - tokens) * self.per / self.rate
+
+    def take(self, key: Hashable, now: Optional[float] = None):
+        self._bucket(key, self.clock() if now is None else now)[0] -= 1
+
+    def acquire(self, key: Hashable, now: Optional[float] = None) -> float:
+        """Take a token if there is one. Returns 0 on success, else seconds until one is available."""
+        now = self.clock() if now is None else now
+        wait = self.retry_after(key, now)
+        if not wait:
+            self.take(key, now)
+        return wait
+
+    def should_warn(self, key: Hashable, wait: float, now: Optional[float] = None) -> bool:
+        """True once per refusal window, so a spammer reads the explanation once rather than once per click."""
+        now = self.clock() if now is None else now
+        bucket = self._bucket(key, now)
+        if bucket[2] > now:
+            return False
+        bucket[2] = now + wait
+        return True
+
+
+class InteractionLimiter:
+    """Per-user and per-guild budgets for one group of interactions (e.g. a cog).
+
+    An interaction needs a token from both buckets and only takes them when both have
+    one. A refusal costs no DB work and one cheap response: the first refused click per
+    wait gets an ephemeral explanation, later button clicks are just acknowledged (so
+    Discord does not show "This interaction failed"). Refused forms and slash commands
+    always get the explanation, since the user would otherwise lose what they typed.
+    """
+
+    def __init__(self, name: str, per_user: Optional[Rate], per_guild: Optional[Rate] = None,
+                 max_buckets: int = MAX_BUCKETS, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        # None turns a scope off
+        self.users = TokenBucketLimiter(*per_user, max_buckets, clock) if per_user else None
+        self.guilds = TokenBucketLimiter(*per_guild, max_buckets, clock) if per_guild else None
+        for scope in ("users", "guilds"):
+            RATE_LIMIT_BUCKETS.set_function(lambda scope=scope: len(getattr(self, scope) or ()),
+                                            limiter=name, scope=scope)
+
+    def acquire(self, user_id: int, guild_id: Optional[int]) -> Tuple[float, Optional[str]]:
+        """(0, None) if allowed (tokens taken), else (seconds to wait, "users" or "guilds")."""
+        checks = [(scope, limiter, key) for scope, limiter, key in
+                  (("users", self.users, user_id), ("guilds", self.guilds, guild_id))
+                  if limiter is not None and key is not None]
+        for scope, limiter, key in checks:
+            wait = limiter.retry_after(key)
+            if wait:
+                return wait, scope
+        for _, limiter, key in checks:
+            limiter.take(key)
+        return 0.0, None
+
+    async def _admit(self, interaction: discord.Interaction) -> float:
+        wait, scope = self.acquire(interaction.user.id, interaction.guild_id)
+        if not wait:
+            return 0.0
+        RATE_LIMITED.inc(limiter=self.name, scope=scope)
+        if interaction.response.is_done():
+            return wait
+        warn = self.users.should_warn(interaction.user.id, wait) if self.users is not None else True
+        try:
+            if warn or interaction.type != discord.InteractionType.component:
+                message = "You're doing that too often." if scope == "users" else "This server is very busy right now."
+                if interaction.type == discord.InteractionType.modal_submit:
+                    message += " Your form was not submitted."
+                await interaction.response.send_message(f"{message} Try again in {math.ceil(wait)}s.", ephemeral=True)
+            else:
+                await interaction.response.defer()  # silent acknowledgement of a repeat click
+        except discord.HTTPException:
+            pass
+        return wait
+
+    async def check(self, interaction: discord.Interaction) -> bool:
+        """interaction_check for views, items and modals: False (after a cheap reply) when over budget."""
+        return not await self._admit(interaction)
+
+    async def app_check(self, interaction: discord.Interaction) -> bool:
+        """Cog.interaction_check for slash commands: raises RateLimited when over budget."""
+        wait = await self._admit(interaction)
+        if wait:
+            raise RateLimited(wait)
+        return True
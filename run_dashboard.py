@@ -0,0 +1,59 @@
+# run_dashboard.py
+# Runs the dashboard in its own process(es), next to a bot started with DASHBOARD_MODE=external.
+# Governance data is read straight from governance.db (read-only, WAL); anything that needs
+# the live bot goes over the IPC socket served by main.py. /metrics is the bot's registry,
+# /metrics/dashboard the answering worker's own.
+#
+#   DASHBOARD_MODE=external python main.py
+#   DASHBOARD_WORKERS=4 python run_dashboard.py
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import uvicorn
+from dotenv import load_dotenv
+
+load_dotenv()
+HOST = os.getenv("DASHBOARD_HOST", "0.0.0.0")
+PORT = int(os.getenv("DASHBOARD_PORT", "8000"))
+WORKERS = int(os.getenv("DASHBOARD_WORKERS", "1"))
+IPC_SOCKET = os.getenv("BOT_IPC_SOCKET", "bot.sock")
+
+
+def create_app():
+    """App factory; uvicorn calls it once in every worker process."""
+    from dashboard.app import app
+    from cogs.Governace.constants import DB_PATH
+    from cogs.Governace.dashboard_routes import router as governance_router
+    from cogs.Governace.db_manager import DBManager
+    from cogs.Governace.live_feed import FeedHub, relay_ipc_feed
+    from ipc import IPCClient
+    from metrics import process_router as process_metrics_router, router as metrics_router
+
+    app.include_router(governance_router)
+    app.include_router(metrics_router)
+    app.include_router(process_metrics_router)
+    app_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app_):
+        app.state.governance_db = DBManager(DB_PATH, read_only=True)
+        await app.state.governance_db.initialize()
+        app.state.bot_bridge = IPCClient(IPC_SOCKET)
+        # One feed stream from the bot per worker, fanned out to this worker's clients
+        app.state.feed_hub = FeedHub()
+        relay = asyncio.create_task(relay_ipc_feed(app.state.bot_bridge, app.state.feed_hub))
+        try:
+            async with app_lifespan(app_) as state:
+                yield state
+        finally:
+            relay.cancel()
+            await app.state.bot_bridge.close()
+            await app.state.governance_db.close()
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+if __name__ == "__main__":
+    uvicorn.run("run_dashboard:create_app", factory=True, host=HOST, port=PORT, workers=WORKERS, log_level="info")
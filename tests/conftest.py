@@ -0,0 +1,34 @@
+# tests/conftest.py
+# The DB-backed tests run each scenario with asyncio.run against a fresh database file.
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+import pytest
+
+from cogs.Governace.db_manager import DBManager
+
+GUILD_ID = 1
+
+
+@pytest.fixture
+def run_db(tmp_path):
+    """Call as run_db(scenario): runs `await scenario(db)` with an initialized DBManager, then closes it."""
+    def run(scenario: Callable[[DBManager], Awaitable], **kwargs):
+        async def main():
+            db = DBManager(str(tmp_path / "governance.db"), **kwargs)
+            await db.initialize()
+            try:
+                return await scenario(db)
+            finally:
+                await db.close()
+        return asyncio.run(main())
+    return run
+
+
+async def open_bill(db: DBManager, title: str = "Test bill") -> int:
+    """A new bill of GUILD_ID, already in voting."""
+    bill_id = await db.insert_proposal(title, "Text", 100, GUILD_ID)
+    now = datetime.utcnow()
+    assert await db.open_vote(bill_id, now, now + timedelta(days=1))
+    return bill_id
@@ -0,0 +1,108 @@
+# tests/test_bill_lifecycle.py
+import asyncio
+from datetime import datetime, timedelta
+
+from .conftest import GUILD_ID, open_bill
+
+
+def test_close_bill_passes_and_enacts(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        await db.record_votes([(1, bill_id, "yes"), (2, bill_id, "yes"), (3, bill_id, "no")])
+        prop, counts, law_id = await db.close_bill(bill_id)
+        assert prop["status"] == "passed"
+        assert counts == {"yes": 2, "no": 1, "abstain": 0}
+        assert (prop["yes_count"], prop["no_count"]) == (2, 1)
+        assert law_id is not None
+        assert await db.count_laws(GUILD_ID) == 1
+        assert (await db.get_proposal_by_id(bill_id))["status"] == "passed"
+
+    run_db(scenario)
+
+
+def test_close_bill_fails_on_a_tie(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        await db.record_votes([(1, bill_id, "yes"), (2, bill_id, "no"), (3, bill_id, "abstain")])
+        prop, _, law_id = await db.close_bill(bill_id)
+        assert prop["status"] == "failed"
+        assert law_id is None
+        assert await db.count_laws(GUILD_ID) == 0
+
+    run_db(scenario)
+
+
+def test_concurrent_closes_enact_one_law(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        await db.record_vote(1, bill_id, "yes")
+        results = await asyncio.gather(*(db.close_bill(bill_id) for _ in range(5)))
+        assert sum(result is not None for result in results) == 1
+        assert await db.count_laws(GUILD_ID) == 1
+
+    run_db(scenario)
+
+
+def test_close_bill_only_from_voting(run_db):
+    async def scenario(db):
+        bill_id = await db.insert_proposal("Awaiting", "Text", 100, GUILD_ID)
+        assert await db.close_bill(bill_id) is None
+        assert await db.close_bill(999) is None
+        now = datetime.utcnow()
+        assert await db.open_debate(bill_id, now, now + timedelta(days=1))
+        assert await db.close_bill(bill_id) is None
+        assert (await db.get_proposal_by_id(bill_id))["status"] == "debating"
+
+    run_db(scenario)
+
+
+def test_open_vote_keeps_scheduled_times(run_db):
+    async def scenario(db):
+        bill_id = await db.insert_proposal("Scheduled", "Text", 100, GUILD_ID)
+        start = datetime(2026, 1, 1)
+        await db.open_debate(bill_id, start, start + timedelta(days=2))
+        prop = await db.open_vote(bill_id, start + timedelta(hours=1), start + timedelta(days=9), keep_scheduled=True)
+        assert prop["status"] == "voting"
+        assert prop["vote_end"] == (start + timedelta(days=2)).isoformat()
+        # Already open: a second open is refused
+        assert await db.open_vote(bill_id, start, start) is None
+
+    run_db(scenario)
+
+
+def test_veto_bill(run_db):
+    async def scenario(db):
+        voting = await open_bill(db, "Voting")
+        await db.record_vote(1, voting, "yes")
+        prop = await db.veto_bill(voting, "reason")
+        assert prop["status"] == "vetoed"
+        assert await db.veto_bill(voting) is None
+        # Vetoed bills cannot be closed any more, and keep their votes on record
+        assert await db.close_bill(voting) is None
+        assert await db.count_votes(voting) == {"yes": 1, "no": 0, "abstain": 0}
+
+        passed = await open_bill(db, "Passed")
+        await db.record_vote(1, passed, "yes")
+        await db.close_bill(passed)
+        assert (await db.veto_bill(passed))["status"] == "vetoed"
+        assert (await db.get_proposal_by_id(passed))["status"] == "vetoed"
+
+        assert await db.veto_bill(999) is None
+
+    run_db(scenario)
+
+
+def test_cancel_vote_restores_the_bill(run_db):
+    async def scenario(db):
+        bill_id = await db.insert_proposal("Scheduled", "Text", 100, GUILD_ID)
+        start = datetime(2026, 1, 1)
+        await db.open_debate(bill_id, start, start + timedelta(days=2))
+        before = await db.get_proposal_by_id(bill_id)
+        await db.open_vote(bill_id, start, start + timedelta(days=9))
+        prop = await db.cancel_vote(before)
+        assert (prop["status"], prop["vote_start"], prop["vote_end"]) == ("debating", before["vote_start"], before["vote_end"])
+        assert (await db.get_proposal_by_id(bill_id))["status"] == "debating"
+        # Only a bill still in voting can be put back
+        assert await db.cancel_vote(before) is None
+
+    run_db(scenario)
@@ -0,0 +1,24 @@
+# tests/test_developer.py
+import asyncio
+from types import SimpleNamespace
+
+from discord.utils import maybe_coroutine
+
+from cogs.Developer.cog import Developer
+
+
+def can_run(command, owner: bool) -> bool:
+    async def is_owner(user):
+        return owner
+    interaction = SimpleNamespace(client=SimpleNamespace(is_owner=is_owner), user=SimpleNamespace(id=1))
+
+    async def main():
+        return all([await maybe_coroutine(check, interaction) for check in command.checks])
+    return asyncio.run(main())
+
+
+def test_dbstats_is_owner_only():
+    command = Developer(bot=None).dev_group.get_command("dbstats")
+    assert command.checks
+    assert not can_run(command, owner=False)
+    assert can_run(command, owner=True)
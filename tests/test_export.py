@@ -0,0 +1,69 @@
+# tests/test_export.py
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+from cogs.Governace.clock import VirtualClock
+from cogs.Governace.export import export_stream
+
+from .conftest import GUILD_ID, open_bill
+
+START = datetime(2026, 1, 1)
+
+
+async def read_all(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+async def export_rows(db, kind, **filters):
+    return [json.loads(line) for line in (await read_all(export_stream(db, kind, **filters))).splitlines()]
+
+
+def test_export_filters(run_db):
+    clock = VirtualClock(START)
+
+    async def scenario(db):
+        first = await open_bill(db, "First")
+        await db.record_votes([(1, first, "yes"), (2, first, "yes")])
+        await clock.advance(3600)
+        second = await open_bill(db, "Second")
+        await db.record_votes([(3, second, "yes")])
+        await db.close_bill(first)
+        await db.insert_proposal("Elsewhere", "Text", 100, GUILD_ID + 1)
+
+        assert [r["bill_id"] for r in await export_rows(db, "proposals", guild_id=GUILD_ID)] == [first, second]
+        assert [r["bill_id"] for r in await export_rows(db, "proposals", status="voting", guild_id=GUILD_ID)] == [second]
+        assert [r["user_id"] for r in await export_rows(db, "votes", bill_id=first)] == [1, 2]
+        assert [r["title"] for r in await export_rows(db, "laws")] == ["First"]
+
+        # since is inclusive, until exclusive; aware bounds are compared in UTC
+        later = (START + timedelta(hours=1)).replace(tzinfo=timezone.utc)
+        assert [r["user_id"] for r in await export_rows(db, "votes", since=later)] == [3]
+        assert [r["user_id"] for r in await export_rows(db, "votes", until=later)] == [1, 2]
+
+        # Small batches page through every row once
+        rows = [row async for row in db.iter_export("votes", batch_size=1)]
+        assert [r["user_id"] for r in rows] == [1, 2, 3]
+
+    run_db(scenario, clock=clock)
+
+
+def test_public_export_leaves_out_voters(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        await db.record_votes([(1, bill_id, "yes"), (2, bill_id, "no")])
+
+        rows = await export_rows(db, "votes", public=True)
+        assert [r["vote_type"] for r in rows] == ["yes", "no"]
+        assert all("user_id" not in r for r in rows)
+        # Proposals have nothing private
+        assert "proposer_id" in (await export_rows(db, "proposals", public=True))[0]
+
+        data = gzip.decompress(await read_all(export_stream(db, "votes", fmt="csv", compress=True, public=True)))
+        reader = csv.DictReader(io.StringIO(data.decode()))
+        assert "user_id" not in reader.fieldnames
+        assert [r["vote_type"] for r in reader] == ["yes", "no"]
+
+    run_db(scenario)
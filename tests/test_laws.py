@@ -0,0 +1,61 @@
+# tests/test_laws.py
+from datetime import datetime
+
+from cogs.Governace.clock import VirtualClock
+
+from .conftest import GUILD_ID
+
+OTHER_GUILD = 2
+
+
+async def enact(db, title, guild_id=GUILD_ID):
+    bill_id = await db.insert_proposal(title, "Text", 100, guild_id)
+    return await db.add_law_from_bill(bill_id)
+
+
+def test_keyset_pages_newest_first(run_db):
+    clock = VirtualClock(datetime(2026, 1, 1))
+
+    async def scenario(db):
+        law_ids = []
+        for i in range(7):
+            law_ids.append(await enact(db, f"Law {i}"))
+            # Laws 2 and 3 share a timestamp; law_id breaks the tie
+            if i != 2:
+                await clock.advance(60)
+        await enact(db, "Elsewhere", OTHER_GUILD)
+        newest_first = law_ids[::-1]
+
+        pages, after = [], None
+        while page := await db.get_laws_page(GUILD_ID, after, limit=3):
+            pages.append([law["law_id"] for law in page])
+            after = (page[-1]["enacted_at"], page[-1]["law_id"])
+        assert pages == [newest_first[:3], newest_first[3:6], newest_first[6:]]
+        assert await db.count_laws(GUILD_ID) == 7
+        assert await db.count_laws(OTHER_GUILD) == 1
+
+        # A new law shows up on the (cached) first page
+        new_id = await enact(db, "Newest")
+        assert (await db.get_laws_page(GUILD_ID, limit=3))[0]["law_id"] == new_id
+
+    run_db(scenario, clock=clock)
+
+
+def test_jump_to_page(run_db):
+    clock = VirtualClock(datetime(2026, 1, 1))
+
+    async def scenario(db):
+        law_ids = []
+        for i in range(7):
+            law_ids.append(await enact(db, f"Law {i}"))
+            await clock.advance(60)
+        newest_first = law_ids[::-1]
+
+        # Page 3 of 3-law pages starts after the key of the 6th law
+        after = await db.get_law_key_at(5, GUILD_ID)
+        assert after[1] == newest_first[5]
+        assert [law["law_id"] for law in await db.get_laws_page(GUILD_ID, after, limit=3)] == newest_first[6:]
+        assert await db.get_law_key_at(7, GUILD_ID) is None
+        assert await db.get_law_key_at(0, OTHER_GUILD) is None
+
+    run_db(scenario, clock=clock)
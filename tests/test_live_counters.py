@@ -0,0 +1,40 @@
+# tests/test_live_counters.py
+from .conftest import open_bill
+
+
+async def stored_counts(db, bill_id):
+    async with db._read() as conn:
+        cursor = await conn.execute("SELECT yes_count, no_count, abstain_count FROM proposals WHERE bill_id = ?", (bill_id,))
+        row = await cursor.fetchone()
+    return {"yes": row[0], "no": row[1], "abstain": row[2]}
+
+
+def test_live_counters_follow_changes_and_write_back(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        await db.open_tally(bill_id)
+        await db.record_votes([(1, bill_id, "yes"), (2, bill_id, "yes")])
+        await db.record_votes([(1, bill_id, "no"), (2, bill_id, None)])
+        assert await db.get_vote_counts(bill_id) == {"yes": 0, "no": 1, "abstain": 0}
+        assert await db.get_vote_counts(bill_id) == await db.count_votes(bill_id)
+        # Counted in memory: the row only catches up on flush
+        assert await stored_counts(db, bill_id) == {"yes": 0, "no": 0, "abstain": 0}
+        await db.tallies.flush()
+        assert await stored_counts(db, bill_id) == {"yes": 0, "no": 1, "abstain": 0}
+
+    run_db(scenario)
+
+
+def test_open_tally_reconciles_from_votes(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        await db.record_votes([(1, bill_id, "yes"), (2, bill_id, "abstain")])
+        # A lost write-back: the stored counters are stale
+        await db.write_vote_counts([(bill_id, {"yes": 0, "no": 5, "abstain": 0})])
+        await db.open_tally(bill_id, reconcile=True)
+        assert await db.get_vote_counts(bill_id) == {"yes": 1, "no": 0, "abstain": 1}
+        assert await db.reconcile_vote_counts(bill_id) == {"yes": 1, "no": 0, "abstain": 1}
+        assert bill_id not in db.tallies
+        assert await stored_counts(db, bill_id) == {"yes": 1, "no": 0, "abstain": 1}
+
+    run_db(scenario)
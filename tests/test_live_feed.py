@@ -0,0 +1,79 @@
+# tests/test_live_feed.py
+import asyncio
+
+from cogs.Governace.events import BillVetoed, EventBus, VoteCast
+from cogs.Governace.live_feed import FeedHub, LiveFeed
+
+
+class FakeCounts:
+    def __init__(self):
+        self.reads = []
+
+    async def get_vote_counts(self, bill_id):
+        self.reads.append(bill_id)
+        return {"yes": len(self.reads), "no": 0, "abstain": 0}
+
+
+def test_updates_with_a_key_coalesce():
+    async def main():
+        hub = FeedHub(client_buffer=3)
+        client = hub.connect()
+        hub.publish("tally", {"n": 1}, key="tally:1")
+        hub.publish("vetoed", {"bill_id": 2})
+        hub.publish("tally", {"n": 2}, key="tally:1")
+        batch = await client.next_batch(0)
+        # The latest tally only, queued behind the update that came between
+        assert len(batch) == 2 and batch[1][0] == "tally:1"
+        assert b'"n": 2' in batch[1][1]
+
+        # Past the buffer the oldest updates go
+        for n in range(5):
+            hub.publish("proposal", {"n": n})
+        assert len(await client.next_batch(0)) == 3
+        assert client.dropped == 2
+        assert await client.next_batch(0) == []
+
+    asyncio.run(main())
+
+
+def test_relay_keeps_coalescing_keys():
+    async def main():
+        upstream, downstream = FeedHub(), FeedHub()
+        client = downstream.connect()
+        items = upstream.relay_items()
+        first = asyncio.ensure_future(items.__anext__())
+        await asyncio.sleep(0)  # the relay connects before anything is published
+        upstream.publish("tally", {"n": 1}, key="tally:1")
+        upstream.publish("vetoed", {"bill_id": 2})
+        batch = await first
+        assert [key for key, _ in batch] == ["tally:1", None]
+
+        for _ in range(2):  # the same batch relayed twice: the tally coalesces, the one-off does not
+            for key, payload in batch:
+                downstream.publish_encoded(payload.encode(), key)
+        assert len(await client.next_batch(0)) == 3
+        await items.aclose()
+
+    asyncio.run(main())
+
+
+def test_votes_publish_one_tally_per_interval():
+    async def main():
+        bus, counts = EventBus(), FakeCounts()
+        feed = LiveFeed(counts, bus, interval=0.05)
+        client = feed.hub.connect()
+        bus.start()
+        feed.start()
+        for user_id in range(10):
+            await bus.publish(VoteCast(bill_id=1, user_id=user_id, choice="yes"))
+        await bus.publish(BillVetoed(bill_id=2))
+        await asyncio.sleep(0.2)
+        await feed.stop()
+        await bus.stop()
+
+        assert counts.reads == [1]
+        batch = await client.next_batch(0)
+        assert [key for key, _ in batch][-1] == "tally:1"
+        assert b"event: vetoed" in batch[0][1]
+
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+# tests/test_ratelimit.py
+import pytest
+
+from ratelimit import InteractionLimiter, TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_denies_then_refills():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(3, 6.0, clock=clock)  # 3 tokens, one back every 2s
+    assert [limiter.acquire("a") for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire("a") == pytest.approx(2.0)
+    assert limiter.acquire("b") == 0  # buckets are per key
+
+    clock.now += 1.5
+    assert limiter.retry_after("a") == pytest.approx(0.5)
+    clock.now += 0.5
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == pytest.approx(2.0)
+
+    # Never more than `rate` tokens, however long the wait
+    clock.now += 60
+    assert [limiter.acquire("a") for _ in range(4)][-1] == pytest.approx(2.0)
+
+
+def test_warns_once_per_refusal_window():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(1, 10.0, clock=clock)
+    limiter.acquire("a")
+    wait = limiter.acquire("a")
+    assert limiter.should_warn("a", wait)
+    assert not limiter.should_warn("a", limiter.acquire("a"))
+    clock.now += wait
+    assert limiter.should_warn("a", 1.0)
+
+
+def test_idle_and_excess_buckets_are_dropped():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(1, 10.0, max_buckets=2, clock=clock)
+    for key in "abc":
+        limiter.acquire(key)
+    assert len(limiter) == 2  # "a" was the least recently used
+    assert limiter.retry_after("b") > 0
+
+    clock.now += 10
+    limiter.acquire("d")
+    assert len(limiter) == 1
+
+
+def test_interaction_limiter_takes_from_both_scopes():
+    clock = FakeClock()
+    limiter = InteractionLimiter("test", per_user=(2, 10.0), per_guild=(3, 10.0), clock=clock)
+    assert limiter.acquire(1, 100) == (0, None)
+    assert limiter.acquire(1, 100) == (0, None)
+    wait, scope = limiter.acquire(1, 100)
+    assert scope == "users" and wait == pytest.approx(5.0)
+
+    assert limiter.acquire(2, 100) == (0, None)
+    wait, scope = limiter.acquire(3, 100)
+    assert scope == "guilds" and wait == pytest.approx(10 / 3)
+    # A refusal takes nothing from the user's bucket; DMs have no guild bucket
+    assert limiter.acquire(3, None) == (0, None)
+    assert limiter.acquire(3, None) == (0, None)
+
+    off = InteractionLimiter("off", per_user=None)
+    assert all(off.acquire(1, 100) == (0, None) for _ in range(100))
@@ -0,0 +1,73 @@
+# tests/test_scheduler.py
+from datetime import datetime, timedelta
+
+from cogs.Governace.clock import VirtualClock
+from cogs.Governace.scheduler import VOTE_END, VOTE_START, DeadlineScheduler
+
+START = datetime(2026, 1, 1)
+
+
+def make_scheduler(db, clock, fired):
+    async def handler(kind, bill_id):
+        fired.append((clock.now(), bill_id, kind))
+    handlers = {kind: (lambda bill_id, kind=kind: handler(kind, bill_id)) for kind in (VOTE_START, VOTE_END)}
+    return DeadlineScheduler(db, handlers, clock)
+
+
+async def add_bills(db, count=3):
+    """Bills 1..count; deadlines reference them."""
+    for i in range(count):
+        await db.insert_proposal(f"Bill {i + 1}", "Text", 100, 1)
+
+
+def test_fires_in_order_and_skips_cancelled(run_db):
+    async def scenario(db):
+        await add_bills(db)
+        clock = VirtualClock(START)
+        fired = []
+        scheduler = make_scheduler(db, clock, fired)
+        scheduler.start()
+        await scheduler.schedule(1, VOTE_END, START + timedelta(hours=3))
+        await scheduler.schedule(2, VOTE_START, START + timedelta(hours=1))
+        await scheduler.schedule(2, VOTE_END, START + timedelta(hours=2))
+        await scheduler.schedule(3, VOTE_START, START + timedelta(hours=1))
+        await scheduler.cancel(2)
+        await scheduler.cancel(3, VOTE_START)
+        # Moving a deadline keeps only the new time
+        await scheduler.schedule(1, VOTE_END, START + timedelta(hours=4))
+        assert len(scheduler) == 1
+
+        await clock.advance(5 * 3600)
+        await scheduler.stop()
+        assert fired == [(START + timedelta(hours=4), 1, VOTE_END)]
+        assert await db.get_scheduled_events() == []
+
+    run_db(scenario)
+
+
+def test_reload_restores_pending_deadlines(run_db):
+    async def scenario(db):
+        await add_bills(db)
+        clock = VirtualClock(START)
+        first = make_scheduler(db, clock, [])
+        await first.schedule(1, VOTE_START, START + timedelta(hours=2))
+        await first.schedule(1, VOTE_END, START + timedelta(hours=5))
+        await first.schedule(2, VOTE_END, START + timedelta(hours=1))
+        await first.schedule(3, VOTE_END, START + timedelta(hours=1))
+        await first.cancel(3)
+
+        # A restart: a new scheduler finds the same deadlines, minus the cancelled one
+        fired = []
+        second = make_scheduler(db, clock, fired)
+        await second.load()
+        assert len(second) == 3
+        await clock.advance(3 * 3600)  # past two of them while "down"
+        second.start()
+        await clock.advance(3 * 3600)
+        await second.stop()
+        # Overdue deadlines fire first, oldest first, then the rest on time
+        assert [(bill_id, kind) for _, bill_id, kind in fired] == [(2, VOTE_END), (1, VOTE_START), (1, VOTE_END)]
+        assert fired[-1][0] == START + timedelta(hours=5)
+        assert await db.get_scheduled_events() == []
+
+    run_db(scenario)
@@ -0,0 +1,43 @@
+# tests/test_search.py
+from .conftest import GUILD_ID
+
+OTHER_GUILD = 2
+
+
+def test_search_proposals_and_laws(run_db):
+    async def scenario(db):
+        parks = await db.insert_proposal("Public parks", "Every district gets a café and a fountain.", 100, GUILD_ID)
+        roads = await db.insert_proposal("Road repairs", "Fix the potholes on Main Street.", 100, GUILD_ID)
+        await db.insert_proposal("Parking fees", "Parking costs more downtown.", 100, OTHER_GUILD)
+        law_id = await db.add_law_from_bill(parks)
+
+        # Every word must match, as a prefix; accents are ignored
+        assert [r["bill_id"] for r in await db.search_proposals("park", guild_id=GUILD_ID)] == [parks]
+        assert len(await db.search_proposals("park")) == 2
+        assert [r["bill_id"] for r in await db.search_proposals("cafe fount")] == [parks]
+        assert await db.search_proposals("pothole fountain") == []
+
+        laws = await db.search_laws("fountain", highlight=("[", "]"), guild_id=GUILD_ID)
+        assert [r["law_id"] for r in laws] == [law_id]
+        assert "[fountain]" in laws[0]["snippet"]
+        assert await db.search_laws("fountain", guild_id=OTHER_GUILD) == []
+
+        # User text is never FTS syntax
+        assert await db.search_proposals('" OR * NEAR(') == []
+        assert [r["bill_id"] for r in await db.search_proposals('road: -repairs')] == [roads]
+
+    run_db(scenario)
+
+
+def test_triggers_keep_the_index_in_sync(run_db):
+    async def scenario(db):
+        bill_id = await db.insert_proposal("Library hours", "Open on Sundays.", 100, GUILD_ID)
+        async with db._write() as conn:
+            await conn.execute("UPDATE proposals SET title = 'Museum hours' WHERE bill_id = ?", (bill_id,))
+        assert await db.search_proposals("library") == []
+        assert [r["bill_id"] for r in await db.search_proposals("museum")] == [bill_id]
+
+        assert await db.remove_bill(bill_id)
+        assert await db.search_proposals("museum") == []
+
+    run_db(scenario)
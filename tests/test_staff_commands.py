@@ -0,0 +1,46 @@
+# tests/test_staff_commands.py
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from discord import app_commands
+from discord.utils import maybe_coroutine
+
+from cogs.Governace.cog import Governance
+
+MODERATOR_ROLE_ID = 5
+
+
+def interaction(manage_guild=False, role_ids=()):
+    configs = SimpleNamespace(get=lambda guild_id: {"moderator_role_id": MODERATOR_ROLE_ID})
+    return SimpleNamespace(
+        guild_id=1,
+        permissions=SimpleNamespace(manage_guild=manage_guild),
+        user=SimpleNamespace(roles=[SimpleNamespace(id=role_id) for role_id in role_ids]),
+        client=SimpleNamespace(get_cog=lambda name: SimpleNamespace(guild_configs=configs)),
+    )
+
+
+def can_run(command, interaction) -> bool:
+    async def main():
+        return all([await maybe_coroutine(check, interaction) for check in command.checks])
+    return asyncio.run(main())
+
+
+STAFF_COMMANDS = [(Governance.vote_group, "start"), (Governance.vote_group, "end"), (Governance.vote_group, "race"),
+                  (Governance.staff_group, "veto"), (Governance.staff_group, "remove_bill")]
+
+
+@pytest.mark.parametrize("group, name", STAFF_COMMANDS)
+def test_staff_commands_allow_managers_and_moderators(group, name):
+    command = group.get_command(name)
+    assert can_run(command, interaction(manage_guild=True))
+    assert can_run(command, interaction(role_ids=(3, MODERATOR_ROLE_ID)))
+    with pytest.raises(app_commands.MissingPermissions):
+        can_run(command, interaction(role_ids=(3,)))
+
+
+def test_config_stays_with_managers():
+    command = Governance.config_group.get_command("roles")
+    with pytest.raises(app_commands.MissingPermissions):
+        can_run(command, interaction(role_ids=(MODERATOR_ROLE_ID,)))
@@ -0,0 +1,63 @@
+# tests/test_tally_engine.py
+import pytest
+
+from cogs.Governace.tally_engine import decode_ranking, encode_ranking, instant_runoff, tally, weighted_plurality
+
+
+def test_ranking_round_trip():
+    blob = encode_ranking([2, 0, 1])
+    assert len(blob) == 3
+    assert decode_ranking(blob) == [2, 0, 1]
+    with pytest.raises(ValueError):
+        encode_ranking([1, 1])
+
+
+def test_irv_first_round_majority():
+    result = instant_runoff([([0, 1], 3, 3), ([1, 0], 2, 2)], 2)
+    assert result.winner == 0
+    assert len(result.rounds) == 1
+    assert (result.ballots, result.total_weight) == (5, 5)
+
+
+def test_irv_transfers_eliminated_ballots():
+    # A leads on first preferences, but C's ballots go to B
+    groups = [([0], 4, 4), ([1, 0], 3, 3), ([2, 1], 2, 2)]
+    result = instant_runoff(groups, 3)
+    assert result.winner == 1
+    assert [r.eliminated for r in result.rounds] == [[2], []]
+    assert result.rounds[0].counts == {0: 4, 1: 3, 2: 2}
+    assert result.rounds[1].counts == {0: 4, 1: 5}
+
+
+def test_irv_exhausted_ballots():
+    groups = [([0], 2, 2), ([1], 2, 2), ([2], 1, 1), ([], 1, 1)]
+    result = instant_runoff(groups, 3)
+    assert result.rounds[0].exhausted == 1
+    assert result.rounds[0].eliminated == [2]
+    # C's ballot has no second choice, so A and B stay tied in every round; the higher index goes
+    assert result.rounds[1].exhausted == 2
+    assert result.rounds[1].eliminated == [1]
+    assert result.winner == 0
+    assert len(result.rounds) == 3
+
+
+def test_irv_without_ballots():
+    result = instant_runoff([], 3)
+    assert result.winner is None
+    assert result.ballots == 0
+
+
+def test_weighted_plurality():
+    result = weighted_plurality([([0, 1], 1, 1), ([1], 2.5, 1), ([0], 1, 1)], 2)
+    assert result.winner == 1
+    assert result.rounds[0].counts == {0: 2, 1: 2.5}
+    # A tie at the top has no winner
+    assert weighted_plurality([([0], 1, 1), ([1], 1, 1)], 2).winner is None
+
+
+def test_tally_counts_stored_blobs():
+    groups = [(encode_ranking([1, 0]), 2, 2), (encode_ranking([0]), 1, 1)]
+    assert tally("irv", groups, 2).winner == 1
+    assert tally("weighted", groups, 2).winner == 1
+    with pytest.raises(ValueError):
+        tally("borda", groups, 2)
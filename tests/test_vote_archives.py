@@ -0,0 +1,34 @@
+# tests/test_vote_archives.py
+from datetime import datetime, timedelta
+
+from .conftest import open_bill
+
+
+def test_compact_closed_bills(run_db):
+    async def scenario(db):
+        closed = await open_bill(db, "Closed")
+        voting = await open_bill(db, "Voting")
+        await db.record_votes([(30, closed, "yes"), (10, closed, "no"), (20, closed, "yes"), (40, voting, "yes")])
+        await db.close_bill(closed)
+        later = datetime.utcnow() + timedelta(days=2)
+
+        assert await db.get_compactable_bills(datetime.utcnow()) == []  # voting ended tomorrow
+        assert await db.get_compactable_bills(later) == [closed]
+        assert await db.compact_votes(closed) == 3
+        assert await db.compact_votes(closed) == 0
+        assert await db.get_compactable_bills(later) == []
+
+        # Individual rows are gone, but every voter's choice and the counts are still there
+        assert await db.get_archived_votes(closed) == {"yes": [20, 30], "no": [10], "abstain": []}
+        assert [await db.get_user_vote(user_id, closed) for user_id in (10, 20, 30, 40)] == ["no", "yes", "yes", None]
+        assert await db.count_votes(closed) == {"yes": 2, "no": 1, "abstain": 0}
+        assert await db.get_archived_votes(voting) is None
+
+        # Exports list archived votes last, without vote_id or created_at
+        rows = [row async for row in db.iter_export("votes")]
+        assert [(r["user_id"], r["vote_type"], r["vote_id"]) for r in rows[1:]] == [(20, "yes", None), (30, "yes", None),
+                                                                                     (10, "no", None)]
+        assert [r["user_id"] for r in rows if r["bill_id"] == voting] == [40]
+        assert [r["user_id"] async for r in db.iter_export("votes", since=datetime(2000, 1, 1))] == [40]
+
+    run_db(scenario)
@@ -0,0 +1,44 @@
+# tests/test_vote_queue.py
+import asyncio
+
+from cogs.Governace.db_manager import VOTE_CHANGED, VOTE_RECORDED, VOTE_UNCHANGED
+
+from .conftest import open_bill
+
+
+def test_queued_clicks_are_batched_and_answered(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        results = await asyncio.gather(*(db.submit_vote(user_id, bill_id, "yes") for user_id in range(50)))
+        assert results == [(VOTE_RECORDED, None)] * 50
+        # One user's clicks apply in the order they were queued
+        results = await asyncio.gather(db.submit_vote(1, bill_id, "no"), db.submit_vote(1, bill_id, "no"),
+                                       db.submit_vote(1, bill_id, "yes"))
+        assert results == [(VOTE_CHANGED, "yes"), (VOTE_UNCHANGED, "no"), (VOTE_CHANGED, "no")]
+        await db.vote_queue.stop()
+        assert await db.count_votes(bill_id) == {"yes": 50, "no": 0, "abstain": 0}
+
+    run_db(scenario)
+
+
+def test_submit_after_stop_writes_directly(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        await db.vote_queue.stop()
+        assert await db.submit_vote(1, bill_id, "yes") == (VOTE_RECORDED, None)
+        assert await db.get_user_vote(1, bill_id) == "yes"
+
+    run_db(scenario)
+
+
+def test_close_bill_counts_votes_still_in_the_queue(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        await db.open_tally(bill_id)
+        clicks = [asyncio.create_task(db.submit_vote(user_id, bill_id, "yes")) for user_id in range(20)]
+        await asyncio.sleep(0)  # queued, not yet written
+        _, counts, _ = await db.close_bill(bill_id)
+        assert counts["yes"] == 20
+        assert len(await asyncio.gather(*clicks)) == 20
+
+    run_db(scenario)
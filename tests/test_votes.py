@@ -0,0 +1,67 @@
+# tests/test_votes.py
+from cogs.Governace.db_manager import VOTE_CHANGED, VOTE_CLOSED, VOTE_RECORDED, VOTE_RETRACTED, VOTE_UNCHANGED
+
+from .conftest import open_bill
+
+
+async def audit_rows(db, bill_id):
+    async with db._read() as conn:
+        cursor = await conn.execute("SELECT user_id, old_type, new_type FROM vote_audit WHERE bill_id = ? ORDER BY audit_id",
+                                    (bill_id,))
+        return [tuple(row) for row in await cursor.fetchall()]
+
+
+def test_record_change_repeat_and_retract(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        assert await db.record_vote(1, bill_id, "yes") == (VOTE_RECORDED, None)
+        assert await db.record_vote(1, bill_id, "yes") == (VOTE_UNCHANGED, "yes")
+        assert await db.record_vote(1, bill_id, "no") == (VOTE_CHANGED, "yes")
+        assert await db.record_vote(2, bill_id, "abstain") == (VOTE_RECORDED, None)
+        assert await db.record_vote(2, bill_id, None) == (VOTE_RETRACTED, "abstain")
+        assert await db.record_vote(2, bill_id, None) == (VOTE_UNCHANGED, None)
+
+        assert await db.get_user_vote(1, bill_id) == "no"
+        assert await db.get_user_vote(2, bill_id) is None
+        assert await db.count_votes(bill_id) == {"yes": 0, "no": 1, "abstain": 0}
+        # Stored counters follow every change, not just first votes
+        prop = await db.get_proposal_by_id(bill_id)
+        assert (prop["yes_count"], prop["no_count"], prop["abstain_count"]) == (0, 1, 0)
+        assert await audit_rows(db, bill_id) == [(1, "yes", "no"), (2, "abstain", None)]
+
+    run_db(scenario)
+
+
+def test_batch_applies_repeat_clicks_in_order(run_db):
+    async def scenario(db):
+        bill_id = await open_bill(db)
+        results = await db.record_votes([(1, bill_id, "yes"), (2, bill_id, "no"), (1, bill_id, "no"),
+                                         (1, bill_id, None), (1, bill_id, "abstain")])
+        assert results == [(VOTE_RECORDED, None), (VOTE_RECORDED, None), (VOTE_CHANGED, "yes"),
+                           (VOTE_RETRACTED, "no"), (VOTE_RECORDED, None)]
+        assert await db.count_votes(bill_id) == {"yes": 0, "no": 1, "abstain": 1}
+
+    run_db(scenario)
+
+
+def test_clicks_on_bills_not_in_voting_change_nothing(run_db):
+    async def scenario(db):
+        closed = await open_bill(db, "Closed")
+        vetoed = await open_bill(db, "Vetoed")
+        voting = await open_bill(db, "Voting")
+        awaiting = await db.insert_proposal("Awaiting", "Text", 100, 1)
+        await db.record_votes([(1, closed, "yes"), (1, vetoed, "yes")])
+        await db.close_bill(closed)
+        await db.veto_bill(vetoed)
+
+        results = await db.record_votes([(1, closed, "no"), (1, vetoed, None), (2, awaiting, "yes"),
+                                         (2, 999, "yes"), (2, voting, "yes")])
+        assert results == [(VOTE_CLOSED, None)] * 4 + [(VOTE_RECORDED, None)]
+        assert await db.get_user_vote(1, closed) == "yes"
+        assert await db.get_user_vote(1, vetoed) == "yes"
+        assert await db.count_votes(awaiting) == {"yes": 0, "no": 0, "abstain": 0}
+        prop = await db.get_proposal_by_id(closed)
+        assert (prop["status"], prop["yes_count"], prop["no_count"]) == ("passed", 1, 0)
+        assert await audit_rows(db, closed) == []
+
+    run_db(scenario)